@@ -0,0 +1,249 @@
+"""
+Generate auto-built sequences in bulk, without opening the app.
+
+Sequences are written one per line as JSON, in the same format as
+current_sequence.json, and structural duplicates (same moves, ignoring turns
+and orientations) are dropped.
+
+Example:
+    python batch_auto_builder.py --count 200 --length 16 --level 2 \\
+        --mode circular --rotation-type quartered --output practice.jsonl
+"""
+
+import argparse
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional
+
+from Enums.letters import LetterType
+from data.constants import BOX, DIAMOND
+from main_window.main_widget.dictionary_metadata_index import (
+    DictionaryMetadataIndex,
+)
+from main_window.main_widget.json_manager.json_ori_calculator import (
+    JsonOriCalculator,
+)
+from main_window.main_widget.pcitograph_dict_loader import PictographDictLoader
+from main_window.main_widget.sequence_level_evaluator import SequenceLevelEvaluator
+from main_window.main_widget.top_builder_widget.sequence_builder.auto_builder.sequence_generator import (
+    DeadEndError,
+    SequenceGenerator,
+)
+from main_window.main_widget.top_builder_widget.sequence_widget.add_to_dictionary_manager.structural_variation_checker import (
+    StructuralVariationChecker,
+)
+from utilities.path_helpers import get_images_and_data_path
+from utilities.word_simplifier import WordSimplifier
+
+CHUNK_SIZE = 50
+MAX_ATTEMPTS_PER_SEQUENCE = 20
+
+_generator: Optional[SequenceGenerator] = None
+
+
+def _init_worker() -> None:
+    global _generator
+    dict_loader = PictographDictLoader(None)
+    dict_loader.load_all_pictograph_dicts()
+    _generator = SequenceGenerator(dict_loader, JsonOriCalculator())
+
+
+def _generate_chunk(options: dict, count: int, seed: int) -> list[list[dict]]:
+    """Worker entry point: build `count` sequences with the given options."""
+    random.seed(seed)
+    letter_types = [LetterType[name] for name in options["letter_types"]]
+    sequences = []
+    for _ in range(count):
+        start_position_key = _generator.choose_start_position_key(
+            options["grid_mode"]
+        )
+        sequence = [
+            _build_header(options),
+            _generator.create_start_position_entry(start_position_key),
+        ]
+        try:
+            if options["mode"] == "freeform":
+                _generator.build_freeform_sequence(
+                    sequence,
+                    options["length"],
+                    options["turn_intensity"],
+                    options["level"],
+                    options["continuous_rot_dir"],
+                    letter_types,
+                )
+            else:
+                _generator.build_circular_sequence(
+                    sequence,
+                    options["length"],
+                    options["turn_intensity"],
+                    options["level"],
+                    options["rotation_type"],
+                    options["permutation_type"],
+                    options["continuous_rot_dir"],
+                    letter_types,
+                )
+        except DeadEndError:
+            # No option could close the word or match the filters.
+            continue
+        if options["mode"] == "circular" and not _returns_to_start(sequence):
+            continue
+        _finish_header(sequence)
+        sequences.append(sequence)
+    return sequences
+
+
+def _returns_to_start(sequence: list[dict]) -> bool:
+    beats = [beat for beat in sequence[2:] if not beat.get("is_placeholder", False)]
+    return bool(beats) and beats[-1]["end_pos"] == sequence[1]["end_pos"]
+
+
+def _build_header(options: dict) -> dict:
+    return {
+        "word": "",
+        "author": options["author"],
+        "level": 0,
+        "prop_type": options["prop_type"],
+        "grid_mode": options["grid_mode"],
+        "is_circular": options["mode"] == "circular",
+        "is_permutable": False,
+        "is_strictly_rotated_permutation": False,
+        "is_strictly_mirrored_permutation": False,
+        "is_strictly_colorswapped_permutation": False,
+        "is_mirrored_color_swapped_permutation": False,
+        "is_rotated_colorswapped_permutation": False,
+    }
+
+
+def _finish_header(sequence: list[dict]) -> None:
+    word = "".join(beat["letter"] for beat in sequence[2:] if "letter" in beat)
+    sequence[0]["word"] = WordSimplifier.simplify_repeated_word(word)
+    sequence[0]["level"] = SequenceLevelEvaluator().get_sequence_difficulty_level(
+        sequence
+    )
+
+
+def load_dictionary_structural_hashes(dictionary_dir: str) -> set[str]:
+    """
+    Collect the structural hashes of every sequence already saved in the
+    dictionary, reusing the ones stored in the app's dictionary index.
+    """
+    dictionary_dir = os.path.normpath(dictionary_dir)
+    file_stats = {}
+    for root, _, files in os.walk(dictionary_dir):
+        for filename in files:
+            if filename.lower().endswith(".png"):
+                path = os.path.join(root, filename)
+                stat = os.stat(path)
+                file_stats[path] = (stat.st_mtime_ns, stat.st_size)
+    return DictionaryMetadataIndex(None).get_structural_hashes(
+        dictionary_dir, file_stats
+    )
+
+
+def build_batch(options: dict, count: int, workers: int, seed: Optional[int]) -> list:
+    seen = set()
+    if options["skip_existing"]:
+        seen = load_dictionary_structural_hashes(
+            get_images_and_data_path("dictionary")
+        )
+
+    # Build the pictograph cache once up front so the workers only ever read it.
+    PictographDictLoader(None).load_all_pictograph_dicts()
+
+    seed_source = random.Random(seed)
+    max_attempts = count * MAX_ATTEMPTS_PER_SEQUENCE
+    attempts = 0
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        while len(results) < count and attempts < max_attempts:
+            remaining_chunks = -(-(count - len(results)) // CHUNK_SIZE)
+            futures = [
+                pool.submit(
+                    _generate_chunk, options, CHUNK_SIZE, seed_source.getrandbits(64)
+                )
+                for _ in range(min(remaining_chunks, workers * 2))
+            ]
+            attempts += len(futures) * CHUNK_SIZE
+            for future in as_completed(futures):
+                for sequence in future.result():
+                    structural_hash = StructuralVariationChecker.get_structural_hash(
+                        sequence
+                    )
+                    if structural_hash in seen or len(results) >= count:
+                        continue
+                    seen.add(structural_hash)
+                    results.append(sequence)
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate sequences in bulk.")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--length", type=int, default=16)
+    parser.add_argument("--level", type=int, choices=[1, 2, 3], default=1)
+    parser.add_argument("--turn-intensity", type=float, default=1.0)
+    parser.add_argument("--mode", choices=["freeform", "circular"], default="freeform")
+    parser.add_argument(
+        "--rotation-type", choices=["quartered", "halved"], default="quartered"
+    )
+    parser.add_argument(
+        "--permutation-type", choices=["rotated", "mirrored"], default="rotated"
+    )
+    parser.add_argument(
+        "--letter-types",
+        nargs="+",
+        choices=[letter_type.name for letter_type in LetterType],
+        default=[letter_type.name for letter_type in LetterType],
+    )
+    parser.add_argument("--continuous-rot-dir", action="store_true")
+    parser.add_argument("--grid-mode", choices=[DIAMOND, BOX], default=DIAMOND)
+    parser.add_argument("--prop-type", default="staff")
+    parser.add_argument("--author", default="batch_auto_builder")
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Also drop sequences that are structural variations of dictionary entries.",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default="auto_built_sequences.jsonl")
+    args = parser.parse_args()
+    if (
+        args.mode == "circular"
+        and args.permutation_type == "mirrored"
+        and args.grid_mode == BOX
+    ):
+        parser.error("mirrored circular sequences are only supported in diamond mode")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    options = {
+        "mode": args.mode,
+        "length": args.length,
+        "level": args.level,
+        "turn_intensity": args.turn_intensity,
+        "rotation_type": args.rotation_type,
+        "permutation_type": args.permutation_type,
+        "letter_types": args.letter_types,
+        "continuous_rot_dir": args.continuous_rot_dir,
+        "grid_mode": args.grid_mode,
+        "prop_type": args.prop_type,
+        "author": args.author,
+        "skip_existing": args.skip_existing,
+    }
+    sequences = build_batch(options, args.count, args.workers, args.seed)
+
+    with open(args.output, "w", encoding="utf-8") as output:
+        for sequence in sequences:
+            output.write(json.dumps(sequence, ensure_ascii=False))
+            output.write("\n")
+
+    print(f"Wrote {len(sequences)} of {args.count} requested sequences to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
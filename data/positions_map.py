@@ -1,4 +1,3 @@
-from objects.motion.motion import Motion
 from data.constants import *
 
 
@@ -12,6 +12,7 @@ class DualFloatLetterDeterminer:
     def __init__(self, letter_engine: "LetterDeterminer"):
         self.main_widget = letter_engine.main_widget
         self.letters = letter_engine.letters
+        self.attribute_index = letter_engine.attribute_index
 
     def determine_letter(self, motion: "Motion") -> Letter:
         """Handle the motion attributes for dual float motions."""
@@ -56,25 +57,18 @@ class DualFloatLetterDeterminer:
         return COUNTER_CLOCKWISE if rotation_direction == CLOCKWISE else CLOCKWISE
 
     def _find_matching_letter(self, motion: "Motion") -> Letter:
-        for letter, examples in self.letters.items():
-            for example in examples:
-                if self._compare_motion_attributes(motion, example):
-                    return letter
-        return None
-
-    def _compare_motion_attributes(self, motion: "Motion", example) -> bool:
         other_motion = motion.pictograph.get.other_motion(motion)
-        return (
-            example[f"{motion.color}_attributes"]["start_loc"] == motion.start_loc
-            and example[f"{motion.color}_attributes"]["end_loc"] == motion.end_loc
-            and example[f"{motion.color}_attributes"]["prop_rot_dir"]
-            == motion.prefloat_prop_rot_dir
-            and example[f"{other_motion.color}_attributes"]["start_loc"]
-            == other_motion.start_loc
-            and example[f"{other_motion.color}_attributes"]["end_loc"]
-            == other_motion.end_loc
-            and example[f"{other_motion.color}_attributes"]["prop_rot_dir"]
-            == self.main_widget.json_manager.loader_saver.get_prefloat_prop_rot_dir_from_json(
-                self._get_json_index_for_current_beat(), other_motion.color
-            )
+        return self.attribute_index.find(
+            {
+                (motion.color, "start_loc"): (motion.start_loc,),
+                (motion.color, "end_loc"): (motion.end_loc,),
+                (motion.color, "prop_rot_dir"): (motion.prefloat_prop_rot_dir,),
+                (other_motion.color, "start_loc"): (other_motion.start_loc,),
+                (other_motion.color, "end_loc"): (other_motion.end_loc,),
+                (other_motion.color, "prop_rot_dir"): (
+                    self.main_widget.json_manager.loader_saver.get_prefloat_prop_rot_dir_from_json(
+                        self._get_json_index_for_current_beat(), other_motion.color
+                    ),
+                ),
+            }
         )
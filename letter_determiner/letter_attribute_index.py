@@ -0,0 +1,52 @@
+from itertools import product
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from Enums.letters import Letter
+
+if TYPE_CHECKING:
+    from main_window.main_widget.pictograph_record import PictographRecord
+
+# A query names the (color, attribute) pairs to match and the values each may take.
+AttributeQuery = dict[tuple[str, str], Iterable[str]]
+
+
+class LetterAttributeIndex:
+    """
+    Finds the letter whose example pictograph matches a set of motion attributes.
+
+    Each combination of compared attributes gets its own dict, from the
+    attribute values to the first matching letter, built the first time it's
+    queried. Matching is the same as scanning every example in order and
+    returning the first match: when a query allows several values, every
+    combination is looked up and the earliest example wins.
+    """
+
+    def __init__(self, pictograph_dicts: dict[Letter, tuple["PictographRecord", ...]]):
+        self.pictograph_dicts = pictograph_dicts
+        self.indexes: dict[tuple, dict[tuple, tuple[int, Letter]]] = {}
+
+    def find(self, query: AttributeQuery) -> Optional[Letter]:
+        fields = tuple(sorted(query))
+        index = self._get_index(fields)
+        matches = [
+            index[values]
+            for values in product(*(set(query[field]) for field in fields))
+            if values in index
+        ]
+        return min(matches, key=lambda match: match[0])[1] if matches else None
+
+    def _get_index(self, fields: tuple) -> dict[tuple, tuple[int, Letter]]:
+        index = self.indexes.get(fields)
+        if index is None:
+            index = {}
+            rank = 0
+            for letter, examples in self.pictograph_dicts.items():
+                for example in examples:
+                    values = tuple(
+                        example[f"{color}_attributes"][attribute]
+                        for color, attribute in fields
+                    )
+                    index.setdefault(values, (rank, letter))
+                    rank += 1
+            self.indexes[fields] = index
+        return index
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 from Enums.letters import Letter, LetterConditions, LetterType
 from data.constants import ANTI, COUNTER_CLOCKWISE, DASH, FLOAT, PRO, CLOCKWISE, STATIC
 from .dual_float_letter_determiner import DualFloatLetterDeterminer
+from .letter_attribute_index import LetterAttributeIndex
 from .non_hybrid_letter_determiner import NonHybridShiftLetterDeterminer
 from objects.motion.managers.motion_ori_calculator import MotionOriCalculator
 from objects.motion.motion import Motion
@@ -14,6 +15,7 @@ class LetterDeterminer:
     def __init__(self, main_widget: "MainWidget") -> None:
         self.main_widget = main_widget
         self.letters = self.main_widget.pictograph_dicts
+        self.attribute_index = LetterAttributeIndex(self.letters)
         self.non_hybrid_shift_letter_determiner = NonHybridShiftLetterDeterminer(self)
         self.dual_float_letter_determiner = DualFloatLetterDeterminer(self)
         self.beat_frame = None
@@ -72,129 +74,43 @@ class LetterDeterminer:
 
     def find_letter_based_on_attributes(self, motion: "Motion") -> str:
         """Find the letter in the dictionary that matches the given attributes for both blue and red motions."""
-        # Get the other motion (opposite color)
         other_motion = motion.pictograph.get.other_motion(motion)
         letter_type = motion.pictograph.letter.get_letter_type()
-        original_letter = motion.pictograph.letter
-        for letter, examples in self.letters.items():
-
-            if letter_type == LetterType.Type1:
-                for example in examples:
-                    if self.compare_motion_attributes_for_type1(
-                        motion, other_motion, example
-                    ):
-                        return letter
-            elif letter_type in [LetterType.Type2, LetterType.Type3]:
-                for example in examples:
-                    if self.compare_motion_attributes_for_type2_3(motion, example):
-                        return letter
-            else:
-                return original_letter
-        return None
-
-    def compare_motion_attributes_for_type1(
-        self, motion: "Motion", other_motion: "Motion", example
-    ):
-        motion_attributes_match_example = (
-            self.is_shift_motion_type_matching(motion, example)
-            and example[f"{motion.color}_attributes"]["start_loc"] == motion.start_loc
-            and example[f"{motion.color}_attributes"]["end_loc"] == motion.end_loc
-            and self._is_shift_prop_rot_dir_matching(motion, example)
-            and self.is_shift_motion_type_matching(other_motion, example)
-            and example[f"{other_motion.color}_attributes"]["start_loc"]
-            == other_motion.start_loc
-            and example[f"{other_motion.color}_attributes"]["end_loc"]
-            == other_motion.end_loc
-            and self._is_shift_prop_rot_dir_matching(other_motion, example)
-        )
-
-        return motion_attributes_match_example
-
-    def _is_shift_prop_rot_dir_matching(self, motion: "Motion", example):
-        is_rot_dir_matching = (
-            example[f"{motion.color}_attributes"]["prop_rot_dir"]
-            == self.main_widget.json_manager.loader_saver.get_prefloat_prop_rot_dir_from_json(
+        if letter_type == LetterType.Type1:
+            query = {
+                **self.get_shift_query(motion),
+                **self.get_shift_query(other_motion),
+            }
+        elif letter_type in [LetterType.Type2, LetterType.Type3]:
+            shift = motion.pictograph.get.shift()
+            non_shift = motion.pictograph.get.other_motion(shift)
+            query = {
+                **self.get_shift_query(shift),
+                (non_shift.color, "motion_type"): (non_shift.motion_type,),
+                (non_shift.color, "start_loc"): (non_shift.start_loc,),
+                (non_shift.color, "end_loc"): (non_shift.end_loc,),
+            }
+        else:
+            return motion.pictograph.letter if self.letters else None
+        return self.attribute_index.find(query)
+
+    def get_shift_query(self, motion: "Motion") -> dict:
+        """Attribute values a shift may match: its current or prefloat motion type and prop rot dir."""
+        prefloat_prop_rot_dir = (
+            self.main_widget.json_manager.loader_saver.get_prefloat_prop_rot_dir_from_json(
                 self.beat_frame.get.index_of_currently_selected_beat() + 2,
                 motion.color,
             )
-            or example[f"{motion.color}_attributes"]["prop_rot_dir"] == motion.prop_rot_dir
         )
-
-        return is_rot_dir_matching
-
-    def compare_motion_attributes_for_type1_hybrids_with_one_float(
-        self, motion: "Motion", example
-    ):
-        float_motion = motion.pictograph.get.float_motion()
-        non_float_motion = float_motion.pictograph.get.other_motion(float_motion)
-        motion_attributes_match_example = (
-            self.is_shift_motion_type_matching(float_motion, example)
-            and example[f"{float_motion.color}_attributes"]["start_loc"]
-            == float_motion.start_loc
-            and example[f"{float_motion.color}_attributes"]["end_loc"]
-            == float_motion.end_loc
-            and example[f"{float_motion.color}_attributes"]["prop_rot_dir"]
-            == self.main_widget.json_manager.loader_saver.get_prefloat_prop_rot_dir_from_json(
-                self.beat_frame.get.index_of_currently_selected_beat() + 2,
-                float_motion.color,
-            )
-            and self.is_shift_motion_type_matching(non_float_motion, example)
-            and example[f"{non_float_motion.color}_attributes"]["start_loc"]
-            == non_float_motion.start_loc
-            and example[f"{non_float_motion.color}_attributes"]["end_loc"]
-            == non_float_motion.end_loc
-            and example[f"{non_float_motion.color}_attributes"]["prop_rot_dir"]
-            == non_float_motion.prop_rot_dir
-        )
-
-        return motion_attributes_match_example
-
-    def compare_motion_attributes_for_type1_nonhybrids_with_one_float(
-        self, float_motion: "Motion", example
-    ):
-        non_float_motion = float_motion.pictograph.get.other_motion(float_motion)
-        motion_attributes_match_example = (
-            self.is_shift_motion_type_matching(float_motion, example)
-            and example[f"{float_motion.color}_attributes"]["start_loc"]
-            == float_motion.start_loc
-            and example[f"{float_motion.color}_attributes"]["end_loc"]
-            == float_motion.end_loc
-            and example[f"{float_motion.color}_attributes"]["prop_rot_dir"]
-            == self.main_widget.json_manager.loader_saver.get_prefloat_prop_rot_dir_from_json(
-                self.beat_frame.get.index_of_currently_selected_beat() + 2,
-                float_motion.color,
-            )
-            and self.is_shift_motion_type_matching(non_float_motion, example)
-            and example[f"{non_float_motion.color}_attributes"]["start_loc"]
-            == non_float_motion.start_loc
-            and example[f"{non_float_motion.color}_attributes"]["end_loc"]
-            == non_float_motion.end_loc
-            and example[f"{non_float_motion.color}_attributes"]["prop_rot_dir"]
-            == non_float_motion.prop_rot_dir
-        )
-
-        return motion_attributes_match_example
-
-    def compare_motion_attributes_for_type2_3(self, motion: "Motion", example):
-        shift = motion.pictograph.get.shift()
-        non_shift = motion.pictograph.get.other_motion(shift)
-        motion_attributes_match_example = (
-            self.is_shift_motion_type_matching(shift, example)
-            and example[f"{shift.color}_attributes"]["start_loc"] == shift.start_loc
-            and example[f"{shift.color}_attributes"]["end_loc"] == shift.end_loc
-            and self._is_shift_prop_rot_dir_matching(shift, example)
-            and example[f"{non_shift.color}_attributes"]["motion_type"] == non_shift.motion_type
-            and example[f"{non_shift.color}_attributes"]["start_loc"] == non_shift.start_loc
-            and example[f"{non_shift.color}_attributes"]["end_loc"] == non_shift.end_loc
-        )
-
-        return motion_attributes_match_example
-
-    def is_shift_motion_type_matching(self, motion: "Motion", example):
-        is_matching_motion_type = (
-            example[f"{motion.color}_attributes"]["motion_type"] == motion.motion_type
-            or example[f"{motion.color}_attributes"]["motion_type"]
-            == motion.prefloat_motion_type
-        )
-
-        return is_matching_motion_type
+        return {
+            (motion.color, "motion_type"): (
+                motion.motion_type,
+                motion.prefloat_motion_type,
+            ),
+            (motion.color, "start_loc"): (motion.start_loc,),
+            (motion.color, "end_loc"): (motion.end_loc,),
+            (motion.color, "prop_rot_dir"): (
+                prefloat_prop_rot_dir,
+                motion.prop_rot_dir,
+            ),
+        }
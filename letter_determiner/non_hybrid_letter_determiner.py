@@ -18,6 +18,7 @@ class NonHybridShiftLetterDeterminer:
     def __init__(self, letter_engine: "LetterDeterminer"):
         self.main_widget = letter_engine.main_widget
         self.letters = letter_engine.letters
+        self.attribute_index = letter_engine.attribute_index
 
     def determine_letter(
         self, motion: "Motion", new_motion_type: str, swap_prop_rot_dir: bool
@@ -94,57 +95,28 @@ class NonHybridShiftLetterDeterminer:
 
     def _find_matching_letter(self, motion: "Motion") -> Letter:
         """Find and return the letter that matches the motion attributes."""
-        for letter, examples in self.letters.items():
-            for example in examples:
-                if self._compare_motion_attributes(motion, example):
-                    return letter
-        return None
-
-    def _compare_motion_attributes(self, motion: "Motion", example) -> bool:
-        """Compare the motion attributes with the example to find a match."""
         float_motion = motion.pictograph.get.float_motion()
         non_float_motion = float_motion.pictograph.get.other_motion(float_motion)
-
-        does_example_match = (
-            self._is_shift_motion_type_matching(float_motion, example)
-            and example[f"{float_motion.color}_attributes"]["start_loc"]
-            == float_motion.start_loc
-            and example[f"{float_motion.color}_attributes"]["end_loc"]
-            == float_motion.end_loc
-            and self._is_shift_prop_rot_dir_matching(float_motion, example)
-            and self._is_shift_motion_type_matching(non_float_motion, example)
-            and example[f"{non_float_motion.color}_attributes"]["start_loc"]
-            == non_float_motion.start_loc
-            and example[f"{non_float_motion.color}_attributes"]["end_loc"]
-            == non_float_motion.end_loc
-            and self._is_shift_prop_rot_dir_matching(non_float_motion, example)
-        )
-
-        return does_example_match
-
-    def _is_shift_prop_rot_dir_matching(self, motion: "Motion", example):
-        is_rot_dir_matching = example[f"{motion.color}_attributes"][
-            "prop_rot_dir"
-        ] == self.main_widget.json_manager.loader_saver.get_prefloat_prop_rot_dir_from_json(
-            self.main_widget.top_builder_widget.sequence_widget.beat_frame.get.index_of_currently_selected_beat()
-            + 2,
-            motion.color,
-        ) or example[
-            f"{motion.color}_attributes"
-        ][
-            "prop_rot_dir"
-        ] == self.main_widget.json_manager.loader_saver.get_prop_rot_dir_from_json(
-            self.main_widget.top_builder_widget.sequence_widget.beat_frame.get.index_of_currently_selected_beat()
-            + 2,
-            motion.color,
+        return self.attribute_index.find(
+            {
+                **self._get_shift_query(float_motion),
+                **self._get_shift_query(non_float_motion),
+            }
         )
 
-        return is_rot_dir_matching
-
-    def _is_shift_motion_type_matching(self, motion: "Motion", example) -> bool:
-        """Check if the motion type matches."""
-        return (
-            example[f"{motion.color}_attributes"]["motion_type"] == motion.motion_type
-            or example[f"{motion.color}_attributes"]["motion_type"]
-            == motion.prefloat_motion_type
-        )
+    def _get_shift_query(self, motion: "Motion") -> dict:
+        """Match either motion type, and the prop rot dir or prefloat one saved in the JSON."""
+        json_index = self._get_json_index_for_current_beat()
+        loader_saver = self.main_widget.json_manager.loader_saver
+        return {
+            (motion.color, "motion_type"): (
+                motion.motion_type,
+                motion.prefloat_motion_type,
+            ),
+            (motion.color, "start_loc"): (motion.start_loc,),
+            (motion.color, "end_loc"): (motion.end_loc,),
+            (motion.color, "prop_rot_dir"): (
+                loader_saver.get_prefloat_prop_rot_dir_from_json(json_index, motion.color),
+                loader_saver.get_prop_rot_dir_from_json(json_index, motion.color),
+            ),
+        }
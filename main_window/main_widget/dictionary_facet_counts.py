@@ -0,0 +1,65 @@
+from collections import Counter
+from typing import TYPE_CHECKING, Hashable, Iterator, Optional
+
+from main_window.main_widget.dictionary_letter_index import tokenize_word
+
+if TYPE_CHECKING:
+    from main_window.main_widget.dictionary_metadata_index import (
+        DictionaryWordRecord,
+    )
+
+LENGTH = "length"
+LEVEL = "level"
+AUTHOR = "author"
+START_POSITION = "start_position"
+GRID_MODE = "grid_mode"
+STARTING_LETTER = "starting_letter"
+FACETS = (LENGTH, LEVEL, AUTHOR, START_POSITION, GRID_MODE, STARTING_LETTER)
+
+
+class DictionaryFacetCounts:
+    """
+    Number of dictionary words per value of each filter facet.
+
+    The metadata index adds and removes word records here as they change, so
+    the counts stay current without ever walking the whole dictionary again.
+    Words with no value for a facet aren't counted under it.
+    """
+
+    def __init__(self) -> None:
+        self.counts: dict[str, Counter] = {facet: Counter() for facet in FACETS}
+
+    def add(self, record: "DictionaryWordRecord") -> None:
+        for facet, value in self._get_values(record):
+            self.counts[facet][value] += 1
+
+    def remove(self, record: "DictionaryWordRecord") -> None:
+        for facet, value in self._get_values(record):
+            counter = self.counts[facet]
+            counter[value] -= 1
+            if counter[value] <= 0:
+                del counter[value]
+
+    def clear(self) -> None:
+        for counter in self.counts.values():
+            counter.clear()
+
+    def get(self, facet: str) -> dict[Hashable, int]:
+        return dict(self.counts[facet])
+
+    @staticmethod
+    def _get_values(
+        record: "DictionaryWordRecord",
+    ) -> Iterator[tuple[str, Optional[Hashable]]]:
+        tokens = tokenize_word(record.word)
+        values = {
+            LENGTH: record.length,
+            LEVEL: record.level,
+            AUTHOR: record.author,
+            START_POSITION: record.start_position,
+            GRID_MODE: record.grid_mode,
+            STARTING_LETTER: tokens[0] if tokens else None,
+        }
+        for facet, value in values.items():
+            if value is not None and value != "":
+                yield facet, value
@@ -0,0 +1,64 @@
+from typing import Iterable
+
+
+def tokenize_word(word: str) -> list[str]:
+    """Split a word into letters, keeping dash letters like "X-" or "Φ-" as one token."""
+    tokens = []
+    index = 0
+    while index < len(word):
+        if index + 1 < len(word) and word[index + 1] == "-":
+            tokens.append(word[index : index + 2])
+            index += 2
+        else:
+            tokens.append(word[index])
+            index += 1
+    return tokens
+
+
+class DictionaryLetterIndex:
+    """
+    Inverted index from letters to the dictionary words that use them.
+
+    Letter filters become set lookups instead of a pass over every word. The
+    index belongs to the GUI thread; filters that run in the background take a
+    snapshot of the matching words before they start.
+    """
+
+    def __init__(self) -> None:
+        self.words_by_letter: dict[str, set[str]] = {}
+        self.words_by_first_letter: dict[str, set[str]] = {}
+
+    def add_word(self, word: str) -> None:
+        tokens = tokenize_word(word)
+        if not tokens:
+            return
+        for token in set(tokens):
+            self.words_by_letter.setdefault(token, set()).add(word)
+        self.words_by_first_letter.setdefault(tokens[0], set()).add(word)
+
+    def remove_word(self, word: str) -> None:
+        tokens = tokenize_word(word)
+        if not tokens:
+            return
+        for token in set(tokens):
+            self._discard(self.words_by_letter, token, word)
+        self._discard(self.words_by_first_letter, tokens[0], word)
+
+    @staticmethod
+    def _discard(index: dict[str, set[str]], letter: str, word: str) -> None:
+        words = index.get(letter)
+        if words is not None:
+            words.discard(word)
+            if not words:
+                del index[letter]
+
+    ### QUERIES ###
+
+    def containing(self, letter: str) -> set[str]:
+        return self.words_by_letter.get(letter, set())
+
+    def containing_any(self, letters: Iterable[str]) -> set[str]:
+        return set().union(*(self.containing(letter) for letter in letters))
+
+    def starting_with(self, letter: str) -> set[str]:
+        return self.words_by_first_letter.get(letter, set())
@@ -0,0 +1,389 @@
+import json
+import logging
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from main_window.main_widget.dictionary_facet_counts import DictionaryFacetCounts
+from main_window.main_widget.dictionary_letter_index import DictionaryLetterIndex
+from main_window.main_widget.top_builder_widget.sequence_widget.add_to_dictionary_manager.structural_variation_checker import (
+    StructuralVariationChecker,
+)
+from utilities.path_helpers import get_user_editable_resource_path
+from utilities.png_text_chunks import read_text_chunk_bulk
+
+if TYPE_CHECKING:
+    from main_window.main_widget.main_widget import MainWidget
+
+
+@dataclass
+class DictionaryWordRecord:
+    """Everything the Browse tab needs to know about one dictionary word."""
+
+    word: str
+    thumbnails: list[str]
+    length: Optional[int] = None
+    level: Optional[int] = None
+    author: Optional[str] = None
+    start_position: Optional[str] = None
+    grid_mode: Optional[str] = None
+    is_favorite: bool = False
+    date_added: datetime = datetime.min
+    letters: list[str] = field(default_factory=list)
+    # Browser section label per sort method, filled in lazily by SectionManager.
+    section_labels: dict[str, str] = field(default_factory=dict, compare=False)
+
+    def as_display_tuple(self) -> tuple[str, list[str], Optional[int]]:
+        return self.word, self.thumbnails, self.length
+
+
+class DictionaryMetadataIndex:
+    """
+    On-disk SQLite index of the metadata stored in each dictionary thumbnail.
+
+    Rows are keyed by thumbnail path and tagged with the file's mtime and size,
+    so a refresh only opens the PNGs that were added or changed since the last
+    time the index was brought up to date.
+    """
+
+    SCHEMA_VERSION = 2
+
+    def __init__(self, main_widget: "MainWidget") -> None:
+        self.main_widget = main_widget
+        self.logger = logging.getLogger(__name__)
+        self.db_path = get_user_editable_resource_path("dictionary_index.db")
+        self.word_thumbnails: dict[str, list[str]] = {}
+        self.scanned_generation = -1
+        self.unindexed: dict[str, tuple[str, tuple[int, int]]] = {}
+        self.records: dict[str, DictionaryWordRecord] = {}
+        # Words whose record has to be rebuilt before the next query.
+        self.dirty_words: set[str] = set()
+        self.letter_index = DictionaryLetterIndex()
+        self.facet_counts = DictionaryFacetCounts()
+
+        self.connection = sqlite3.connect(self.db_path)
+        self.connection.row_factory = sqlite3.Row
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        (version,) = self.connection.execute("PRAGMA user_version").fetchone()
+        with self.connection:
+            if version != self.SCHEMA_VERSION:
+                self.connection.execute("DROP TABLE IF EXISTS variations")
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS variations (
+                    path TEXT PRIMARY KEY,
+                    word TEXT NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    length INTEGER,
+                    level INTEGER,
+                    author TEXT,
+                    start_position TEXT,
+                    grid_mode TEXT,
+                    is_favorite INTEGER NOT NULL DEFAULT 0,
+                    date_added TEXT,
+                    letters TEXT,
+                    structural_hash TEXT
+                )
+                """
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS variations_word ON variations (word)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS variations_structural_hash "
+                "ON variations (structural_hash)"
+            )
+            self.connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    ### REFRESH ###
+
+    def refresh(self) -> None:
+        """Bring the index in line with the dictionary folder, re-reading only new or changed files."""
+        unindexed = self.get_unindexed_paths()
+        if unindexed:
+            self.store_rows(self.read_rows(unindexed))
+
+    def get_unindexed_paths(self) -> dict[str, tuple[str, tuple[int, int]]]:
+        """
+        Sync with the scanner and return path -> (word, (mtime_ns, size)) for
+        every thumbnail whose metadata still has to be read. Only file stats
+        are compared here; thumbnails that are gone are dropped right away.
+        """
+        scanner = self.main_widget.dictionary_scanner
+        scanner.update()
+        if scanner.generation == self.scanned_generation:
+            return dict(self.unindexed)
+        self.scanned_generation = scanner.generation
+        word_thumbnails = scanner.get_word_thumbnails()
+        self.dirty_words.update(
+            word
+            for word in word_thumbnails.keys() | self.word_thumbnails.keys()
+            if word_thumbnails.get(word) != self.word_thumbnails.get(word)
+        )
+        self.word_thumbnails = word_thumbnails
+        file_stats = scanner.get_file_stats()
+
+        known = {
+            row["path"]: (row["mtime_ns"], row["size"])
+            for row in self.connection.execute(
+                "SELECT path, mtime_ns, size FROM variations"
+            )
+        }
+
+        self.unindexed = {}
+        for word, thumbnails in self.word_thumbnails.items():
+            for path in thumbnails:
+                if known.get(path) != file_stats[path]:
+                    self.unindexed[path] = (word, file_stats[path])
+
+        removed = [(path,) for path in known.keys() - file_stats.keys()]
+        if removed:
+            with self.connection:
+                self.connection.executemany(
+                    "DELETE FROM variations WHERE path = ?", removed
+                )
+        return dict(self.unindexed)
+
+    def read_rows(
+        self, unindexed: dict[str, tuple[str, tuple[int, int]]]
+    ) -> list[tuple]:
+        """Read and parse the metadata of these thumbnails. Only touches files, so it's safe off the GUI thread."""
+        texts = read_text_chunk_bulk(unindexed, "metadata")
+        return [
+            self._build_row(word, path, stat, texts[path])
+            for path, (word, stat) in unindexed.items()
+        ]
+
+    def store_rows(self, rows: list[tuple]) -> None:
+        with self.connection:
+            self.connection.executemany(
+                """
+                INSERT OR REPLACE INTO variations (
+                    path, word, mtime_ns, size, length, level, author,
+                    start_position, grid_mode, is_favorite, date_added, letters,
+                    structural_hash
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+        for path, word, mtime_ns, size, *_ in rows:
+            self.dirty_words.add(word)
+            # A row read before the file changed again doesn't count.
+            if self.unindexed.get(path, (None, None))[1] == (mtime_ns, size):
+                del self.unindexed[path]
+
+    def get_structural_hashes(
+        self, dictionary_dir: str, file_stats: dict[str, tuple[int, int]]
+    ) -> set[str]:
+        """
+        Return the structural hash of every one of these thumbnails. Stored
+        hashes are used when the file's stats still match; only thumbnails that
+        are new or changed are read, and their rows are stored for next time.
+        Doesn't touch the scanner, so it also works without the app running.
+        """
+        known = {
+            row["path"]: ((row["mtime_ns"], row["size"]), row["structural_hash"])
+            for row in self.connection.execute(
+                "SELECT path, mtime_ns, size, structural_hash FROM variations"
+            )
+        }
+        hashes = set()
+        unindexed = {}
+        for path, stat in file_stats.items():
+            if path in known and known[path][0] == stat:
+                hashes.add(known[path][1])
+            else:
+                word = os.path.relpath(path, dictionary_dir).split(os.sep, 1)[0]
+                unindexed[path] = (word, stat)
+        if unindexed:
+            rows = self.read_rows(unindexed)
+            self.store_rows(rows)
+            hashes.update(row[-1] for row in rows)
+        hashes.discard(None)
+        return hashes
+
+    def rename_paths(self, renames: dict[str, str]) -> None:
+        """
+        Move rows over to renamed thumbnails, so renumbering variations doesn't
+        cost a re-read. Renames must be given in the order they happened; a
+        row left behind by a deleted file at the new path is replaced.
+        """
+        if not renames:
+            return
+        with self.connection:
+            self.connection.executemany(
+                "UPDATE OR REPLACE variations SET path = ? WHERE path = ?",
+                [(new_path, old_path) for old_path, new_path in renames.items()],
+            )
+
+    def _build_row(
+        self, word: str, path: str, stat: tuple[int, int], text: Optional[str]
+    ) -> tuple:
+        metadata = self._parse_metadata(path, text) or {}
+        sequence = metadata.get("sequence") or []
+        header = sequence[0] if sequence else {}
+        start_pos_entry = sequence[1] if len(sequence) > 1 else {}
+        letters = [beat["letter"] for beat in sequence[2:] if "letter" in beat]
+        # Thumbnails saved before the hash was stored get it computed here.
+        structural_hash = metadata.get("structural_hash")
+        if structural_hash is None and sequence:
+            structural_hash = StructuralVariationChecker.get_structural_hash(sequence)
+
+        return (
+            path,
+            word,
+            *stat,
+            len(sequence) - 2 if sequence else None,
+            header.get("level"),
+            header.get("author"),
+            start_pos_entry.get("sequence_start_position"),
+            header.get("grid_mode"),
+            int(bool(metadata.get("is_favorite", False))),
+            metadata.get("date_added"),
+            json.dumps(letters, ensure_ascii=False),
+            structural_hash,
+        )
+
+    def _parse_metadata(self, path: str, text: Optional[str]) -> Optional[dict]:
+        if not text:
+            return None
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as e:
+            self.logger.warning(f"Could not index metadata for {path}: {e}")
+            return None
+
+    ### QUERIES ###
+
+    def get_word_records(self) -> list[DictionaryWordRecord]:
+        """Return one record per dictionary word, refreshing the index first."""
+        return list(self.get_records_by_word().values())
+
+    def get_records_by_word(self) -> dict[str, DictionaryWordRecord]:
+        """
+        Return every word's record, keyed by word. Only the words that changed
+        on disk since the last call are rebuilt, and the letter index and facet
+        counts are updated along with them, so anything derived from a record
+        (dates, lengths, section labels) is computed once per change.
+        """
+        self.refresh()
+        if self.dirty_words:
+            dirty_words, self.dirty_words = self.dirty_words, set()
+            self._update_records(dirty_words)
+        return self.records
+
+    def get_letter_index(self) -> DictionaryLetterIndex:
+        """Return the letter index, kept in step with the records."""
+        self.get_records_by_word()
+        return self.letter_index
+
+    def get_facet_counts(self, facet: str) -> dict:
+        """Return value -> number of words for one facet of dictionary_facet_counts."""
+        self.get_records_by_word()
+        return self.facet_counts.get(facet)
+
+    def _update_records(self, words: set[str]) -> None:
+        rows_by_word: dict[str, dict[str, sqlite3.Row]] = {}
+        words = list(words)
+        # Stay under SQLite's limit on the number of query parameters.
+        for start in range(0, len(words), 500):
+            chunk = words[start : start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            for row in self.connection.execute(
+                f"SELECT * FROM variations WHERE word IN ({placeholders})", chunk
+            ):
+                rows_by_word.setdefault(row["word"], {})[row["path"]] = row
+
+        for word in words:
+            old_record = self.records.pop(word, None)
+            if old_record is not None:
+                self.facet_counts.remove(old_record)
+                self.letter_index.remove_word(word)
+            thumbnails = self.word_thumbnails.get(word)
+            if thumbnails is None:
+                continue
+            rows = rows_by_word.get(word, {})
+            record = self._build_word_record(
+                word, thumbnails, [rows[path] for path in thumbnails if path in rows]
+            )
+            self.records[word] = record
+            self.facet_counts.add(record)
+            self.letter_index.add_word(word)
+
+    def _build_word_record(
+        self, word: str, thumbnails: list[str], rows: list[sqlite3.Row]
+    ) -> DictionaryWordRecord:
+        def first(column: str):
+            for row in rows:
+                if row[column] is not None:
+                    return row[column]
+            return None
+
+        letters = json.loads(first("letters") or "[]")
+        return DictionaryWordRecord(
+            word=word,
+            thumbnails=thumbnails,
+            length=first("length"),
+            level=first("level"),
+            author=first("author"),
+            start_position=first("start_position"),
+            grid_mode=first("grid_mode"),
+            is_favorite=any(row["is_favorite"] for row in rows),
+            date_added=max(
+                (self._parse_date(row["date_added"]) for row in rows),
+                default=datetime.min,
+            ),
+            letters=letters,
+        )
+
+    def get_sequence_length(self, path: str) -> Optional[int]:
+        """Return the indexed length of one thumbnail's sequence, or None if it isn't indexed."""
+        row = self.connection.execute(
+            "SELECT length FROM variations WHERE path = ?", (path,)
+        ).fetchone()
+        return row["length"] if row else None
+
+    def find_structural_variations(
+        self, structural_hash: str, word: Optional[str] = None
+    ) -> list[str]:
+        """Return the thumbnails whose sequence has this structural hash, optionally within one word."""
+        self.refresh()
+        query = "SELECT path FROM variations WHERE structural_hash = ?"
+        params: tuple = (structural_hash,)
+        if word is not None:
+            query += " AND word = ?"
+            params += (word,)
+        return [row["path"] for row in self.connection.execute(query, params)]
+
+    def get_structural_duplicates(self) -> list[list[str]]:
+        """Group the thumbnails, across every word, that share a structural hash."""
+        self.refresh()
+        rows = self.connection.execute(
+            """
+            SELECT path, structural_hash FROM variations
+            WHERE structural_hash IN (
+                SELECT structural_hash FROM variations
+                WHERE structural_hash IS NOT NULL
+                GROUP BY structural_hash HAVING COUNT(*) > 1
+            )
+            ORDER BY structural_hash
+            """
+        )
+        groups: dict[str, list[str]] = {}
+        for row in rows:
+            groups.setdefault(row["structural_hash"], []).append(row["path"])
+        return list(groups.values())
+
+    @staticmethod
+    def _parse_date(date_added: Optional[str]) -> datetime:
+        if not date_added:
+            return datetime.min
+        try:
+            return datetime.fromisoformat(date_added)
+        except ValueError:
+            return datetime.min
@@ -0,0 +1,173 @@
+import os
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject
+
+from utilities.path_helpers import get_images_and_data_path
+
+if TYPE_CHECKING:
+    from main_window.main_widget.main_widget import MainWidget
+
+THUMBNAIL_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+
+class DictionaryScanner(QObject):
+    """
+    In-memory tree of dictionary words -> thumbnails -> (mtime_ns, size).
+
+    The dictionary folder and every word folder are watched, so after the
+    first scan only the folders that reported a change are read again.
+    `generation` goes up whenever the tree changes, which lets consumers skip
+    work when nothing on disk has moved.
+
+    The scanner is pull-only: watcher events just mark folders dirty, and
+    nothing is re-read until the next query.
+    """
+
+    def __init__(self, main_widget: "MainWidget") -> None:
+        super().__init__(main_widget)
+        self.main_widget = main_widget
+        self.dictionary_dir = os.path.normpath(get_images_and_data_path("dictionary"))
+        self.words: dict[str, dict[str, tuple[int, int]]] = {}
+        self.generation = 0
+
+        self.needs_root_scan = True
+        self.dirty_words: set[str] = set()
+        self.watched_dirs: dict[str, str] = {}
+        self.word_dirs: dict[str, set[str]] = {}
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self._on_directory_changed)
+
+    ### QUERIES ###
+
+    def get_word_thumbnails(self) -> dict[str, list[str]]:
+        """Return a fresh word -> thumbnail paths mapping, rescanning only what changed."""
+        self.update()
+        return {word: list(files) for word, files in self.words.items()}
+
+    def get_thumbnails(self, word: str) -> list[str]:
+        self.update()
+        return list(self.words.get(word, {}))
+
+    def get_file_stats(self) -> dict[str, tuple[int, int]]:
+        """Return (mtime_ns, size) for every thumbnail in the dictionary."""
+        self.update()
+        return {
+            path: stat for files in self.words.values() for path, stat in files.items()
+        }
+
+    ### INVALIDATION ###
+
+    def mark_dirty(self, path: str) -> None:
+        """
+        Flag the word folder containing `path` for a rescan. Code that changes
+        the dictionary calls this so the very next query sees the change,
+        without waiting for the watcher's event to be delivered.
+        """
+        relative = os.path.relpath(os.path.normpath(path), self.dictionary_dir)
+        word = relative.split(os.sep, 1)[0]
+        if word in (os.curdir, os.pardir):
+            self.needs_root_scan = True
+        else:
+            self.dirty_words.add(word)
+
+    def mark_all_dirty(self) -> None:
+        self.needs_root_scan = True
+        self.dirty_words.update(self.words)
+
+    def _on_directory_changed(self, path: str) -> None:
+        path = os.path.normpath(path)
+        if path == self.dictionary_dir:
+            self.needs_root_scan = True
+        elif path in self.watched_dirs:
+            self.dirty_words.add(self.watched_dirs[path])
+
+    ### SCANNING ###
+
+    def update(self) -> bool:
+        """Apply any pending rescans; return True if the tree changed."""
+        if not self.needs_root_scan and not self.dirty_words:
+            return False
+
+        changed = False
+        if self.needs_root_scan:
+            self.needs_root_scan = False
+            if self.dictionary_dir not in self.watcher.directories():
+                self.watcher.addPath(self.dictionary_dir)
+            on_disk = set(self._list_word_dirs())
+            for word in self.words.keys() - on_disk:
+                self._forget_word(word)
+                changed = True
+            self.dirty_words.update(on_disk - self.words.keys())
+
+        for word in self.dirty_words:
+            changed |= self._rescan_word(word)
+        self.dirty_words.clear()
+
+        if changed:
+            self.generation += 1
+        return changed
+
+    def _list_word_dirs(self) -> list[str]:
+        with os.scandir(self.dictionary_dir) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if entry.is_dir() and "__pycache__" not in entry.name
+            ]
+
+    def _rescan_word(self, word: str) -> bool:
+        word_dir = os.path.join(self.dictionary_dir, word)
+        if not os.path.isdir(word_dir):
+            if word in self.words:
+                self._forget_word(word)
+                return True
+            return False
+
+        files: dict[str, tuple[int, int]] = {}
+        dirs: list[str] = []
+        self._scan_dir(word_dir, files, dirs)
+        self._watch_dirs(word, dirs)
+        if self.words.get(word) == files:
+            return False
+        self.words[word] = files
+        return True
+
+    def _scan_dir(
+        self, path: str, files: dict[str, tuple[int, int]], dirs: list[str]
+    ) -> None:
+        dirs.append(path)
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.is_dir():
+                if "__pycache__" not in entry.name:
+                    self._scan_dir(entry.path, files, dirs)
+            elif entry.name.endswith(THUMBNAIL_EXTENSIONS):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+
+    def _watch_dirs(self, word: str, dirs: list[str]) -> None:
+        old_dirs = self.word_dirs.pop(word, set())
+        new_dirs = {os.path.normpath(path) for path in dirs}
+        removed = old_dirs - new_dirs
+        added = new_dirs - old_dirs
+        if removed:
+            self.watcher.removePaths(list(removed))
+        if added:
+            self.watcher.addPaths(list(added))
+        for path in removed:
+            self.watched_dirs.pop(path, None)
+        for path in added:
+            self.watched_dirs[path] = word
+        if new_dirs:
+            self.word_dirs[word] = new_dirs
+
+    def _forget_word(self, word: str) -> None:
+        self.words.pop(word, None)
+        self._watch_dirs(word, [])
@@ -1,15 +1,13 @@
 from datetime import datetime
-import os
 from typing import TYPE_CHECKING
-from PyQt6.QtCore import QTimer
 from main_window.main_widget.dictionary_widget.dictionary_browser.initial_filter_selection_widget.dictionary_initial_selections_widget import (
     DictionaryInitialSelectionsWidget,
 )
 from main_window.main_widget.dictionary_widget.dictionary_browser.rainbow_progress_bar import (
     RainbowProgressBar,
 )
-from utilities.path_helpers import get_images_and_data_path
 from .currently_displaying_indicator_label import CurrentlyDisplayingIndicatorLabel
+from .dictionary_filter_runner import DictionaryFilterRunner, RecordPredicate
 from .dictionary_browser_nav_sidebar import DictionaryBrowserNavSidebar
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QPushButton
@@ -25,6 +23,9 @@ from .dictionary_browser_options_panel.dictionary_browser_options_panel import (
 from PyQt6.QtWidgets import QLabel
 
 if TYPE_CHECKING:
+    from main_window.main_widget.dictionary_metadata_index import (
+        DictionaryWordRecord,
+    )
     from main_window.main_widget.dictionary_widget.dictionary_widget import (
         DictionaryWidget,
     )
@@ -54,6 +55,10 @@ class DictionaryBrowser(QWidget):
         self.section_manager = SectionManager(self)
         self.thumbnail_box_sorter = ThumbnailBoxSorter(self)
         self.options_widget = DictionaryOptionsPanel(self)
+        self.filter_runner = DictionaryFilterRunner(self)
+        self.filter_runner.matches_ready.connect(self._on_filter_matches_ready)
+        self.filter_runner.progress.connect(self._on_filter_progress)
+        self.filter_runner.finished.connect(self._on_filter_finished)
 
         self._setup_go_back_to_initial_selection_widget_button()
         self._setup_number_of_currently_displayed_sequences_label()
@@ -70,35 +75,29 @@ class DictionaryBrowser(QWidget):
         self._initialize_progress_bar()
 
     def prepare_ui_for_filtering(self, description: str):
-        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
         self.currently_displaying_label.setText("")
-        QApplication.processEvents()
         self.currently_displaying_label.show_message(description)
         self.number_of_sequences_label.setText("")
         self.scroll_widget.clear_layout()
-        self.scroll_widget.grid_layout.addWidget(
-            self.progress_bar,
-            0,
-            0,
-            1,
-            self.thumbnail_box_sorter.num_columns,
-            Qt.AlignmentFlag.AlignCenter,
-        )
-        self._style_progress_bar()
-        self.progress_bar.setVisible(True)
-        QApplication.processEvents()
 
     def _initialize_progress_bar(self):
-        self.progress_bar = RainbowProgressBar(self.scroll_widget.scroll_content)
+        # Floats over the scroll area so it stays put while matches stream in.
+        self.progress_bar = RainbowProgressBar(self.scroll_widget)
         self.progress_bar.setVisible(False)
 
     def _style_progress_bar(self):
-        self.progress_bar.setFixedWidth(self.width() // 3)
-        self.progress_bar.setFixedHeight(self.height() // 6)
+        width = self.scroll_widget.width() // 3
+        height = self.scroll_widget.height() // 6
+        self.progress_bar.setGeometry(
+            (self.scroll_widget.width() - width) // 2,
+            (self.scroll_widget.height() - height) // 2,
+            width,
+            height,
+        )
 
         progress_bar_font = self.progress_bar.percentage_label.font()
-        progress_bar_font.setFamily("Monotype Corsiva")  # Set font to Monotype Corsiva
-        progress_bar_font.setPointSize(self.width() // 40)
+        progress_bar_font.setFamily("Monotype Corsiva")
+        progress_bar_font.setPointSize(max(1, self.width() // 40))
         self.progress_bar.percentage_label.setFont(progress_bar_font)
         self.progress_bar.loading_label.setFont(progress_bar_font)
 
@@ -115,6 +114,8 @@ class DictionaryBrowser(QWidget):
         self.back_button.clicked.connect(self.go_back_to_initial_selection_widget)
 
     def go_back_to_initial_selection_widget(self):
+        self.filter_runner.cancel()
+        self.progress_bar.setVisible(False)
         self.initial_selection_widget.show()
         for widget in self.widgets:
             widget.hide()
@@ -209,145 +210,44 @@ class DictionaryBrowser(QWidget):
 
     def show_favorites(self):
         """Show only favorite sequences."""
-
-        self.prepare_ui_for_filtering(f"favorite sequences")
-        dictionary_dir = get_images_and_data_path("dictionary")
-        base_words = [
-            (
-                word,
-                self.main_widget.thumbnail_finder.find_thumbnails(
-                    os.path.join(dictionary_dir, word)
-                ),
-            )
-            for word in os.listdir(dictionary_dir)
-            if os.path.isdir(os.path.join(dictionary_dir, word))
-            and "__pycache__" not in word
-        ]
-
-        favorites = []
-        for word, thumbnails in base_words:
-            for thumbnail in thumbnails:
-                if self.main_widget.metadata_extractor.get_favorite_status(thumbnail):
-                    sequence_length = (
-                        self.main_widget.metadata_extractor.get_sequence_length(
-                            thumbnail
-                        )
-                    )
-                    favorites.append((word, thumbnails, sequence_length))
-                    break
-
-        self.currently_displayed_sequences = favorites
-        self.update_and_display_ui(len(favorites), "favorite sequences")
+        self.filter_sequences("favorite sequences", lambda record: record.is_favorite)
 
     def show_all_sequences(self):
         """Show all sequences."""
-        self.prepare_ui_for_filtering(f"all sequences")
-
-        dictionary_dir = get_images_and_data_path("dictionary")
-        base_words = [
-            (
-                word,
-                self.main_widget.thumbnail_finder.find_thumbnails(
-                    os.path.join(dictionary_dir, word)
-                ),
-            )
-            for word in os.listdir(dictionary_dir)
-            if os.path.isdir(os.path.join(dictionary_dir, word))
-            and "__pycache__" not in word
-        ]
-        sequences = []
-        for word, thumbnails in base_words:
-            for thumbnail in thumbnails:
-                sequence_length = (
-                    self.main_widget.metadata_extractor.get_sequence_length(thumbnail)
-                )
-                sequences.append((word, thumbnails, sequence_length))
-        self.currently_displayed_sequences = sequences
-
-        self.update_and_display_ui(len(sequences), "all sequences")
+        self.filter_sequences("all sequences", lambda record: True)
 
     def show_most_recent_sequences(self, date: datetime):
-        self.prepare_ui_for_filtering(f"most recent sequences")
-        dictionary_dir = get_images_and_data_path("dictionary")
-        base_words = [
-            (
-                word,
-                self.main_widget.thumbnail_finder.find_thumbnails(
-                    os.path.join(dictionary_dir, word)
-                ),
-            )
-            for word in os.listdir(dictionary_dir)
-            if os.path.isdir(os.path.join(dictionary_dir, word))
-            and "__pycache__" not in word
-        ]
-        most_recent = []
-        for word, thumbnails in base_words:
-            date_added = self.section_manager.get_date_added(thumbnails)
-            if date_added and date_added >= date:
-                sequence_length = (
-                    self.main_widget.metadata_extractor.get_sequence_length(
-                        thumbnails[0]
-                    )
-                )
-                most_recent.append((word, thumbnails, sequence_length))
-                # break
-
-        self.currently_displayed_sequences = most_recent
-        self.update_and_display_ui(len(most_recent), "most recent sequences")
-
-    def update_and_display_ui(self, total_sequences: int, filter_description: str):
-        if total_sequences == 0:
-            total_sequences = 1  # Prevent division by zero
-
-        self.number_of_sequences_label.setText(
-            f"Number of words to be displayed: {total_sequences}"
+        self.filter_sequences(
+            "most recent sequences", lambda record: record.date_added >= date
+        )
+
+    ### FILTERING ###
+
+    def filter_sequences(self, description: str, predicate: RecordPredicate):
+        """
+        Show the words whose record matches `predicate`. Filtering runs in the
+        background and the grid fills in as matches arrive; picking another
+        filter meanwhile cancels this one. `predicate` runs off the GUI
+        thread, so it must only read the record it's given.
+        """
+        self.prepare_ui_for_filtering(description)
+        self.currently_displayed_sequences = []
+        self.progress_bar.setValue(0)
+        self._style_progress_bar()
+        self.progress_bar.setVisible(True)
+        self.progress_bar.raise_()
+        self.filter_runner.start(predicate)
+
+    def _on_filter_matches_ready(self, records: list["DictionaryWordRecord"]):
+        self.currently_displayed_sequences.extend(
+            record.as_display_tuple() for record in records
+        )
+        self.thumbnail_box_sorter.sort_and_display_currently_filtered_sequences_by_method(
+            self.main_widget.main_window.settings_manager.dictionary_settings.get_sort_method()
         )
 
-        def update_ui():
-            num_words = 0
-            nonlocal filter_description
-            for index, (word, thumbnails, _) in enumerate(
-                self.currently_displayed_sequences
-            ):
-                row_index = index // self.thumbnail_box_sorter.num_columns
-                column_index = index % self.thumbnail_box_sorter.num_columns
-                self.thumbnail_box_sorter.add_thumbnail_box(
-                    row_index=row_index,
-                    column_index=column_index,
-                    word=word,
-                    thumbnails=thumbnails,
-                    hidden=True,
-                )
-                num_words += 1
-
-                percentage = int((num_words / total_sequences) * 100)
-                self.progress_bar.setValue(percentage)
-                self.number_of_sequences_label.setText(f"Number of words: {num_words}")
-                QApplication.processEvents()
-
-            self.progress_bar.setVisible(False)
-            self.thumbnail_box_sorter.sort_and_display_currently_filtered_sequences_by_method(
-                self.main_widget.main_window.settings_manager.dictionary_settings.get_sort_method()
-            )
-            font_color = self.main_widget.main_window.settings_manager.global_settings.font_color_updater.get_font_color(
-                self.main_widget.main_window.settings_manager.global_settings.get_background_type()
-            )
-            for thumbnail_box in self.scroll_widget.thumbnail_boxes.values():
-                thumbnail_box.word_label.setStyleSheet(f"color: {font_color};")
-                if font_color == "white":
-                    thumbnail_box.word_label.star_icon_empty_path = (
-                        "star_empty_white.png"
-                    )
-                elif font_color == "black":
-                    thumbnail_box.word_label.star_icon_empty_path = (
-                        "star_empty_black.png"
-                    )
-                # reload the QIcons with the path
-                thumbnail_box.word_label.reload_favorite_icon()
-                thumbnail_box.variation_number_label.setStyleSheet(
-                    f"color: {font_color};"
-                )
-            QApplication.restoreOverrideCursor()
-
-        QTimer.singleShot(0, update_ui)
+    def _on_filter_progress(self, percentage: int):
+        self.progress_bar.setValue(percentage)
 
+    def _on_filter_finished(self):
+        self.progress_bar.setVisible(False)
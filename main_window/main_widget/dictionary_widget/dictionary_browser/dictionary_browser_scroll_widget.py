@@ -1,6 +1,11 @@
-from typing import TYPE_CHECKING
-from PyQt6.QtCore import Qt
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import TYPE_CHECKING, Optional, Union
+from PyQt6.QtCore import Qt, QEvent, QObject, QTimer
 
+from main_window.main_widget.dictionary_widget.dictionary_browser.dictionary_browser_section_header import (
+    DictionaryBrowserSectionHeader,
+)
 from main_window.main_widget.dictionary_widget.dictionary_browser.thumbnail_box.thumbnail_box import (
     ThumbnailBox,
 )
@@ -9,35 +14,66 @@ from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QScrollArea,
-    QGridLayout,
 )
 
 if TYPE_CHECKING:
     from main_window.main_widget.dictionary_widget.dictionary_browser.dictionary_browser import (
         DictionaryBrowser,
     )
-    from main_window.main_widget.dictionary_widget.dictionary_browser.dictionary_browser_section_header import (
-        DictionaryBrowserSectionHeader,
-    )
+
+HEADER_ROW = "header"
+BOX_ROW = "boxes"
+
+# (HEADER_ROW, title) or (BOX_ROW, [(word, thumbnails), ...])
+BrowserRow = tuple[str, Union[str, list[tuple[str, list[str]]]]]
 
 
 class DictionaryBrowserScrollWidget(QWidget):
+    """
+    Virtualized grid of section headers and thumbnail boxes.
+
+    The sorter hands over a flat list of rows, and only the rows inside the
+    viewport (plus a screen of prefetch either side) get widgets. Widgets for
+    rows that scroll away go back into a pool and are rebound to whichever
+    word needs one next, so the widget count follows the viewport size rather
+    than the size of the dictionary.
+    """
+
+    PREFETCH_SCREENS = 1
+    DEFAULT_HEADER_HEIGHT = 60
+
     def __init__(self, browser: "DictionaryBrowser"):
         super().__init__(browser)
         self.is_initialized = False
         self.browser = browser
+        # Only the rows that are currently materialized appear in these two.
         self.thumbnail_boxes: dict[str, ThumbnailBox] = {}
+        self.section_headers: dict[str, DictionaryBrowserSectionHeader] = {}
+
+        self.rows: list[BrowserRow] = []
+        self.row_offsets: list[int] = []
+        self.measured_heights: dict[int, int] = {}
+        self.section_rows: dict[str, int] = {}
+        self.materialized_rows: dict[int, list[QWidget]] = {}
+        # Idle boxes keyed by the word they last showed, so a word that comes
+        # back (e.g. on the next filter flush) gets its old box untouched.
+        self.box_pool: dict[str, ThumbnailBox] = {}
+        self.header_pool: list[DictionaryBrowserSectionHeader] = []
+        # The box shown in the preview area is kept out of the pool so the
+        # preview never ends up pointing at a box rebound to another word.
+        self.pinned_box: Optional[ThumbnailBox] = None
+        self.box_width = 0
+        self.estimated_box_row_height: Optional[int] = None
+        self.estimated_header_height = self.DEFAULT_HEADER_HEIGHT
+
         self.scroll_content = QWidget()
         self.setStyleSheet("background: transparent;")
-        self.is_initialized = True
-        self.section_headers: dict[int, "DictionaryBrowserSectionHeader"] = {}
         self._setup_scroll_area()
         self._setup_layout()
+        self._setup_remeasure_timer()
+        self.is_initialized = True
 
     def _setup_layout(self):
-        self.grid_layout = QGridLayout(self.scroll_content)
-        self.grid_layout.setSpacing(0)
-        self.grid_layout.setContentsMargins(0, 0, 0, 0)
         self.layout: QVBoxLayout = QVBoxLayout(self)
         self.layout.addWidget(self.scroll_area)
         self.layout.setSpacing(0)
@@ -50,15 +86,231 @@ class DictionaryBrowserScrollWidget(QWidget):
             Qt.ScrollBarPolicy.ScrollBarAlwaysOff
         )
         self.scroll_area.setWidget(self.scroll_content)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(
+            lambda _: self._update_visible_rows()
+        )
+
+    def _setup_remeasure_timer(self):
+        # Thumbnails arrive asynchronously and change a box's height, so row
+        # heights are re-measured once things settle rather than per event.
+        self.remeasure_timer = QTimer(self)
+        self.remeasure_timer.setSingleShot(True)
+        self.remeasure_timer.setInterval(0)
+        self.remeasure_timer.timeout.connect(self._remeasure_rows)
+
+    ### ROW MODEL ###
+
+    def set_rows(self, rows: list[BrowserRow]) -> None:
+        """Replace the displayed rows; widgets are only created for visible ones."""
+        for index in list(self.materialized_rows):
+            self._release_row(index)
+        self.rows = rows
+        self.measured_heights = {}
+        self.section_rows = {
+            title: index for index, (kind, title) in enumerate(rows) if kind == HEADER_ROW
+        }
+        self._relayout(keep_anchor=False)
 
     def clear_layout(self):
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().setParent(None)
+        self.set_rows([])
+
+    def scroll_to_section(self, section: str) -> None:
+        index = self.section_rows.get(section)
+        if index is not None:
+            self.scroll_area.verticalScrollBar().setValue(self.row_offsets[index])
+
+    def _get_row_height(self, index: int) -> int:
+        if index in self.measured_heights:
+            return self.measured_heights[index]
+        if self.rows[index][0] == HEADER_ROW:
+            return self.estimated_header_height
+        return self.estimated_box_row_height or self.box_width or 1
+
+    def _relayout(self, keep_anchor: bool = True) -> None:
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        anchor = anchor_shift = None
+        if keep_anchor and self.row_offsets:
+            anchor = self._get_row_at(scroll_bar.value())
+            anchor_shift = scroll_bar.value() - self.row_offsets[anchor]
+
+        heights = [self._get_row_height(index) for index in range(len(self.rows))]
+        self.row_offsets = [0, *accumulate(heights)][:-1]
+        total_height = sum(heights)
+        # A fixed height resizes the content right away, so the scroll bar
+        # range is already up to date when the anchor is restored below.
+        self.scroll_content.setFixedHeight(total_height)
+
+        if anchor is not None and anchor < len(self.rows):
+            scroll_bar.setValue(self.row_offsets[anchor] + anchor_shift)
+        for index, widgets in self.materialized_rows.items():
+            self._place_row(index, widgets)
+        self._update_visible_rows()
+
+    def _get_row_at(self, y: int) -> int:
+        return max(bisect_right(self.row_offsets, y) - 1, 0)
+
+    ### MATERIALIZATION ###
+
+    def _update_visible_rows(self) -> None:
+        if not self.rows:
+            return
+        self._unpin_stale_box()
+        top = self.scroll_area.verticalScrollBar().value()
+        viewport_height = self.scroll_area.viewport().height()
+        prefetch = viewport_height * self.PREFETCH_SCREENS
+        first = self._get_row_at(top - prefetch)
+        last = bisect_left(self.row_offsets, top + viewport_height + prefetch)
+        wanted = range(first, min(last, len(self.rows)))
+
+        for index in [i for i in self.materialized_rows if i not in wanted]:
+            self._release_row(index)
+        added = False
+        for index in wanted:
+            if index not in self.materialized_rows:
+                self._materialize_row(index)
+                added = True
+        if added:
+            self.remeasure_timer.start()
+
+    def _materialize_row(self, index: int) -> None:
+        kind, payload = self.rows[index]
+        if kind == HEADER_ROW:
+            widgets = [self._acquire_header(payload)]
+        else:
+            widgets = [self._acquire_box(word, thumbnails) for word, thumbnails in payload]
+        self.materialized_rows[index] = widgets
+        self._place_row(index, widgets)
+        for widget in widgets:
+            widget.show()
+
+    def _place_row(self, index: int, widgets: list[QWidget]) -> None:
+        y = self.row_offsets[index]
+        height = self._get_row_height(index)
+        if self.rows[index][0] == HEADER_ROW:
+            widgets[0].setGeometry(0, y, self.scroll_content.width(), height)
+            return
+        for column, box in enumerate(widgets):
+            box.setGeometry(column * self.box_width, y, self.box_width, height)
+
+    def _release_row(self, index: int) -> None:
+        for widget in self.materialized_rows.pop(index):
+            widget.hide()
+            if isinstance(widget, DictionaryBrowserSectionHeader):
+                title = widget.title_label.text()
+                if self.section_headers.get(title) is widget:
+                    del self.section_headers[title]
+                self.header_pool.append(widget)
+                continue
+
+            if self.thumbnail_boxes.get(widget.word) is widget:
+                del self.thumbnail_boxes[widget.word]
+            if widget is self._get_preview_box():
+                if self.pinned_box is not None and self.pinned_box is not widget:
+                    self._return_to_pool(self.pinned_box)
+                self.pinned_box = widget
+            else:
+                self._return_to_pool(widget)
+
+    def _acquire_header(self, title: str) -> DictionaryBrowserSectionHeader:
+        if self.header_pool:
+            header = self.header_pool.pop()
+            header.title_label.setText(title)
+        else:
+            header = DictionaryBrowserSectionHeader(title)
+            header.setParent(self.scroll_content)
+            header.installEventFilter(self)
+        self.section_headers[title] = header
+        return header
+
+    def _acquire_box(self, word: str, thumbnails: list[str]) -> ThumbnailBox:
+        if self.pinned_box is not None and self.pinned_box.word == word:
+            box, self.pinned_box = self.pinned_box, None
+            if box.thumbnails != thumbnails:
+                box.update_thumbnails(thumbnails)
+        elif word in self.box_pool:
+            box = self.box_pool.pop(word)
+            if box.thumbnails != thumbnails:
+                box.update_thumbnails(thumbnails)
+        elif self.box_pool:
+            _, box = self.box_pool.popitem()
+            box.set_word(word, thumbnails)
+        else:
+            box = ThumbnailBox(self.browser, word, thumbnails)
+            box.setParent(self.scroll_content)
+            box.installEventFilter(self)
+        box.resize_thumbnail_box()
+        self._apply_font_color(box)
+        self.thumbnail_boxes[word] = box
+        return box
+
+    def _return_to_pool(self, box: ThumbnailBox) -> None:
+        displaced = self.box_pool.pop(box.word, None)
+        if displaced is not None and displaced is not box:
+            # Two idle boxes for one word: keep the other under a unique key.
+            self.box_pool[f"{box.word}\0{id(displaced)}"] = displaced
+        self.box_pool[box.word] = box
+
+    def _apply_font_color(self, box: ThumbnailBox) -> None:
+        global_settings = (
+            self.browser.main_widget.main_window.settings_manager.global_settings
+        )
+        font_color = global_settings.font_color_updater.get_font_color(
+            global_settings.get_background_type()
+        )
+        if box.font_color == font_color:
+            return
+        box.font_color = font_color
+        box.word_label.setStyleSheet(f"color: {font_color};")
+        box.word_label.reload_favorite_icon()
+        box.variation_number_label.setStyleSheet(f"color: {font_color};")
+
+    def _get_preview_box(self) -> Optional[ThumbnailBox]:
+        return self.browser.dictionary_widget.preview_area.current_thumbnail_box
+
+    def _unpin_stale_box(self) -> None:
+        if self.pinned_box is not None and self.pinned_box is not self._get_preview_box():
+            self._return_to_pool(self.pinned_box)
+            self.pinned_box = None
+
+    ### MEASUREMENT ###
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.LayoutRequest:
+            self.remeasure_timer.start()
+        return super().eventFilter(obj, event)
+
+    def _remeasure_rows(self) -> None:
+        changed = False
+        for index, widgets in self.materialized_rows.items():
+            height = max(widget.sizeHint().height() for widget in widgets)
+            if self.rows[index][0] == HEADER_ROW:
+                self.estimated_header_height = height
+            else:
+                self.estimated_box_row_height = height
+            if self.measured_heights.get(index) != height:
+                self.measured_heights[index] = height
+                changed = True
+        if changed:
+            self._relayout()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.resize_dictionary_browser_scroll_widget()
 
     def resize_dictionary_browser_scroll_widget(self):
-        if self.is_initialized:
-            thumbnail_boxes: list[ThumbnailBox] = self.thumbnail_boxes.values()
-            for box in thumbnail_boxes:
-                box.resize_thumbnail_box()
+        if not self.is_initialized:
+            return
+        scrollbar_width = self.scroll_area.verticalScrollBar().width()
+        box_width = (self.width() - scrollbar_width) // self.browser.num_columns
+        if box_width != self.box_width:
+            self.box_width = box_width
+            self.measured_heights = {}
+            self.estimated_box_row_height = None
+            for widgets in self.materialized_rows.values():
+                for widget in widgets:
+                    if isinstance(widget, ThumbnailBox):
+                        widget.resize_thumbnail_box()
+            self._relayout()
+            self.remeasure_timer.start()
+        else:
+            self._update_visible_rows()
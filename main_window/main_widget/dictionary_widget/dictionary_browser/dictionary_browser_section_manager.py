@@ -1,15 +1,13 @@
 from datetime import datetime
-import json
 from typing import TYPE_CHECKING
 
-from main_window.main_widget.dictionary_widget.dictionary_browser.dictionary_browser_section_header import (
-    DictionaryBrowserSectionHeader,
-)
 from ..sorting_order import sorting_order, lowercase_letters
-from PIL import Image
 
 
 if TYPE_CHECKING:
+    from main_window.main_widget.dictionary_metadata_index import (
+        DictionaryWordRecord,
+    )
     from main_window.main_widget.dictionary_widget.dictionary_browser.dictionary_browser import (
         DictionaryBrowser,
     )
@@ -19,14 +17,6 @@ class SectionManager:
     def __init__(self, browser: "DictionaryBrowser"):
         self.browser = browser
 
-    def add_header(self, row_index, num_columns, section):
-        header_title = f"{section}"
-        header = DictionaryBrowserSectionHeader(header_title)
-        self.browser.scroll_widget.section_headers[section] = header
-        self.browser.scroll_widget.grid_layout.addWidget(
-            header, row_index, 0, 1, num_columns
-        )
-
     def get_sorted_sections(self, sort_method, sections) -> list[str]:
         if sort_method == "sequence_length":
             sorted_sections = sorted(
@@ -51,16 +41,25 @@ class SectionManager:
         except ValueError:
             return len(sorting_order)  # put unknown sections at the end
 
+    def get_section_for_record(
+        self, record: "DictionaryWordRecord", sort_order: str
+    ) -> str:
+        """Return the record's section label, computing it once per index refresh."""
+        section = record.section_labels.get(sort_order)
+        if section is None:
+            section = self.get_section_from_word(
+                record.word, sort_order, record.length, record.date_added
+            )
+            record.section_labels[sort_order] = section
+        return section
+
     def get_section_from_word(
-        self, word, sort_order, sequence_length=None, thumbnails=None
+        self, word, sort_order, sequence_length=None, date_added=None
     ):
         if sort_order == "sequence_length":
             return str(sequence_length) if sequence_length is not None else "Unknown"
         elif sort_order == "date_added":
-            if thumbnails:
-                date_added = self.get_date_added(thumbnails)
-                return date_added.strftime("%m-%d-%Y") if date_added else "Unknown"
-            return "Unknown"
+            return date_added.strftime("%m-%d-%Y") if date_added else "Unknown"
         else:
             section: str = word[:2] if len(word) > 1 and word[1] == "-" else word[0]
             if not section.isdigit():
@@ -69,20 +68,3 @@ class SectionManager:
                 else:
                     section = section.upper()
             return section
-
-    def get_date_added(self, thumbnails):
-        dates = []
-        for thumbnail in thumbnails:
-            image = Image.open(thumbnail)
-            info = image.info
-            metadata = info.get("metadata")
-            if metadata:
-                metadata_dict = json.loads(metadata)
-                date_added = metadata_dict.get("date_added")
-                if date_added:
-                    try:
-                        dates.append(datetime.fromisoformat(date_added))
-                    except ValueError:
-                        pass
-
-        return max(dates, default=datetime.min)
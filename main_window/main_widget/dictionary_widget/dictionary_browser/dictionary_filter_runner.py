@@ -0,0 +1,178 @@
+import threading
+from typing import TYPE_CHECKING, Callable, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from main_window.main_widget.dictionary_metadata_index import DictionaryWordRecord
+
+if TYPE_CHECKING:
+    from main_window.main_widget.dictionary_widget.dictionary_browser.dictionary_browser import (
+        DictionaryBrowser,
+    )
+
+RecordPredicate = Callable[[DictionaryWordRecord], bool]
+
+
+class DictionaryFilterJobSignals(QObject):
+    batch_ready = pyqtSignal(int, list, int)  # job id, results, items processed
+    finished = pyqtSignal(int)
+
+
+class DictionaryFilterJob(QRunnable):
+    """Runs `work` over `items` one batch at a time, emitting each batch's results."""
+
+    BATCH_SIZE = 50
+
+    def __init__(
+        self,
+        job_id: int,
+        items: list,
+        work: Callable[[list], list],
+        cancelled: threading.Event,
+    ) -> None:
+        super().__init__()
+        self.job_id = job_id
+        self.items = items
+        self.work = work
+        self.cancelled = cancelled
+        self.signals = DictionaryFilterJobSignals()
+
+    def run(self) -> None:
+        for start in range(0, len(self.items), self.BATCH_SIZE):
+            if self.cancelled.is_set():
+                return
+            batch = self.items[start : start + self.BATCH_SIZE]
+            self.signals.batch_ready.emit(self.job_id, self.work(batch), len(batch))
+        if not self.cancelled.is_set():
+            self.signals.finished.emit(self.job_id)
+
+
+class DictionaryFilterRunner(QObject):
+    """
+    Filters the dictionary off the GUI thread.
+
+    A run has two phases on the thread pool: first the metadata of any
+    thumbnail the index hasn't read yet, then the filter predicate over every
+    word record. Matches are collected and handed to the browser every
+    FLUSH_INTERVAL_MS, so the grid fills in while the rest is still being
+    filtered. Starting another run cancels the one in flight; batches that
+    were already queued by a cancelled run are ignored, and so are callbacks
+    registered with `call_when_finished` for it.
+    """
+
+    matches_ready = pyqtSignal(list)
+    progress = pyqtSignal(int)
+    finished = pyqtSignal()
+
+    FLUSH_INTERVAL_MS = 100
+
+    def __init__(self, browser: "DictionaryBrowser") -> None:
+        super().__init__(browser)
+        self.browser = browser
+        self.dictionary_index = browser.main_widget.dictionary_index
+        self.thread_pool = QThreadPool(self)
+        self.job_id = 0
+        self.job: Optional[DictionaryFilterJob] = None
+        self.cancelled = threading.Event()
+        self.predicate: Optional[RecordPredicate] = None
+        self.total = 0
+        self.processed = 0
+        self.pending_matches: list[DictionaryWordRecord] = []
+        self.finished_callbacks: list[Callable[[], None]] = []
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self._flush_matches)
+
+    def start(self, predicate: RecordPredicate) -> None:
+        self.cancel()
+        self.job_id += 1
+        self.cancelled = threading.Event()
+        self.predicate = predicate
+        self.processed = 0
+
+        unindexed = list(self.dictionary_index.get_unindexed_paths().items())
+        self.total = len(unindexed) + len(self.dictionary_index.word_thumbnails)
+        if not unindexed:
+            self._on_metadata_resolved(self.job_id)
+            return
+        read_rows = self.dictionary_index.read_rows
+        self._run(
+            unindexed,
+            lambda batch: read_rows(dict(batch)),
+            self._on_rows_ready,
+            self._on_metadata_resolved,
+        )
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+        self.job = None
+        self.flush_timer.stop()
+        self.pending_matches = []
+        self.finished_callbacks = []
+
+    def call_when_finished(self, callback: Callable[[], None]) -> None:
+        """Call `callback` once the current run completes; dropped if it's cancelled."""
+        if self.job is not None:
+            self.finished_callbacks.append(callback)
+
+    def _run(
+        self,
+        items: list,
+        work: Callable[[list], list],
+        on_batch: Callable[[int, list, int], None],
+        on_finished: Callable[[int], None],
+    ) -> None:
+        self.job = DictionaryFilterJob(self.job_id, items, work, self.cancelled)
+        self.job.signals.batch_ready.connect(on_batch)
+        self.job.signals.finished.connect(on_finished)
+        self.thread_pool.start(self.job)
+
+    ### PHASES ###
+
+    def _on_rows_ready(self, job_id: int, rows: list, processed: int) -> None:
+        # The rows are valid whichever run read them, so keep them regardless.
+        self.dictionary_index.store_rows(rows)
+        if job_id == self.job_id:
+            self._advance(processed)
+
+    def _on_metadata_resolved(self, job_id: int) -> None:
+        if job_id != self.job_id:
+            return
+        records = list(self.dictionary_index.get_records_by_word().values())
+        self.total = self.processed + len(records)
+        predicate = self.predicate
+        self._run(
+            records,
+            lambda batch: [record for record in batch if predicate(record)],
+            self._on_matches_ready,
+            self._on_filter_finished,
+        )
+
+    def _on_matches_ready(self, job_id: int, matches: list, processed: int) -> None:
+        if job_id != self.job_id:
+            return
+        self.pending_matches.extend(matches)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+        self._advance(processed)
+
+    def _on_filter_finished(self, job_id: int) -> None:
+        if job_id != self.job_id:
+            return
+        self.job = None
+        self.flush_timer.stop()
+        self._flush_matches()
+        self.finished.emit()
+        callbacks, self.finished_callbacks = self.finished_callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def _flush_matches(self) -> None:
+        matches, self.pending_matches = self.pending_matches, []
+        self.matches_ready.emit(matches)
+
+    def _advance(self, processed: int) -> None:
+        self.processed += processed
+        self.progress.emit(int(self.processed / max(self.total, 1) * 100))
@@ -78,6 +78,8 @@ class DictionaryInitialSelectionsWidget(QWidget):
             if section_name != "filter_choice" and isinstance(
                 section, FilterSectionBase
             ):
+                # Sequences may have been saved or deleted since it was built.
+                section.update_sequence_counts()
                 resize_method = getattr(section, f"resize_{section_name}_section", None)
                 if callable(resize_method):
                     resize_method()
@@ -19,6 +19,7 @@ from functools import partial
 import os
 
 from utilities.path_helpers import get_images_and_data_path
+from main_window.main_widget.dictionary_facet_counts import GRID_MODE
 from .filter_section_base import FilterSectionBase
 
 if TYPE_CHECKING:
@@ -168,87 +169,27 @@ class GridModeSection(FilterSectionBase):
         """Handle clicks on grid mode images."""
         self.handle_grid_mode_click(grid_mode)
 
-    def _get_all_sequences_with_grid_modes(self):
-        """Retrieve and cache all sequences along with their grid modes."""
-        if hasattr(self, "_all_sequences_with_grid_modes"):
-            return self._all_sequences_with_grid_modes
-
-        dictionary_dir = get_images_and_data_path("dictionary")
-        base_words = [
-            (
-                word,
-                self.main_widget.thumbnail_finder.find_thumbnails(
-                    os.path.join(dictionary_dir, word)
-                ),
-            )
-            for word in os.listdir(dictionary_dir)
-            if os.path.isdir(os.path.join(dictionary_dir, word))
-            and "__pycache__" not in word
-        ]
-
-        sequences_with_grid_modes = []
-        for word, thumbnails in base_words:
-            grid_mode = self.get_sequence_grid_mode(thumbnails)
-            if grid_mode is not None:
-                sequences_with_grid_modes.append((word, thumbnails, grid_mode))
-
-        self._all_sequences_with_grid_modes = sequences_with_grid_modes
-        return sequences_with_grid_modes
-
     def _get_sequence_counts_per_grid_mode(self) -> dict[str, int]:
-        """Compute the number of sequences available for each grid mode."""
-        grid_mode_counts: dict[str, int] = {}
-        sequences_with_grid_modes = self._get_all_sequences_with_grid_modes()
-        for _, _, grid_mode in sequences_with_grid_modes:
-            grid_mode_counts[grid_mode] = grid_mode_counts.get(grid_mode, 0) + 1
-        return grid_mode_counts
-
-    def get_sequences_by_grid_mode(self, grid_mode: str):
-        """Retrieve sequences that correspond to a specific grid mode."""
-        sequences_with_grid_modes = self._get_all_sequences_with_grid_modes()
-        return [
-            (word, thumbnails)
-            for word, thumbnails, seq_grid_mode in sequences_with_grid_modes
-            if seq_grid_mode == grid_mode
-        ]
-
-    def get_sequence_grid_mode(self, thumbnails: list) -> str:
-        """Extract the grid mode from the metadata of the thumbnails."""
-        for thumbnail in thumbnails:
-            grid_mode = self.main_widget.metadata_extractor.get_sequence_grid_mode(
-                thumbnail
-            )
-            if grid_mode:
-                return grid_mode
-        return None
+        """Number of sequences available for each grid mode."""
+        return self.main_widget.dictionary_index.get_facet_counts(GRID_MODE)
+
+    def update_sequence_counts(self):
+        self.sequence_counts = self._get_sequence_counts_per_grid_mode()
+        for grid_mode, label in self.sequence_count_labels.items():
+            count = self.sequence_counts.get(grid_mode.lower(), 0)
+            sequence_text = "sequence" if count == 1 else "sequences"
+            label.setText(f"{count} {sequence_text}")
 
     def display_only_thumbnails_with_grid_mode(self, grid_mode: str):
         """Display only the thumbnails that match the selected grid mode."""
         self.initial_selection_widget.browser.dictionary_widget.dictionary_settings.set_current_filter(
             {"grid_mode": grid_mode.lower()}
         )
-        self.browser.prepare_ui_for_filtering(
-            f"{grid_mode.capitalize()} mode sequences."
+        self.browser.filter_sequences(
+            f"{grid_mode.capitalize()} mode sequences.",
+            lambda record: record.grid_mode == grid_mode,
         )
 
-        sequences = self.get_sequences_by_grid_mode(grid_mode)
-        total_sequences = len(sequences)
-
-        self.browser.currently_displayed_sequences = [
-            (word, thumbnails, self.get_sequence_length_from_thumbnails(thumbnails))
-            for word, thumbnails in sequences
-        ]
-
-        self.browser.update_and_display_ui(total_sequences, grid_mode)
-
-    def get_sequence_length_from_thumbnails(self, thumbnails: list[str]) -> int:
-        """Extract the sequence length from the thumbnails' metadata."""
-        for thumbnail in thumbnails:
-            length = self.metadata_extractor.get_sequence_length(thumbnail)
-            if length is not None:
-                return length
-        return 0
-
     def eventFilter(self, source: QObject, event: QEvent) -> bool:
         """Handle hover events to add or remove borders on images."""
         if isinstance(source, QLabel):
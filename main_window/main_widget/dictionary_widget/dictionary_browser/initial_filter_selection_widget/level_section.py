@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict
 from PyQt6.QtWidgets import (
     QVBoxLayout,
     QPushButton,
@@ -13,6 +13,7 @@ import os
 from functools import partial
 
 from utilities.path_helpers import get_images_and_data_path
+from main_window.main_widget.dictionary_facet_counts import LEVEL
 from .filter_section_base import FilterSectionBase
 
 if TYPE_CHECKING:
@@ -139,84 +140,25 @@ class LevelSection(FilterSectionBase):
         """Handle clicks on level images."""
         self.handle_level_click(level)
 
-    def _get_all_sequences_with_levels(self) -> List[Tuple[str, list[str], int]]:
-        """Retrieve and cache all sequences along with their levels."""
-        if hasattr(self, "_all_sequences_with_levels"):
-            return self._all_sequences_with_levels
-
-        dictionary_dir = get_images_and_data_path("dictionary")
-        base_words = [
-            (
-                word,
-                self.main_widget.thumbnail_finder.find_thumbnails(
-                    os.path.join(dictionary_dir, word)
-                ),
-            )
-            for word in os.listdir(dictionary_dir)
-            if os.path.isdir(os.path.join(dictionary_dir, word))
-            and "__pycache__" not in word
-        ]
-
-        sequences_with_levels = []
-        for word, thumbnails in base_words:
-            level = self.get_sequence_level_from_thumbnails(thumbnails)
-            if level is not None:
-                sequences_with_levels.append((word, thumbnails, level))
-
-        self._all_sequences_with_levels = sequences_with_levels
-        return sequences_with_levels
-
     def _get_sequence_counts_per_level(self) -> Dict[int, int]:
-        """Compute the number of sequences available for each level."""
-        level_counts: Dict[int, int] = {}
-        sequences_with_levels = self._get_all_sequences_with_levels()
-        for _, _, level in sequences_with_levels:
-            level_counts[level] = level_counts.get(level, 0) + 1
-        return level_counts
-
-    def get_sequences_that_are_a_specific_level(
-        self, level: int
-    ) -> List[Tuple[str, list[str]]]:
-        """Retrieve sequences that correspond to a specific level."""
-        sequences_with_levels = self._get_all_sequences_with_levels()
-        return [
-            (word, thumbnails)
-            for word, thumbnails, seq_level in sequences_with_levels
-            if seq_level == level
-        ]
-
-    def get_sequence_level_from_thumbnails(self, thumbnails: list[str]) -> int:
-        """Extract the level from the metadata of the thumbnails."""
-        for thumbnail in thumbnails:
-            level = self.metadata_extractor.get_sequence_level(thumbnail)
-            if level is not None:
-                return level
-        return None
+        """Number of sequences available for each level."""
+        return self.main_widget.dictionary_index.get_facet_counts(LEVEL)
+
+    def update_sequence_counts(self):
+        self.sequence_counts = self._get_sequence_counts_per_level()
+        for level, label in self.sequence_count_labels.items():
+            count = self.sequence_counts.get(level, 0)
+            sequence_text = "sequence" if count == 1 else "sequences"
+            label.setText(f"{count} {sequence_text}")
 
     def display_only_thumbnails_with_level(self, level: int):
         """Display only the thumbnails that match the selected level."""
         self.initial_selection_widget.browser.dictionary_widget.dictionary_settings.set_current_filter(
             {"level": level}
         )
-        self.browser.prepare_ui_for_filtering(f"level {level} sequences")
-
-        sequences = self.get_sequences_that_are_a_specific_level(level)
-        total_sequences = len(sequences)
-
-        self.browser.currently_displayed_sequences = [
-            (word, thumbnails, self.get_sequence_length_from_thumbnails(thumbnails))
-            for word, thumbnails in sequences
-        ]
-
-        self.browser.update_and_display_ui(total_sequences, level)
-
-    def get_sequence_length_from_thumbnails(self, thumbnails: list[str]) -> int:
-        """Extract the sequence length from the thumbnails' metadata."""
-        for thumbnail in thumbnails:
-            length = self.metadata_extractor.get_sequence_length(thumbnail)
-            if length is not None:
-                return length
-        return 0
+        self.browser.filter_sequences(
+            f"level {level} sequences", lambda record: record.level == level
+        )
 
     def eventFilter(self, source: QObject, event: QEvent) -> bool:
         """Handle hover events to add or remove borders on images."""
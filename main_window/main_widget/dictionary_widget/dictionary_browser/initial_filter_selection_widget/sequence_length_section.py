@@ -8,6 +8,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from functools import partial
+from main_window.main_widget.dictionary_facet_counts import LENGTH
 from .filter_section_base import FilterSectionBase
 
 if TYPE_CHECKING:
@@ -99,32 +100,23 @@ class SequenceLengthSection(FilterSectionBase):
 
     def _get_sequence_length_counts(self) -> dict[int, int]:
         """Tally up how many sequences are available for each length."""
-        length_counts = {}
-        base_words = self.thumbnail_box_sorter.get_sorted_base_words("sequence_length")
+        return self.main_widget.dictionary_index.get_facet_counts(LENGTH)
 
-        for _, _, seq_length in base_words:
-            length_counts[seq_length] = length_counts.get(seq_length, 0) + 1
-
-        return length_counts
+    def update_sequence_counts(self):
+        sequence_counts = self._get_sequence_length_counts()
+        for length, label in self.sequence_tally_labels.items():
+            count = sequence_counts.get(length, 0)
+            sequence_text = "sequence" if count == 1 else "sequences"
+            label.setText(f"{count} {sequence_text}")
 
     def display_only_thumbnails_with_sequence_length(self, length: int):
         """Display sequences of a specific length."""
         self.initial_selection_widget.browser.dictionary_widget.dictionary_settings.set_current_filter(
             {"sequence_length": length}
         )
-        self.browser.prepare_ui_for_filtering(f"sequences of length {length}")
-
-        base_words = self.thumbnail_box_sorter.get_sorted_base_words("sequence_length")
-        matching_sequences = [
-            (word, thumbnails, seq_length)
-            for word, thumbnails, seq_length in base_words
-            if seq_length == length
-        ]
-
-        total_sequences = len(matching_sequences) or 1  # Prevent division by zero
-        self.browser.currently_displayed_sequences = matching_sequences
-
-        self.browser.update_and_display_ui(total_sequences, length)
+        self.browser.filter_sequences(
+            f"sequences of length {length}", lambda record: record.length == length
+        )
 
     def resize_sequence_length_section(self):
         self.resize_buttons()
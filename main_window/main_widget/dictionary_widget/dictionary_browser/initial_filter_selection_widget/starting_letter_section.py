@@ -1,14 +1,14 @@
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, List
 from PyQt6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
     QLabel,
     QWidget,
-    QApplication,
 )
 from PyQt6.QtCore import Qt, QEvent, QObject
 from PyQt6.QtGui import QFontMetrics
+from main_window.main_widget.dictionary_facet_counts import STARTING_LETTER
 from .filter_section_base import FilterSectionBase
 from functools import partial
 
@@ -90,22 +90,10 @@ class StartingLetterSection(FilterSectionBase):
 
     def _get_starting_letter_sequence_counts(self) -> dict[str, int]:
         """Tally up how many sequences start with each letter."""
-        letter_counts = {letter: 0 for letter in self.buttons.keys()}
-        base_words = self.thumbnail_box_sorter.get_sorted_base_words("sequence_length")
+        return self.main_widget.dictionary_index.get_facet_counts(STARTING_LETTER)
 
-        for word, _, _ in base_words:
-            first_letter = self.extract_first_letter(word)
-            if first_letter in letter_counts:
-                letter_counts[first_letter] += 1
-
-        return letter_counts
-
-    @staticmethod
-    def extract_first_letter(word: str) -> str:
-        """Extract the first letter or symbol from the word."""
-        if len(word) > 1 and word[1] == "-":
-            return word[:2]
-        return word[0]
+    def update_sequence_counts(self):
+        self.sequence_tally = self._get_starting_letter_sequence_counts()
 
     def display_only_thumbnails_starting_with_letter(self, letter: str):
         """Display thumbnails of sequences starting with the specified letter."""
@@ -119,31 +107,16 @@ class StartingLetterSection(FilterSectionBase):
             else "all sequences"
         )
         self.browser.nav_sidebar.clear_sidebar()
-        QApplication.processEvents()
-        self.browser.prepare_ui_for_filtering(description)
-
-        base_words = self.thumbnail_box_sorter.get_sorted_base_words("sequence_length")
         if letter == "show_all":
-            matching_sequences = [
-                (word, thumbnails, seq_length)
-                for word, thumbnails, seq_length in base_words
-            ]
-        else:
-            matching_sequences = [
-                (word, thumbnails, seq_length)
-                for word, thumbnails, seq_length in base_words
-                if self._word_starts_with_letter(word, letter)
-            ]
-
-        total_sequences = len(matching_sequences) or 1  # Prevent division by zero
-        self.browser.currently_displayed_sequences = matching_sequences
-        self.browser.update_and_display_ui(total_sequences, letter)
-
-    def _word_starts_with_letter(self, word: str, letter: str) -> bool:
-        """Check if the word starts with the given letter."""
-        if len(letter) == 1:
-            return word.startswith(letter) and (len(word) == 1 or word[1] != "-")
-        return word.startswith(letter)
+            self.browser.filter_sequences(description, lambda record: True)
+            return
+        # The predicate runs off the GUI thread, so it only gets a snapshot of
+        # the matching words, never the shared letter index itself.
+        letter_index = self.main_widget.dictionary_index.get_letter_index()
+        matches = frozenset(letter_index.starting_with(letter))
+        self.browser.filter_sequences(
+            description, lambda record: record.word in matches
+        )
 
     def resize_starting_letter_section(self):
         self.resize_buttons()
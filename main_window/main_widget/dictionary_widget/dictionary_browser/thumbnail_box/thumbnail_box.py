@@ -1,6 +1,5 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap
 from PyQt6.QtWidgets import QVBoxLayout, QWidget, QApplication
 from main_window.main_widget.metadata_extractor import MetaDataExtractor
 from main_window.main_widget.dictionary_widget.dictionary_browser.thumbnail_box.thumbnail_box_nav_btns import (
@@ -29,6 +28,7 @@ class ThumbnailBox(QWidget):
         self.browser = browser
         self.setContentsMargins(0, 0, 0, 0)
         self.favorite_status = False  # Default favorite status
+        self.font_color: Optional[str] = None  # Set by the scroll widget
         self._setup_components()
         self._setup_layout()
         self.layout.setSpacing(0)
@@ -58,11 +58,31 @@ class ThumbnailBox(QWidget):
         )
         # self.setStyleSheet("background-color: rgba(255, 255, 255, 0.5);")
 
+    def set_word(self, word: str, thumbnails: list[str]) -> None:
+        """Rebind a recycled box to another word."""
+        self.word = word
+        self.current_index = 0
+        self.word_label.word_label.setText(word)
+        self.thumbnails = thumbnails
+        self.load_favorite_status()
+        self.word_label.update_favorite_icon(self.favorite_status)
+        self.image_label.set_selected(False)
+        self.update_thumbnails(thumbnails)
+
+        has_multiple_thumbnails = len(thumbnails) > 1
+        self.nav_buttons_widget.has_multiple_thumbnails = has_multiple_thumbnails
+        self.nav_buttons_widget.setVisible(has_multiple_thumbnails)
+        self.variation_number_label.setVisible(has_multiple_thumbnails)
+
     def is_favorite(self) -> bool:
         return self.favorite_status
 
     def toggle_favorite_status(self):
         self.favorite_status = not self.favorite_status
+        record = self.main_widget.dictionary_index.records.get(self.word)
+        if record is not None:
+            # Keep the record in step until the rewritten PNGs are re-indexed.
+            record.is_favorite = self.favorite_status
         self.word_label.update_favorite_icon(self.favorite_status)
         QApplication.processEvents()
         self.save_favorite_status()
@@ -78,12 +98,9 @@ class ThumbnailBox(QWidget):
                 self.show()
 
     def load_favorite_status(self):
-        # Load favorite status from metadata
-        if self.thumbnails:
-            first_thumbnail = self.thumbnails[0]
-            self.favorite_status = self.metadata_extractor.get_favorite_status(
-                first_thumbnail
-            )
+        # The browser's word record already has it; no need to open the PNG.
+        record = self.main_widget.dictionary_index.records.get(self.word)
+        self.favorite_status = record.is_favorite if record is not None else False
 
     def save_favorite_status(self):
         # Save favorite status to metadata
@@ -110,7 +127,7 @@ class ThumbnailBox(QWidget):
                 self.thumbnails
             )
         self.image_label.thumbnails = thumbnails
-        self.image_label.set_pixmap_to_fit(QPixmap(self.thumbnails[self.current_index]))
+        self.image_label.update_thumbnail(self.current_index)
         if len(self.thumbnails) == 1:
             self.variation_number_label.hide()
         else:
@@ -58,6 +58,7 @@ class ThumbnailBoxNavButtonsWidget(QWidget):
     def update_thumbnail(self, index):
         self.thumbnail_label.update_thumbnail(index)
         self.variation_number_label.update_index(index)
+        self.thumbnail_label.prefetch_neighbors(index)
 
     def _setup_buttons(self):
         self.left_button = NavButton("<", self)
@@ -17,33 +17,60 @@ class ThumbnailImageLabel(QLabel):
         self.mousePressEvent = self.thumbnail_clicked
         self.thumbnails = thumbnail_box.thumbnails
         self.metadata_extractor = thumbnail_box.main_widget.metadata_extractor
+        self.dictionary_index = thumbnail_box.main_widget.dictionary_index
+        self.thumbnail_cache = thumbnail_box.main_widget.thumbnail_cache
+        self.thumbnail_cache.thumbnail_ready.connect(self._on_thumbnail_ready)
         self.browser = thumbnail_box.browser
         self.is_selected = False
+        self.current_path: str = None
 
         self.setScaledContents(False)
 
     def update_thumbnail(self, index):
         if self.thumbnails and 0 <= index < len(self.thumbnails):
-            pixmap = QPixmap(self.thumbnails[index])
-            self.set_pixmap_to_fit(pixmap)
+            self.current_path = self.thumbnails[index]
+            self._show_cached_thumbnail()
         else:
+            self.current_path = None
             self.setText("No image available")
 
-    def set_pixmap_to_fit(self, pixmap: QPixmap):
-        sequence_length = self.metadata_extractor.get_sequence_length(
-            self.thumbnail_box.thumbnails[self.thumbnail_box.current_index]
+    def _show_cached_thumbnail(self):
+        pixmap = self.thumbnail_cache.get_pixmap(
+            self.current_path, self.get_target_width(self.current_path)
         )
+        if pixmap is None:
+            # The scaled tiers are still being generated; _on_thumbnail_ready will retry.
+            return
+        self.setPixmap(pixmap)
+        self.adjustSize()
+
+    def _on_thumbnail_ready(self, path: str):
+        if path == self.current_path:
+            self._show_cached_thumbnail()
+
+    def get_target_width(self, path: str) -> int:
+        sequence_length = self.dictionary_index.get_sequence_length(path)
+        if sequence_length is None:
+            sequence_length = self.metadata_extractor.get_sequence_length(path)
         if sequence_length == 1:
-            target_width = int(self.thumbnail_box.width() * 0.6) - int(
-                self.thumbnail_box.margin * 2
-            )
-        else:
-            target_width = self.thumbnail_box.width() - int(
+            return int(self.thumbnail_box.width() * 0.6) - int(
                 self.thumbnail_box.margin * 2
             )
+        return self.thumbnail_box.width() - int(self.thumbnail_box.margin * 2)
 
+    def prefetch_neighbors(self, index: int):
+        """Warm the cache with the variations either side of `index`."""
+        if len(self.thumbnails) < 2:
+            return
+        for step in (1, -1):
+            path = self.thumbnails[(index + step) % len(self.thumbnails)]
+            self.thumbnail_cache.prefetch(path, self.get_target_width(path))
+
+    def set_pixmap_to_fit(self, pixmap: QPixmap):
+        self.current_path = self.thumbnails[self.thumbnail_box.current_index]
         scaled_pixmap = pixmap.scaledToWidth(
-            target_width, Qt.TransformationMode.SmoothTransformation
+            self.get_target_width(self.current_path),
+            Qt.TransformationMode.SmoothTransformation,
         )
         self.setPixmap(scaled_pixmap)
         self.adjustSize()
@@ -55,7 +82,7 @@ class ThumbnailImageLabel(QLabel):
             )
             self.browser.dictionary_widget.selection_handler.thumbnail_clicked(
                 self,
-                QPixmap(self.thumbnails[self.thumbnail_box.current_index]),
+                self.pixmap(),
                 metadata,
                 self.thumbnails,
                 self.thumbnail_box.current_index,
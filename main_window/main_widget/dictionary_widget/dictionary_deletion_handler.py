@@ -7,9 +7,8 @@ from main_window.main_widget.dictionary_widget.variation_number_fixer import (
 from main_window.main_widget.dictionary_widget.delete_confirmation_dialog import (
     DeleteConfirmationDialog,
 )
-from utilities.path_helpers import get_images_and_data_path
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QDialog
 
 if TYPE_CHECKING:
@@ -38,14 +37,12 @@ class DictionaryDeletionHandler:
             )
             file_path = thumbnail_box.thumbnails.pop(index)
             os.remove(file_path)
+            self.dictionary_widget.main_widget.dictionary_scanner.mark_dirty(file_path)
             if len(thumbnail_box.thumbnails) == 0:
                 self.delete_word(thumbnail_box.word)
                 self.dictionary_widget.preview_area.update_thumbnails()
-                self.dictionary_widget.browser.scroll_widget.thumbnail_boxes.pop(
-                    thumbnail_box.word
-                )
             else:
-                self.delete_empty_folders(get_images_and_data_path("dictionary"))
+                self.renumber_variations(thumbnail_box.word, thumbnail_box.thumbnails)
                 thumbnail_box.current_index = 0
                 self.dictionary_widget.browser.thumbnail_box_sorter.reload_currently_displayed_filtered_sequences()
                 thumbnail_box.image_label.update_thumbnail(thumbnail_box.current_index)
@@ -54,19 +51,36 @@ class DictionaryDeletionHandler:
                 )
                 thumbnail_box.update_thumbnails(thumbnail_box.thumbnails)
 
-            def restore_scroll_position():
-                self.dictionary_widget.browser.scroll_widget.scroll_area.verticalScrollBar().setValue(
+            # The browser reloads in the background, so scroll back once that
+            # reload is done. If it gets cancelled, the position no longer applies.
+            self.dictionary_widget.browser.filter_runner.call_when_finished(
+                lambda: self.dictionary_widget.browser.scroll_widget.scroll_area.verticalScrollBar().setValue(
                     current_scroll_position
                 )
-                QApplication.restoreOverrideCursor()
-
-            QApplication.processEvents()
-            QTimer.singleShot(0, restore_scroll_position)
+            )
 
         QApplication.restoreOverrideCursor()
 
+    def get_word_folder(self, base_word):
+        dictionary_dir = self.dictionary_widget.main_widget.dictionary_scanner.dictionary_dir
+        return os.path.join(dictionary_dir, base_word)
+
+    def renumber_variations(self, base_word, thumbnails: list[str]):
+        """
+        Close the gap a deleted variation leaves in the word's version numbers.
+        Only the word's own folder is touched, and `thumbnails` and the
+        metadata index are updated in place to follow the renames.
+        """
+        word_folder = self.get_word_folder(base_word)
+        self.delete_empty_folders(word_folder)
+        renames = self.variation_number_fixer.ensure_sequential_versions(word_folder)
+        thumbnails[:] = [renames.get(path, path) for path in thumbnails]
+        main_widget = self.dictionary_widget.main_widget
+        main_widget.dictionary_index.rename_paths(renames)
+        main_widget.dictionary_scanner.mark_dirty(word_folder)
+
     def delete_word(self, base_word):
-        base_path = os.path.join(get_images_and_data_path("dictionary"), base_word)
+        base_path = self.get_word_folder(base_word)
         for root, dirs, files in os.walk(base_path):
             for name in files:
                 file_path = os.path.join(root, name)
@@ -76,8 +90,7 @@ class DictionaryDeletionHandler:
                 os.chmod(dir_path, 0o777)
         os.chmod(base_path, 0o777)
         shutil.rmtree(base_path)
-        self.delete_empty_folders(get_images_and_data_path("dictionary"))
-        self.variation_number_fixer.ensure_sequential_versions()
+        self.dictionary_widget.main_widget.dictionary_scanner.mark_dirty(base_path)
         self.dictionary_widget.browser.thumbnail_box_sorter.reload_currently_displayed_filtered_sequences()
 
     def delete_empty_folders(self, root_folder):
@@ -1,7 +1,6 @@
 from typing import TYPE_CHECKING
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap
 from main_window.main_widget.dictionary_widget.preview_area_image_label import (
     PreviewAreaImageLabel,
 )
@@ -29,6 +28,9 @@ if TYPE_CHECKING:
 
 
 class DictionaryPreviewArea(QWidget):
+    # How many of the words after the selected one get their preview prefetched.
+    PREFETCH_WORDS = 3
+
     def __init__(self, dictionary_widget: "DictionaryWidget"):
         super().__init__(dictionary_widget)
         self.thumbnails = []
@@ -112,9 +114,8 @@ class DictionaryPreviewArea(QWidget):
             return
 
         if self.thumbnails and index is not None:
-            pixmap = QPixmap(self.thumbnails[index])
-            if pixmap.height() != 0:
-                self.image_label.scale_pixmap_to_label(pixmap)
+            self.image_label.show_thumbnail(self.thumbnails[index])
+            self.prefetch_neighbors(index)
 
             if self.current_thumbnail_box:
                 metadata_extractor = (
@@ -124,6 +125,32 @@ class DictionaryPreviewArea(QWidget):
                     self.thumbnails[index]
                 )
 
+    def prefetch_neighbors(self, index: int):
+        """
+        Decode, in the background, what's likely to be shown next: the
+        variations either side of `index`, here and in the selected box, and
+        the first variation of the next few words in the browser.
+        """
+        thumbnail_cache = self.main_widget.thumbnail_cache
+        get_target_width = self.image_label.get_target_width
+        if len(self.thumbnails) > 1:
+            for step in (1, -1):
+                path = self.thumbnails[(index + step) % len(self.thumbnails)]
+                thumbnail_cache.prefetch(path, get_target_width(path))
+        if self.current_thumbnail_box:
+            self.current_thumbnail_box.image_label.prefetch_neighbors(index)
+            for path in self._get_upcoming_word_thumbnails():
+                thumbnail_cache.prefetch(path, get_target_width(path))
+
+    def _get_upcoming_word_thumbnails(self) -> list[str]:
+        sequences = self.dictionary_widget.browser.currently_displayed_sequences
+        word = self.current_thumbnail_box.word
+        for position, (displayed_word, _, _) in enumerate(sequences):
+            if displayed_word == word:
+                upcoming = sequences[position + 1 : position + 1 + self.PREFETCH_WORDS]
+                return [thumbnails[0] for _, thumbnails, _ in upcoming if thumbnails]
+        return []
+
     def select_thumbnail(self, thumbnail_box, index, word):
         self.current_index = index
         self.current_thumbnail_box = thumbnail_box
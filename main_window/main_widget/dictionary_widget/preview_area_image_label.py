@@ -17,6 +17,10 @@ class PreviewAreaImageLabel(QLabel):
         self.thumbnails = preview_area.thumbnails
         self.current_index = preview_area.current_index
         self.metadata_extractor = preview_area.main_widget.metadata_extractor
+        self.dictionary_index = preview_area.main_widget.dictionary_index
+        self.thumbnail_cache = preview_area.main_widget.thumbnail_cache
+        self.thumbnail_cache.thumbnail_ready.connect(self._on_thumbnail_ready)
+        self.current_path: str = None
         self.browser = preview_area.dictionary_widget.browser
         self.is_selected = False
         self.setStyleSheet("border: 3px solid black;")
@@ -27,25 +31,29 @@ class PreviewAreaImageLabel(QLabel):
     def update_thumbnail(self):
         self.thumbnails = self.preview_area.thumbnails
         if self.thumbnails:
-            pixmap = QPixmap(self.thumbnails[self.preview_area.current_index])
-            self.set_pixmap_to_fit(pixmap)
+            self.show_thumbnail(self.thumbnails[self.preview_area.current_index])
         else:
+            self.current_path = None
             self.setText("No image available")
 
-    def set_pixmap_to_fit(self, pixmap: QPixmap):
-        current_index = self.preview_area.current_index
-        sequence_length = self.metadata_extractor.get_sequence_length(
-            self.thumbnails[current_index]
-        )
-        if sequence_length == 1:
-            target_width = int(self.preview_area.width() * 0.6)
-        else:
-            target_width = int(self.preview_area.width() * 0.9)
+    def show_thumbnail(self, path: str):
+        """Show `path` from the thumbnail cache; if it isn't decoded yet, it appears once it is."""
+        self.current_path = path
+        pixmap = self.thumbnail_cache.get_pixmap(path, self.get_target_width(path))
+        if pixmap is not None:
+            self.scale_pixmap_to_label(pixmap)
 
-        scaled_pixmap = pixmap.scaledToWidth(
-            target_width, Qt.TransformationMode.SmoothTransformation
-        )
-        self.setPixmap(scaled_pixmap)
+    def _on_thumbnail_ready(self, path: str):
+        if path == self.current_path:
+            self.show_thumbnail(path)
+
+    def get_target_width(self, path: str) -> int:
+        sequence_length = self.dictionary_index.get_sequence_length(path)
+        if sequence_length is None:
+            sequence_length = self.metadata_extractor.get_sequence_length(path)
+        if sequence_length == 1:
+            return int(self.preview_area.width() * 0.6)
+        return int(self.preview_area.width() * 0.9)
 
     def show_placeholder(self):
         self.setText("Select a sequence to display it here.")
@@ -68,7 +76,7 @@ class PreviewAreaImageLabel(QLabel):
         self.setMinimumHeight(min_height)
 
     def scale_pixmap_to_label(self, pixmap: QPixmap):
-        label_width = int(self.preview_area.width() * 0.9)
+        label_width = self.get_target_width(self.current_path)
         aspect_ratio = pixmap.height() / pixmap.width()
         new_height = int(label_width * aspect_ratio)
         if new_height > self.preview_area.height() * 0.7:
@@ -153,7 +153,7 @@ class TempBeatFrame(BaseBeatFrame):
         if self.sequence_builder.manual_builder.start_pos_picker.isVisible():
             self.sequence_builder.manual_builder.transition_to_sequence_building()
 
-        sequence = self.json_manager.loader_saver.load_current_sequence_json()
+        sequence = self.json_manager.loader_saver.get_current_sequence()
 
         scroll_area = self.sequence_builder.manual_builder.option_picker.scroll_area
         scroll_area.remove_irrelevant_pictographs()
@@ -1,13 +1,15 @@
 import os
 import re
 import json
-from PIL import Image
 
 from utilities.path_helpers import get_images_and_data_path
+from utilities.png_text_chunks import read_text_chunk
 
 class VariationNumberFixer:
     def __init__(self):
         self.base_folder = get_images_and_data_path("dictionary")
+        # Original path -> current path of every file renamed by the current run.
+        self.renames: dict[str, str] = {}
 
     def get_version_number(self, name):
         """
@@ -25,16 +27,34 @@ class VariationNumberFixer:
         if os.path.exists(new_path):
             raise FileExistsError(f"Cannot rename {old_path} to {new_path}: destination already exists")
         os.rename(old_path, new_path)
+        self.record_rename(old_path, new_path)
+
+    def record_rename(self, old_path, new_path):
+        """
+        Remember where each file ended up, following it through a folder
+        rename and any rename of the file itself afterwards.
+        """
+        if os.path.isdir(new_path):
+            moved = [
+                (os.path.join(old_path, os.path.relpath(path, new_path)), path)
+                for root, _, files in os.walk(new_path)
+                for path in (os.path.join(root, name) for name in files)
+            ]
+        else:
+            moved = [(old_path, new_path)]
+        current_to_original = {current: original for original, current in self.renames.items()}
+        for old, new in moved:
+            original = current_to_original.get(old, old)
+            self.renames[original] = new
 
     def extract_metadata_from_file(self, file_path):
         """
         Extract metadata from a file.
         """
         try:
-            with Image.open(file_path) as img:
-                metadata = img.info.get("metadata")
-                if metadata:
-                    return json.loads(metadata)
+            metadata = read_text_chunk(file_path, "metadata")
+            if metadata:
+                return json.loads(metadata)
         except Exception as e:
             print(f"Error loading sequence from thumbnail: {e}")
         return None
@@ -50,11 +70,14 @@ class VariationNumberFixer:
                     return start_ori
         return None
 
-    def ensure_sequential_versions(self):
+    def ensure_sequential_versions(self, folder=None):
         """
-        Ensure that all versions are sequential starting from 1.
+        Ensure that all versions are sequential starting from 1, under `folder`
+        (the whole dictionary by default). Returns original path -> new path
+        for every file that was renamed.
         """
-        for root, dirs, files in os.walk(self.base_folder, topdown=False):
+        self.renames = {}
+        for root, dirs, files in os.walk(folder or self.base_folder, topdown=False):
             # Handle folders
             versioned_dirs = [d for d in dirs if '_ver' in d]
             versioned_dirs.sort(key=self.get_version_number)
@@ -101,6 +124,7 @@ class VariationNumberFixer:
                     new_file_path = os.path.join(root, new_file_name)
                     if old_file_path != new_file_path:  # Avoid renaming to the same path
                         self.rename_version(old_file_path, new_file_path)
+        return {old: new for old, new in self.renames.items() if old != new}
 
     def main(self):
         self.ensure_sequential_versions()
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, Optional
 
 from data.constants import BOX, DIAMOND
 
@@ -6,6 +6,57 @@ from data.constants import BOX, DIAMOND
 if TYPE_CHECKING:
     from main_window.main_widget.main_widget import MainWidget
 
+DIAMOND_MODE_POSITIONS = (
+    "alpha1",
+    "alpha3",
+    "alpha5",
+    "alpha7",
+    "beta1",
+    "beta3",
+    "beta5",
+    "beta7",
+    "gamma1",
+    "gamma3",
+    "gamma5",
+    "gamma7",
+    "gamma9",
+    "gamma11",
+    "gamma13",
+    "gamma15",
+)
+BOX_MODE_POSITIONS = (
+    "alpha2",
+    "alpha4",
+    "alpha6",
+    "alpha8",
+    "beta2",
+    "beta4",
+    "beta6",
+    "beta8",
+    "gamma2",
+    "gamma4",
+    "gamma6",
+    "gamma8",
+    "gamma10",
+    "gamma12",
+    "gamma14",
+    "gamma16",
+)
+_GRID_MODE_BY_POSITION = {
+    **{position: DIAMOND for position in DIAMOND_MODE_POSITIONS},
+    **{position: BOX for position in BOX_MODE_POSITIONS},
+}
+
+
+def get_grid_mode_for_positions(
+    start_pos: str, end_pos: str
+) -> Optional[Literal["box", "diamond", "skewed"]]:
+    start_mode = _GRID_MODE_BY_POSITION.get(start_pos)
+    end_mode = _GRID_MODE_BY_POSITION.get(end_pos)
+    if start_mode is None or end_mode is None:
+        return None
+    return start_mode if start_mode == end_mode else "skewed"
+
 
 class GridModeChecker:
     """Checks what grid a given pictograph is in by looking at its start and end positions"""
@@ -14,67 +65,15 @@ class GridModeChecker:
     def get_grid_mode(
         self, pictograph_dict
     ) -> None | Literal["box"] | Literal["diamond"]:
-        box_mode_positions = self.get_box_mode_positions()
-        diamond_mode_positions = self.get_diamond_mode_positions()
-
-        if (
-            pictograph_dict["start_pos"] in box_mode_positions
-            and pictograph_dict["end_pos"] in box_mode_positions
-        ):
-            return BOX
-        elif (
-            pictograph_dict["start_pos"] in diamond_mode_positions
-            and pictograph_dict["end_pos"] in diamond_mode_positions
-        ):
-            return DIAMOND
-
-        elif (
-            pictograph_dict["start_pos"] in box_mode_positions
-            and pictograph_dict["end_pos"] in diamond_mode_positions
-        ) or (
-            pictograph_dict["start_pos"] in diamond_mode_positions
-            and pictograph_dict["end_pos"] in box_mode_positions
-        ):
-            return "skewed"
+        if not isinstance(pictograph_dict, dict):
+            # Records from the pictograph dataset know their grid mode already.
+            return pictograph_dict.grid_mode
+        return get_grid_mode_for_positions(
+            pictograph_dict["start_pos"], pictograph_dict["end_pos"]
+        )
 
     def get_diamond_mode_positions(self):
-        positions = [
-            "alpha1",
-            "alpha3",
-            "alpha5",
-            "alpha7",
-            "beta1",
-            "beta3",
-            "beta5",
-            "beta7",
-            "gamma1",
-            "gamma3",
-            "gamma5",
-            "gamma7",
-            "gamma9",
-            "gamma11",
-            "gamma13",
-            "gamma15",
-        ]
-        return positions
+        return list(DIAMOND_MODE_POSITIONS)
 
     def get_box_mode_positions(self):
-        positions = [
-            "alpha2",
-            "alpha4",
-            "alpha6",
-            "alpha8",
-            "beta2",
-            "beta4",
-            "beta6",
-            "beta8",
-            "gamma2",
-            "gamma4",
-            "gamma6",
-            "gamma8",
-            "gamma10",
-            "gamma12",
-            "gamma14",
-            "gamma16",
-        ]
-        return positions
+        return list(BOX_MODE_POSITIONS)
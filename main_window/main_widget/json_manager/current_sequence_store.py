@@ -0,0 +1,165 @@
+import json
+import logging
+import os
+from copy import deepcopy
+from typing import Optional
+
+from PyQt6.QtCore import QTimer
+
+
+class CurrentSequenceStore:
+    """
+    Authoritative in-memory copy of current_sequence.json.
+
+    Every commit appends the entries that changed since the last one to a
+    compact journal next to the sequence file, and the pretty-printed file
+    itself is only rewritten once the user has been idle for FLUSH_DELAY_MS
+    (or when the app closes). If the app dies before a flush, the journal is
+    replayed on top of the file on the next load.
+    """
+
+    FLUSH_DELAY_MS = 750
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+        self.journal_path = f"{file_path}.journal"
+        self.logger = logging.getLogger(__name__)
+        self.sequence: Optional[list[dict]] = None
+        # What the file plus the journal add up to, to diff the next commit against.
+        self.journaled: list[dict] = []
+        self.dirty = False
+
+        self.flush_timer = QTimer()
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(self.FLUSH_DELAY_MS)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def get(self) -> Optional[list[dict]]:
+        """Return the live sequence, reading it from disk on first access."""
+        if self.sequence is None:
+            self.sequence = self._read_from_disk()
+        return self.sequence
+
+    def stage(self, sequence: list[dict]) -> None:
+        """Make `sequence` the live sequence without committing it; the next commit writes it."""
+        self.sequence = sequence
+
+    def commit(self, sequence: list[dict]) -> None:
+        """Make `sequence` the current sequence and schedule a write-behind flush."""
+        self.sequence = sequence
+        self.dirty = True
+        self._append_to_journal(sequence)
+        self.flush_timer.start()
+
+    def flush(self) -> None:
+        """Atomically write the in-memory sequence to disk and reset the journal."""
+        self.flush_timer.stop()
+        if not self.dirty or self.sequence is None:
+            return
+
+        temp_path = f"{self.file_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(self.sequence, file, indent=4, ensure_ascii=False)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.file_path)
+
+        self.dirty = False
+        self._clear_journal()
+        self.journaled = deepcopy(self.sequence)
+
+    def _read_from_disk(self) -> Optional[list[dict]]:
+        sequence = self._read_sequence_file()
+        changes = self._read_journal()
+        self.journaled = deepcopy(sequence) if sequence else []
+        if not changes:
+            # Nothing usable to replay; don't let later changes pile up behind it.
+            self._clear_journal()
+            return sequence
+
+        self.logger.info("Recovered current sequence from unflushed journal.")
+        sequence = list(sequence or [])
+        for change in changes:
+            self._apply_change(sequence, change)
+        # Write the recovered sequence out right away, which also starts a fresh journal.
+        self.sequence = sequence
+        self.dirty = True
+        self.flush()
+        return sequence
+
+    def _read_sequence_file(self) -> Optional[list[dict]]:
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as file:
+                content = file.read().strip()
+        except FileNotFoundError:
+            return None
+        if not content:
+            return None
+        try:
+            sequence = json.loads(content)
+        except json.JSONDecodeError:
+            return None
+        return sequence if sequence and isinstance(sequence, list) else None
+
+    def _read_journal(self) -> list[dict]:
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as journal:
+                lines = journal.read().splitlines()
+        except FileNotFoundError:
+            return []
+
+        # Each change builds on the ones before it, so a torn line (from a
+        # crash mid-write) ends the usable part of the journal.
+        changes = []
+        for line in lines:
+            try:
+                change = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            if not isinstance(change, dict) or "length" not in change:
+                break
+            changes.append(change)
+        return changes
+
+    @staticmethod
+    def _apply_change(sequence: list[dict], change: dict) -> None:
+        del sequence[change["length"] :]
+        for index, entry in change["entries"].items():
+            index = int(index)
+            if index < len(sequence):
+                sequence[index] = entry
+            else:
+                sequence.append(entry)
+
+    def _append_to_journal(self, sequence: list[dict]) -> None:
+        """Journal only the entries that differ from what's already on disk or journaled."""
+        entries = {
+            index: entry
+            for index, entry in enumerate(sequence)
+            if index >= len(self.journaled) or entry != self.journaled[index]
+        }
+        if not entries and len(sequence) == len(self.journaled):
+            return
+        change = {"length": len(sequence), "entries": entries}
+        try:
+            with open(self.journal_path, "a", encoding="utf-8") as journal:
+                journal.write(
+                    json.dumps(change, ensure_ascii=False, separators=(",", ":"))
+                )
+                journal.write("\n")
+        except OSError as e:
+            # Leave self.journaled as it was, so the next change carries these entries too.
+            self.logger.warning(f"Could not append to sequence journal: {e}")
+            return
+        del self.journaled[len(sequence) :]
+        for index, entry in entries.items():
+            if index < len(self.journaled):
+                self.journaled[index] = deepcopy(entry)
+            else:
+                self.journaled.append(deepcopy(entry))
+
+    def _clear_journal(self) -> None:
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 from data.constants import (
     ANTI,
+    BLUE,
     CCW_HANDPATH,
     CLOCK,
     CLOCKWISE,
@@ -8,10 +9,21 @@ from data.constants import (
     COUNTER_CLOCKWISE,
     CW_HANDPATH,
     DASH,
+    EAST,
+    FLOAT,
     IN,
+    NO_ROT,
+    NORTH,
+    NORTHEAST,
+    NORTHWEST,
     OUT,
     PRO,
+    RED,
+    SOUTH,
+    SOUTHEAST,
+    SOUTHWEST,
     STATIC,
+    WEST,
 )
 from objects.motion.managers.handpath_calculator import HandpathCalculator
 
@@ -20,11 +32,30 @@ if TYPE_CHECKING:
 
 
 class JsonOriCalculator:
-    def __init__(self, json_manager: "JsonManager"):
-        self.main_widget = json_manager.main_widget
+    def __init__(self, json_manager: "JsonManager" = None):
+        self.main_widget = json_manager.main_widget if json_manager else None
         self.handpath_calculator = HandpathCalculator()
 
     def calculate_end_orientation(self, pictograph_dict, color: str):
+        attributes = pictograph_dict[f"{color}_attributes"]
+        motion_type = attributes["motion_type"]
+        turns = attributes["turns"]
+        if turns != "fl":
+            turns = float(turns)
+        if motion_type == FLOAT or turns == "fl":
+            end_ori = FLOAT_END_ORIS.get(
+                (attributes["start_ori"], attributes["start_loc"], attributes["end_loc"])
+            )
+        else:
+            end_ori = TURN_END_ORIS.get(
+                (motion_type, turns, attributes["start_ori"], attributes["prop_rot_dir"])
+            )
+        if end_ori is not None:
+            return end_ori
+        return self.calculate_end_orientation_uncached(pictograph_dict, color)
+
+    def calculate_end_orientation_uncached(self, pictograph_dict, color: str):
+        """Work the end orientation out from the rules the lookup tables are built from."""
         motion_type = pictograph_dict[f"{color}_attributes"]["motion_type"]
         if (pictograph_dict[f"{color}_attributes"]["turns"]) != "fl":
             turns = float(pictograph_dict[f"{color}_attributes"]["turns"])
@@ -45,6 +76,28 @@ class JsonOriCalculator:
                 motion_type, turns, start_ori, prop_rot_dir, start_loc, end_loc
             )
 
+    def orient_sequence(self, sequence: list[dict]) -> None:
+        """
+        Carry orientations through a whole sequence in place.
+
+        Each beat starts where the previous beat (skipping placeholders) ended
+        and gets its end orientation recalculated. The header and start
+        position entries are left as they are.
+        """
+        if len(sequence) < 2:
+            return
+        previous = sequence[1]
+        for pictograph_dict in sequence[2:]:
+            if pictograph_dict.get("is_placeholder", False):
+                continue
+            for color in (RED, BLUE):
+                attributes = pictograph_dict[f"{color}_attributes"]
+                attributes["start_ori"] = previous[f"{color}_attributes"]["end_ori"]
+                attributes["end_ori"] = self.calculate_end_orientation(
+                    pictograph_dict, color
+                )
+            previous = pictograph_dict
+
     def calculate_turn_orientation(
         self, motion_type, turns, start_ori, prop_rot_dir, start_loc, end_loc
     ):
@@ -125,3 +178,50 @@ class JsonOriCalculator:
             COUNTER: CLOCK,
         }
         return switch_map.get(ori, ori)
+
+
+TURNS = (0, 0.5, 1, 1.5, 2, 2.5, 3)
+ORIENTATIONS = (IN, OUT, CLOCK, COUNTER)
+PROP_ROT_DIRS = (CLOCKWISE, COUNTER_CLOCKWISE, NO_ROT)
+LOCATIONS = (NORTH, EAST, SOUTH, WEST, NORTHEAST, SOUTHEAST, SOUTHWEST, NORTHWEST)
+
+
+def _build_turn_end_oris() -> dict[tuple, str]:
+    """(motion_type, turns, start_ori, prop_rot_dir) -> end_ori for turning motions."""
+    calculator = JsonOriCalculator()
+    table = {}
+    for motion_type in (PRO, ANTI, STATIC, DASH):
+        for turns in TURNS:
+            for start_ori in ORIENTATIONS:
+                for prop_rot_dir in PROP_ROT_DIRS:
+                    end_ori = calculator.calculate_turn_orientation(
+                        motion_type, turns, start_ori, prop_rot_dir, None, None
+                    )
+                    if end_ori is not None:
+                        table[(motion_type, turns, start_ori, prop_rot_dir)] = end_ori
+    return table
+
+
+def _build_float_end_oris() -> dict[tuple, str]:
+    """
+    (start_ori, start_loc, end_loc) -> end_ori for floats. Only pairs with a
+    clockwise or counter-clockwise handpath are listed; anything else keeps
+    its start orientation.
+    """
+    calculator = JsonOriCalculator()
+    handpath_calculator = HandpathCalculator()
+    table = {}
+    for start_loc in LOCATIONS:
+        for end_loc in LOCATIONS:
+            handpath = handpath_calculator.get_hand_rot_dir(start_loc, end_loc)
+            if handpath not in (CW_HANDPATH, CCW_HANDPATH):
+                continue
+            for start_ori in ORIENTATIONS:
+                table[(start_ori, start_loc, end_loc)] = (
+                    calculator.calculate_float_orientation(start_ori, handpath)
+                )
+    return table
+
+
+TURN_END_ORIS = _build_turn_end_oris()
+FLOAT_END_ORIS = _build_float_end_oris()
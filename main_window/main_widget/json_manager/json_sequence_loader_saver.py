@@ -1,7 +1,8 @@
-import json
+from copy import deepcopy
 from typing import TYPE_CHECKING, List, Dict
 from utilities.path_helpers import get_user_editable_resource_path
 from utilities.word_simplifier import WordSimplifier
+from .current_sequence_store import CurrentSequenceStore
 
 if TYPE_CHECKING:
     from main_window.main_widget.json_manager.json_manager import JsonManager
@@ -14,21 +15,19 @@ class JsonSequenceLoaderSaver:
             "current_sequence.json"
         )
 
-    def load_current_sequence_json(self) -> List[Dict]:
-        try:
-            with open(self.current_sequence_json, "r", encoding="utf-8") as file:
-                content = file.read().strip()
-                if not content:
-                    return self.get_default_sequence()
-
-                sequence = json.loads(content)
-                if not sequence or not isinstance(sequence, list):
-                    return self.get_default_sequence()
+        self.store = CurrentSequenceStore(self.current_sequence_json)
 
-            return sequence
+    def get_current_sequence(self) -> List[Dict]:
+        """Return the live in-memory sequence. Mutate it, then pass it to save_current_sequence."""
+        sequence = self.store.get()
+        if not sequence:
+            sequence = self.get_default_sequence()
+            self.store.sequence = sequence
+        return sequence
 
-        except (FileNotFoundError, json.JSONDecodeError):
-            return self.get_default_sequence()
+    def load_current_sequence_json(self) -> List[Dict]:
+        """Return a private copy of the current sequence that callers are free to modify."""
+        return deepcopy(self.get_current_sequence())
 
     def get_default_sequence(self) -> List[Dict]:
         """Return a default sequence if JSON is missing, empty, or invalid."""
@@ -88,26 +87,32 @@ class JsonSequenceLoaderSaver:
                 sequence[sequence.index(beat)] = beat_dict_with_beat_number
                 beat_number += 1
 
-        with open(self.current_sequence_json, "w", encoding="utf-8") as file:
-            json.dump(sequence, file, indent=4, ensure_ascii=False)
+        self.store.commit(sequence)
+
+    def stage_current_sequence(self, sequence: List[Dict]) -> None:
+        """Replace the live sequence without saving it. Finish with save_current_sequence."""
+        self.store.stage(sequence)
+
+    def flush(self) -> None:
+        self.store.flush()
 
     def clear_current_sequence_file(self):
         self.save_current_sequence([])
 
     def get_prop_rot_dir_from_json(self, index: int, color: str) -> int:
-        sequence = self.load_current_sequence_json()
+        sequence = self.get_current_sequence()
         if sequence:
             return sequence[index][f"{color}_attributes"].get("prop_rot_dir", 0)
         return 0
 
     def get_motion_type_from_json_at_index(self, index: int, color: str) -> int:
-        sequence = self.load_current_sequence_json()
+        sequence = self.get_current_sequence()
         if sequence:
             return sequence[index][f"{color}_attributes"].get("motion_type", 0)
         return 0
 
     def get_prefloat_prop_rot_dir_from_json(self, index: int, color: str) -> int:
-        sequence = self.load_current_sequence_json()
+        sequence = self.get_current_sequence()
         if sequence:
             return sequence[index][f"{color}_attributes"].get(
                 "prefloat_prop_rot_dir", ""
@@ -117,7 +122,7 @@ class JsonSequenceLoaderSaver:
     def get_prefloat_motion_type_from_json_at_index(
         self, index: int, color: str
     ) -> int:
-        sequence = self.load_current_sequence_json()
+        sequence = self.get_current_sequence()
         if sequence:
             return sequence[index][f"{color}_attributes"].get(
                 "prefloat_motion_type",
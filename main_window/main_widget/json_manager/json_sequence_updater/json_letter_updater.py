@@ -12,6 +12,6 @@ class JsonLetterUpdater:
         self.json_manager = json_updater.json_manager
 
     def update_letter_in_json_at_index(self, index: int, letter: str) -> None:
-        sequence = self.json_manager.loader_saver.load_current_sequence_json()
+        sequence = self.json_manager.loader_saver.get_current_sequence()
         sequence[index]["letter"] = letter
         self.json_manager.loader_saver.save_current_sequence(sequence)
@@ -18,7 +18,7 @@ class JsonMotionTypeUpdater:
     def update_motion_type_in_json_at_index(
         self, index: int, color: str, motion_type: str
     ) -> None:
-        sequence = self.json_manager.loader_saver.load_current_sequence_json()
+        sequence = self.json_manager.loader_saver.get_current_sequence()
         sequence[index][f"{color}_attributes"]["motion_type"] = motion_type
         if sequence[index][f"{color}_attributes"]["turns"] != "fl":
             if "prefloat_motion_type" in sequence[index][f"{color}_attributes"]:
@@ -28,6 +28,6 @@ class JsonMotionTypeUpdater:
     def update_prefloat_motion_type_in_json(
         self, index: int, color: str, motion_type: str
     ) -> None:
-        sequence = self.json_manager.loader_saver.load_current_sequence_json()
+        sequence = self.json_manager.loader_saver.get_current_sequence()
         sequence[index][f"{color}_attributes"]["prefloat_motion_type"] = motion_type
         self.json_manager.loader_saver.save_current_sequence(sequence)
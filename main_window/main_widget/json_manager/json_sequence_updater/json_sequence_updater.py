@@ -1,3 +1,4 @@
+from copy import deepcopy
 from typing import TYPE_CHECKING
 from Enums.PropTypes import PropType
 from .json_duration_updater import JsonDurationUpdater
@@ -25,12 +26,14 @@ class JsonSequenceUpdater:
         self.prop_rot_dir_updater = JsonPropRotDirUpdater(self)
         self.duration_updater = JsonDurationUpdater(self)
 
-    def update_current_sequence_file_with_beat(self, beat_view: BeatView):
-        sequence_data = self.json_manager.loader_saver.load_current_sequence_json()
+    def update_current_sequence_file_with_beat(
+        self, beat_view: BeatView, save: bool = True
+    ):
+        sequence_data = self.json_manager.loader_saver.get_current_sequence()
         sequence_metadata = sequence_data[0] if "word" in sequence_data[0] else {}
         sequence_beats = sequence_data[1:]
 
-        beat_data = beat_view.beat.pictograph_dict.copy()
+        beat_data = deepcopy(beat_view.beat.pictograph_dict)
         beat_data["duration"] = beat_view.beat.duration
         number = self.get_next_beat_number(sequence_beats)
         beat_view.number = number
@@ -51,7 +54,10 @@ class JsonSequenceUpdater:
         sequence_beats.sort(key=lambda entry: entry.get("beat", float("inf")))
         sequence_data = [sequence_metadata] + sequence_beats
 
-        self.json_manager.loader_saver.save_current_sequence(sequence_data)
+        if save:
+            self.json_manager.loader_saver.save_current_sequence(sequence_data)
+        else:
+            self.json_manager.loader_saver.stage_current_sequence(sequence_data)
 
     def get_next_beat_number(self, sequence_beats):
         if not sequence_beats:
@@ -61,7 +67,7 @@ class JsonSequenceUpdater:
     def add_placeholder_entry_to_current_sequence(
         self, beat_num: int, parent_beat: int
     ):
-        sequence_data = self.json_manager.loader_saver.load_current_sequence_json()
+        sequence_data = self.json_manager.loader_saver.get_current_sequence()
         sequence_metadata = sequence_data[0] if "word" in sequence_data[0] else {}
         sequence_beats = sequence_data[1:]
 
@@ -12,12 +12,7 @@ class JsonSequenceValidationEngine:
 
     def validate_and_update_json_orientations(self, is_current_sequence=False) -> None:
         """Iterates through the sequence, updating start and end orientations to ensure continuity."""
-        for index, _ in enumerate(self.sequence):
-            if index > 1:
-                if self.sequence[index].get("is_placeholder", False):
-                    continue
-                self.update_json_entry_start_orientation(index)
-                self.update_json_entry_end_orientation(index)
+        self.ori_calculator.orient_sequence(self.sequence)
 
         if is_current_sequence:
             self.json_manager.loader_saver.save_current_sequence(self.sequence)
@@ -54,12 +49,12 @@ class JsonSequenceValidationEngine:
     def run(self, is_current_sequence=False) -> None:
         """Public method to run the sequence validation and update process."""
         if is_current_sequence:
-            self.sequence = self.json_manager.loader_saver.load_current_sequence_json()
+            self.sequence = self.json_manager.loader_saver.get_current_sequence()
         self.validate_and_update_json_orientations(is_current_sequence)
 
     def validate_last_pictograph(self) -> None:
         """Validates the most recently added pictograph dict."""
-        self.sequence = self.json_manager.loader_saver.load_current_sequence_json()
+        self.sequence = self.json_manager.loader_saver.get_current_sequence()
         self.update_json_entry_start_orientation(-1)
         self.update_json_entry_end_orientation(-1)
         self.json_manager.loader_saver.save_current_sequence(self.sequence)
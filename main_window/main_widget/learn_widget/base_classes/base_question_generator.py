@@ -4,6 +4,7 @@ from Enums.letters import Letter
 
 
 if TYPE_CHECKING:
+    from main_window.main_widget.pictograph_record import PictographRecord
     from main_window.main_widget.learn_widget.base_classes.base_lesson_widget.base_lesson_widget import (
         BaseLessonWidget,
     )
@@ -15,18 +16,15 @@ class BaseQuestionGenerator:
     def __init__(self, lesson_widget: "BaseLessonWidget"):
         self.main_widget = lesson_widget.main_widget
 
-    def filter_pictograph_dicts_by_grid_mode(self) -> dict[Letter, list[dict]]:
+    def filter_pictograph_dicts_by_grid_mode(self) -> dict[Letter, list["PictographRecord"]]:
         """Filter pictograph dicts by grid mode."""
-        valid_dicts: dict[Letter, list[dict]] = {}
+        valid_dicts: dict[Letter, list["PictographRecord"]] = {}
         grid_mode = self.main_widget.settings_manager.global_settings.get_grid_mode()
         for letter in self.main_widget.pictograph_dicts:
             valid_dicts.setdefault(letter, [])
-            for pictograph_dict in self.main_widget.pictograph_dicts[letter]:
-                if (
-                    self.main_widget.grid_mode_checker.get_grid_mode(pictograph_dict)
-                    == grid_mode
-                ):
-                    valid_dicts[letter].append(pictograph_dict)
+            for record in self.main_widget.pictograph_dicts[letter]:
+                if record.grid_mode == grid_mode:
+                    valid_dicts[letter].append(record)
         return valid_dicts
 
     def generate_question(self):
@@ -8,6 +8,7 @@ from main_window.main_widget.learn_widget.base_classes.base_question_generator i
 
 
 if TYPE_CHECKING:
+    from main_window.main_widget.pictograph_record import PictographRecord
     from .lesson_1_widget import Lesson1Widget
 
 
@@ -26,7 +27,9 @@ class Lesson1QuestionGenerator(BaseQuestionGenerator):
 
         pictograph_dicts = self.filter_pictograph_dicts_by_grid_mode()
 
-        correct_pictograph_dict = random.choice(pictograph_dicts[correct_answer])
+        correct_pictograph_dict = random.choice(
+            pictograph_dicts[correct_answer]
+        ).to_dict()
 
         wrong_answers = self.generate_wrong_answers(correct_answer)
         self.lesson_1_widget.question_widget.load_pictograph(correct_pictograph_dict)
@@ -38,18 +41,15 @@ class Lesson1QuestionGenerator(BaseQuestionGenerator):
             letters, correct_answer.value, self.lesson_1_widget.check_answer
         )
 
-    def filter_pictograph_dicts_by_grid_mode(self) -> dict[Letter, list[dict]]:
+    def filter_pictograph_dicts_by_grid_mode(self) -> dict[Letter, list["PictographRecord"]]:
         """Filter pictograph dicts by grid mode."""
-        valid_dicts: dict[Letter, list[dict]] = {}
+        valid_dicts: dict[Letter, list["PictographRecord"]] = {}
         grid_mode = self.main_widget.settings_manager.global_settings.get_grid_mode()
         for letter in self.main_widget.pictograph_dicts:
             valid_dicts.setdefault(letter, [])
-            for pictograph_dict in self.main_widget.pictograph_dicts[letter]:
-                if (
-                    self.main_widget.grid_mode_checker.get_grid_mode(pictograph_dict)
-                    == grid_mode
-                ):
-                    valid_dicts[letter].append(pictograph_dict)
+            for record in self.main_widget.pictograph_dicts[letter]:
+                if record.grid_mode == grid_mode:
+                    valid_dicts[letter].append(record)
         return valid_dicts
 
     def generate_correct_answer(self) -> Letter:
@@ -41,7 +41,9 @@ class Lesson2QuestionGenerator(BaseQuestionGenerator):
 
         correct_letter = random.choice(available_letters)
         pictograph_dicts = self.filter_pictograph_dicts_by_grid_mode()
-        correct_pictograph = random.choice(pictograph_dicts[correct_letter])
+        correct_pictograph = random.choice(
+            pictograph_dicts[correct_letter]
+        ).to_dict()
 
         # Update the previous letter to the current one
         self.previous_letter = correct_letter
@@ -84,7 +86,7 @@ class Lesson2QuestionGenerator(BaseQuestionGenerator):
         """Choose a random letter and a corresponding pictograph."""
         letter = random.choice(available_letters)
         pictograph_dicts = self.filter_pictograph_dicts_by_grid_mode()
-        pictograph_dict = random.choice(pictograph_dicts[letter])
+        pictograph_dict = random.choice(pictograph_dicts[letter]).to_dict()
         return letter, pictograph_dict
 
     def _is_duplicate_pictograph(self, letter: str, pictograph_dict: dict) -> bool:
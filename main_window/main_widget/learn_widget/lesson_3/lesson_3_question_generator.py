@@ -50,7 +50,7 @@ class Lesson3QuestionGenerator(BaseQuestionGenerator):
             if pictograph["start_pos"] == pictograph["end_pos"]
         ]
         letter = random.choice(available_letters)
-        return random.choice(pictograph_dicts[letter])
+        return random.choice(pictograph_dicts[letter]).to_dict()
 
     def generate_correct_answer(self, initial_pictograph: dict) -> dict:
         """Generate a valid pictograph that can follow the initial pictograph."""
@@ -72,7 +72,8 @@ class Lesson3QuestionGenerator(BaseQuestionGenerator):
             if pictograph["start_pos"] != pictograph["end_pos"]
         ]
 
-        correct_answer = random.choice(valid_pictographs)
+        # The dataset's records are shared, so orient a copy.
+        correct_answer = random.choice(valid_pictographs).to_dict()
         self._update_orientations_to_be_accurate(initial_pictograph, correct_answer)
 
         return correct_answer
@@ -102,7 +103,7 @@ class Lesson3QuestionGenerator(BaseQuestionGenerator):
             letter = random.choice(list(self.main_widget.pictograph_dicts.keys()))
             random_pictograph = random.choice(pictograph_dicts[letter])
             if random_pictograph["start_pos"] != random_pictograph["end_pos"]:
-                return random_pictograph
+                return random_pictograph.to_dict()
 
     def generate_wrong_answers(self, correct_pictograph: dict) -> list[dict]:
         """Generate three random wrong pictographs that don't match the correct condition."""
@@ -12,6 +12,7 @@ from .grid_mode_checker import GridModeChecker
 from .learn_widget.learn_widget import LearnWidget
 from .top_builder_widget.sequence_widget.sequence_widget import SequenceWidget
 from .pcitograph_dict_loader import PictographDictLoader
+from .pictograph_record import PictographRecord
 from .sequence_properties_manager.sequence_properties_manager import (
     SequencePropertiesManager,
 )
@@ -23,6 +24,9 @@ from utilities.path_helpers import get_images_and_data_path
 from styles.main_widget_tab_bar_styler import MainWidgetTabBarStyler
 from .dictionary_widget.dictionary_widget import DictionaryWidget
 from .metadata_extractor import MetaDataExtractor
+from .dictionary_metadata_index import DictionaryMetadataIndex
+from .dictionary_scanner import DictionaryScanner
+from .thumbnail_cache import ThumbnailCache
 from .json_manager.json_manager import JsonManager
 from .turns_tuple_generator.turns_tuple_generator import TurnsTupleGenerator
 from base_widgets.base_pictograph.base_pictograph import BasePictograph
@@ -73,6 +77,7 @@ class MainWidget(QTabWidget):
 
         self.splash_screen.update_progress(30, "Loading SVG Manager...")
         self.svg_manager = SvgManager(self)
+        self.svg_manager.cache_manager.warm_up_arrow_renderers()
 
         self.splash_screen.update_progress(40, "Loading key generators...")
         self.turns_tuple_generator = TurnsTupleGenerator()
@@ -88,6 +93,9 @@ class MainWidget(QTabWidget):
         self.sequence_level_evaluator = SequenceLevelEvaluator()
         self.sequence_properties_manager = SequencePropertiesManager(self)
         self.thumbnail_finder = ThumbnailFinder(self)
+        self.dictionary_scanner = DictionaryScanner(self)
+        self.dictionary_index = DictionaryMetadataIndex(self)
+        self.thumbnail_cache = ThumbnailCache(self)
         self.grid_mode_checker = GridModeChecker()
 
     def on_tab_changed(self, index):
@@ -178,7 +186,7 @@ class MainWidget(QTabWidget):
     def _setup_letters(self) -> None:
         self.splash_screen.update_progress(10, "Loading pictograph dictionaries...")
         self.pictograph_dict_loader = PictographDictLoader(self)
-        self.pictograph_dicts: dict[Letter, list[dict]] = (
+        self.pictograph_dicts: dict[Letter, tuple[PictographRecord, ...]] = (
             self.pictograph_dict_loader.load_all_pictograph_dicts()
         )
         self.letter_determiner = LetterDeterminer(self)
@@ -230,8 +238,9 @@ class MainWidget(QTabWidget):
 
     def save_state(self):
         self.json_manager.loader_saver.save_current_sequence(
-            self.json_manager.loader_saver.load_current_sequence_json()
+            self.json_manager.loader_saver.get_current_sequence()
         )
+        self.json_manager.loader_saver.flush()
         self.main_window.settings_manager.save_settings()
 
     def load_state(self):
@@ -1,10 +1,12 @@
-import os
 from typing import TYPE_CHECKING
-from PIL import Image, PngImagePlugin
 from PyQt6.QtWidgets import QMessageBox
 import json
 
-from utilities.path_helpers import get_images_and_data_path
+from utilities.png_text_chunks import (
+    read_text_chunk,
+    read_text_chunk_bulk,
+    write_text_chunk,
+)
 
 if TYPE_CHECKING:
     from main_window.main_widget.main_widget import MainWidget
@@ -20,16 +22,15 @@ class MetaDataExtractor:
             return None
 
         try:
-            with Image.open(file_path) as img:
-                metadata = img.info.get("metadata")
-                if metadata:
-                    return json.loads(metadata)
-                else:
-                    QMessageBox.warning(
-                        self.main_widget,
-                        "Error",
-                        "No sequence metadata found in the thumbnail.",
-                    )
+            metadata = read_text_chunk(file_path, "metadata")
+            if metadata:
+                return json.loads(metadata)
+            else:
+                QMessageBox.warning(
+                    self.main_widget,
+                    "Error",
+                    "No sequence metadata found in the thumbnail.",
+                )
         except Exception as e:
             QMessageBox.critical(
                 self.main_widget,
@@ -46,19 +47,17 @@ class MetaDataExtractor:
 
     def set_favorite_status(self, file_path: str, is_favorite: bool):
         try:
-            with Image.open(file_path) as img:
-                metadata = img.info.get("metadata")
-                if metadata:
-                    metadata_dict = json.loads(metadata)
-                else:
-                    metadata_dict = {}
-
-                metadata_dict["is_favorite"] = is_favorite
-
-                # Save the image with updated metadata
-                pnginfo = PngImagePlugin.PngInfo()
-                pnginfo.add_text("metadata", json.dumps(metadata_dict))
-                img.save(file_path, pnginfo=pnginfo)
+            metadata = read_text_chunk(file_path, "metadata")
+            if metadata:
+                metadata_dict = json.loads(metadata)
+            else:
+                metadata_dict = {}
+
+            metadata_dict["is_favorite"] = is_favorite
+
+            # Only the text chunk is rewritten; the image data is copied as is.
+            write_text_chunk(file_path, "metadata", json.dumps(metadata_dict))
+            self.main_widget.dictionary_scanner.mark_dirty(file_path)
         except Exception as e:
             QMessageBox.critical(
                 self.main_widget,
@@ -92,19 +91,22 @@ class MetaDataExtractor:
 
     def get_metadata_and_thumbnail_dict(self) -> list[dict[str, str]]:
         """Collect all sequences and their metadata along with the associated thumbnail paths."""
-        dictionary_dir = get_images_and_data_path("dictionary")
         metadata_and_thumbnail_dict = []
-
-        for word in os.listdir(dictionary_dir):
-            word_dir = os.path.join(dictionary_dir, word)
-            if os.path.isdir(word_dir) and "__pycache__" not in word:
-                thumbnails = self.main_widget.thumbnail_finder.find_thumbnails(word_dir)
-                for thumbnail in thumbnails:
-                    metadata = self.extract_metadata_from_file(thumbnail)
-                    if metadata:
-                        metadata_and_thumbnail_dict.append(
-                            {"metadata": metadata, "thumbnail": thumbnail}
-                        )
+        thumbnails = [
+            thumbnail
+            for word_thumbnails in self.main_widget.dictionary_scanner.get_word_thumbnails().values()
+            for thumbnail in word_thumbnails
+        ]
+
+        for thumbnail, metadata in read_text_chunk_bulk(thumbnails, "metadata").items():
+            try:
+                metadata = json.loads(metadata) if metadata else None
+            except json.JSONDecodeError:
+                continue
+            if metadata:
+                metadata_and_thumbnail_dict.append(
+                    {"metadata": metadata, "thumbnail": thumbnail}
+                )
 
         return metadata_and_thumbnail_dict
 
@@ -1,110 +1,239 @@
-from typing import TYPE_CHECKING
-import pandas as pd
-from Enums.letters import Letter
+import hashlib
+import logging
+import os
+import pickle
+from collections import defaultdict
+from typing import TYPE_CHECKING, Iterable, Optional
+from Enums.letters import Letter, LetterType
 from data.constants import BOX, DIAMOND, END_POS, IN, LETTER, START_POS
-from utilities.path_helpers import get_images_and_data_path
+from main_window.main_widget.pictograph_record import PictographRecord
+from utilities.path_helpers import (
+    get_images_and_data_path,
+    get_user_editable_resource_path,
+)
 
 if TYPE_CHECKING:
+    import pandas as pd
     from main_window.main_widget.main_widget import MainWidget
 
 
 class PictographDictLoader:
+    """
+    Loads every pictograph dict from the Box and Diamond CSVs.
+
+    The parsed records are pickled next to the user's settings together with
+    a hash of both CSVs, so later startups (and grid mode switches) skip
+    pandas entirely until one of the CSVs changes.
+
+    Once loaded, the whole dataset is one tuple of immutable PictographRecords
+    in letter order; the per-letter tuples and option indexes all point into
+    it, so lookups pass references around instead of copying dicts.
+    """
+
+    CACHE_FORMAT_VERSION = 2
+    CACHE_FILENAME = "pictograph_dicts.cache"
+
     def __init__(self, main_widget: "MainWidget") -> None:
         self.main_widget = main_widget
+        self.logger = logging.getLogger(__name__)
+        self.csv_paths = [
+            get_images_and_data_path("data/DiamondPictographDataframe.csv"),
+            get_images_and_data_path("data/BoxPictographDataframe.csv"),
+        ]
+        self.cache_path = get_user_editable_resource_path(self.CACHE_FILENAME)
+        self.records: tuple[PictographRecord, ...] = ()
+        self.options_by_start_pos: dict[str, tuple[PictographRecord, ...]] = {}
+        self.options_by_start_and_end_pos: dict[
+            tuple[str, str], tuple[PictographRecord, ...]
+        ] = {}
+        self.options_by_start_pos_and_letter_type: dict[
+            tuple[str, LetterType], tuple[PictographRecord, ...]
+        ] = {}
+
+    def load_all_pictograph_dicts(self) -> dict[Letter, tuple[PictographRecord, ...]]:
+        """
+        Return every pictograph record, grouped by letter. The records are
+        shared and immutable; call `to_dict()` on one to get a dict to change.
+        """
+        csv_hash = self._hash_csv_files()
+        records_by_letter = self._load_cached_records(csv_hash)
+        if records_by_letter is None:
+            records_by_letter = self._load_records_from_csv_files()
+            self._save_cached_records(csv_hash, records_by_letter)
+
+        letters = self._build_records(records_by_letter)
+        self._build_option_indexes(letters)
+        return letters
 
-    def load_all_pictograph_dicts(self) -> dict[Letter, list[dict]]:
-        # Load both Box and Diamond CSV files
-        diamond_csv_path = get_images_and_data_path(
-            "data/DiamondPictographDataframe.csv"
-        )
-        box_csv_path = get_images_and_data_path("data/BoxPictographDataframe.csv")
+    def _build_records(
+        self, records_by_letter: dict[str, list[dict]]
+    ) -> dict[Letter, tuple[PictographRecord, ...]]:
+        records = []
+        letter_ranges = {}
+        for letter_str, pictograph_dicts in records_by_letter.items():
+            letter = self.get_letter_enum_by_value(letter_str)
+            start = len(records)
+            records.extend(
+                PictographRecord.from_dict(pictograph_dict)
+                for pictograph_dict in pictograph_dicts
+            )
+            letter_ranges[letter] = (
+                start,
+                len(records),
+            )
+        self.records = tuple(records)
+        return {
+            letter: self.records[start:end]
+            for letter, (start, end) in letter_ranges.items()
+        }
+
+    ### CSV PARSING ###
 
-        # Read both CSVs and combine them
-        diamond_df = pd.read_csv(diamond_csv_path)
-        box_df = pd.read_csv(box_csv_path)
+    def _load_records_from_csv_files(self) -> dict[str, list[dict]]:
+        import pandas as pd
 
-        # Combine the dataframes, ensuring the columns are aligned
-        combined_df = pd.concat([diamond_df, box_df], ignore_index=True)
+        combined_df = pd.concat(
+            [pd.read_csv(csv_path) for csv_path in self.csv_paths], ignore_index=True
+        )
         combined_df = combined_df.sort_values(by=[LETTER, START_POS, END_POS])
 
-        # Apply necessary transformations
         combined_df = self.add_turns_and_ori_to_pictograph_dict(combined_df)
         combined_df = self.restructure_dataframe_for_new_json_format(combined_df)
 
-        # Create the dictionary with letters as keys and records as values
-        letters = {
-            self.get_letter_enum_by_value(letter_str): combined_df[
-                combined_df[LETTER] == letter_str
-            ].to_dict(orient="records")
-            for letter_str in combined_df[LETTER].unique()
+        return {
+            letter_str: letter_df.to_dict(orient="records")
+            for letter_str, letter_df in combined_df.groupby(LETTER, sort=False)
         }
 
-        # Convert the turns to integers or floats in the dictionary
-        self._convert_turns_str_to_int_or_float(letters)
-        return letters
-
-    def _convert_turns_str_to_int_or_float(self, letters):
-        for letter in letters:
-            for motion in letters[letter]:
-                motion["blue_attributes"]["turns"] = int(
-                    motion["blue_attributes"]["turns"]
-                )
-                motion["red_attributes"]["turns"] = int(
-                    motion["red_attributes"]["turns"]
-                )
-
-    def add_turns_and_ori_to_pictograph_dict(self, df: pd.DataFrame) -> pd.DataFrame:
-        # Example logic for assigning turns and orientations; adjust according to your specific needs
-        for index, row in df.iterrows():
-            # Placeholder logic for turns and orientation assignments; replace with your actual logic
-            df.at[index, "blue_turns"] = 0  # Assign turns as integer
-            df.at[index, "red_turns"] = 0  # Assign turns as integer
-            df.at[index, "blue_start_ori"] = IN  # Assuming IN is a predefined variable
-            df.at[index, "red_start_ori"] = IN  # Assuming IN is a predefined variable
+    def add_turns_and_ori_to_pictograph_dict(
+        self, df: "pd.DataFrame"
+    ) -> "pd.DataFrame":
+        df["blue_turns"] = 0
+        df["red_turns"] = 0
+        df["blue_start_ori"] = IN
+        df["red_start_ori"] = IN
         return df
 
     def restructure_dataframe_for_new_json_format(
-        self, df: pd.DataFrame
-    ) -> pd.DataFrame:
-        def nest_attributes(row, color_prefix):
-            return {
-                "motion_type": row[f"{color_prefix}_motion_type"],
-                "start_ori": row[f"{color_prefix}_start_ori"],
-                "prop_rot_dir": row[f"{color_prefix}_prop_rot_dir"],
-                "start_loc": row[f"{color_prefix}_start_loc"],
-                "end_loc": row[f"{color_prefix}_end_loc"],
-                "turns": row[f"{color_prefix}_turns"],
-            }
-
-        df["blue_attributes"] = df.apply(
-            lambda row: nest_attributes(row, "blue"), axis=1
-        )
-        df["red_attributes"] = df.apply(lambda row: nest_attributes(row, "red"), axis=1)
-
-        # Drop the old, now unnecessary columns
-        blue_columns = [
-            "blue_motion_type",
-            "blue_prop_rot_dir",
-            "blue_start_loc",
-            "blue_end_loc",
-            "blue_turns",
-            "blue_start_ori",
-        ]
-        red_columns = [
-            "red_motion_type",
-            "red_prop_rot_dir",
-            "red_start_loc",
-            "red_end_loc",
-            "red_turns",
-            "red_start_ori",
+        self, df: "pd.DataFrame"
+    ) -> "pd.DataFrame":
+        attribute_keys = [
+            "motion_type",
+            "start_ori",
+            "prop_rot_dir",
+            "start_loc",
+            "end_loc",
+            "turns",
         ]
-        df = df.drop(columns=blue_columns + red_columns)
+        for color_prefix in ["blue", "red"]:
+            columns = [f"{color_prefix}_{key}" for key in attribute_keys]
+            df[f"{color_prefix}_attributes"] = [
+                dict(zip(attribute_keys, values))
+                for values in zip(*(df[column].tolist() for column in columns))
+            ]
+            df = df.drop(columns=columns)
 
         return df
 
+    ### BINARY CACHE ###
+
+    def _hash_csv_files(self) -> str:
+        digest = hashlib.sha256(str(self.CACHE_FORMAT_VERSION).encode())
+        for csv_path in self.csv_paths:
+            with open(csv_path, "rb") as csv_file:
+                digest.update(csv_file.read())
+        return digest.hexdigest()
+
+    def _load_cached_records(self, csv_hash: str) -> Optional[dict[str, list[dict]]]:
+        try:
+            with open(self.cache_path, "rb") as cache_file:
+                cached = pickle.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable pictograph cache: {e}")
+            return None
+
+        if not isinstance(cached, dict) or cached.get("csv_hash") != csv_hash:
+            return None
+        return cached.get("records_by_letter")
+
+    def _save_cached_records(
+        self, csv_hash: str, records_by_letter: dict[str, list[dict]]
+    ) -> None:
+        temp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(temp_path, "wb") as cache_file:
+                pickle.dump(
+                    {"csv_hash": csv_hash, "records_by_letter": records_by_letter},
+                    cache_file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not write pictograph cache: {e}")
+
+    ### OPTION INDEXES ###
+
+    def _build_option_indexes(
+        self, letters: dict[Letter, tuple[PictographRecord, ...]]
+    ) -> None:
+        """Group the loaded records by start position so option lookups don't scan every letter."""
+        by_start_pos = defaultdict(list)
+        by_start_and_end_pos = defaultdict(list)
+        by_start_pos_and_letter_type = defaultdict(list)
+
+        for records in letters.values():
+            for record in records:
+                start_pos = record.start_pos
+                end_pos = record.end_pos
+                by_start_pos[start_pos].append(record)
+                by_start_and_end_pos[(start_pos, end_pos)].append(record)
+                by_start_pos_and_letter_type[(start_pos, record.letter_type)].append(
+                    record
+                )
+
+        self.options_by_start_pos = {
+            key: tuple(value) for key, value in by_start_pos.items()
+        }
+        self.options_by_start_and_end_pos = {
+            key: tuple(value) for key, value in by_start_and_end_pos.items()
+        }
+        self.options_by_start_pos_and_letter_type = {
+            key: tuple(value) for key, value in by_start_pos_and_letter_type.items()
+        }
+
+    def get_options_by_start_pos(self, start_pos: str) -> tuple[PictographRecord, ...]:
+        """
+        Return the shared pictograph records that begin at `start_pos`.
+
+        The records are immutable; call `to_dict()` on one to get a copy
+        that can be changed.
+        """
+        return self.options_by_start_pos.get(start_pos, ())
+
+    def get_options_by_start_and_end_pos(
+        self, start_pos: str, end_pos: str
+    ) -> tuple[PictographRecord, ...]:
+        return self.options_by_start_and_end_pos.get((start_pos, end_pos), ())
+
+    def get_options_by_letter_types(
+        self, start_pos: str, letter_types: Iterable[LetterType]
+    ) -> tuple[PictographRecord, ...]:
+        options = []
+        for letter_type in letter_types:
+            options.extend(
+                self.options_by_start_pos_and_letter_type.get(
+                    (start_pos, letter_type), ()
+                )
+            )
+        return tuple(options)
+
     @staticmethod
     def get_letter_enum_by_value(letter_value: str) -> Letter:
-        for letter in Letter.__members__.values():
-            if letter.value == letter_value:
-                return letter
-        raise ValueError(f"No matching Letters enum for value: {letter_value}")
+        try:
+            return Letter(letter_value)
+        except ValueError:
+            raise ValueError(
+                f"No matching Letters enum for value: {letter_value}"
+            ) from None
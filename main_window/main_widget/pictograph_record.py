@@ -0,0 +1,149 @@
+import sys
+from collections.abc import Mapping
+from typing import Any, Iterator, Optional, Union
+
+from Enums.letters import Letter, LetterType
+from main_window.main_widget.grid_mode_checker import get_grid_mode_for_positions
+from main_window.main_widget.pictograph_key_generator import build_pictograph_key
+
+LETTER_RANKS: dict[Letter, int] = {letter: rank for rank, letter in enumerate(Letter)}
+LETTER_TYPES: dict[Letter, LetterType] = {
+    letter: LetterType.get_letter_type(letter) for letter in Letter
+}
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class _Record(Mapping):
+    """
+    Immutable, slotted record that reads like the dict it was built from.
+
+    Subscripting, `get` and `in` behave as they do on the dict, so code that
+    only reads pictograph data can take a record as is. Anything that needs to
+    change the data (or hand it to a pictograph) takes a fresh dict from
+    `to_dict()`. String fields are interned, so the thousands of repeated
+    positions, locations and motion types share one object each.
+
+    Only `_fields` are part of the mapping; any further slots hold values
+    derived from them.
+    """
+
+    __slots__ = ()
+    _fields: tuple[str, ...] = ()
+    _field_set: frozenset = frozenset()
+
+    def __init__(self, *values: Any) -> None:
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, _intern(value))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._field_set:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, name) for name in self._fields))
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self._fields}
+
+
+class MotionRecord(_Record):
+    """One hand's attributes in a pictograph record."""
+
+    _fields = (
+        "motion_type",
+        "start_ori",
+        "prop_rot_dir",
+        "start_loc",
+        "end_loc",
+        "turns",
+    )
+    __slots__ = _fields
+    _field_set = frozenset(_fields)
+
+    motion_type: str
+    start_ori: str
+    prop_rot_dir: str
+    start_loc: str
+    end_loc: str
+    turns: Union[int, float, str]
+
+    @classmethod
+    def from_dict(cls, attributes: dict) -> "MotionRecord":
+        return cls(*(attributes[name] for name in cls._fields))
+
+
+class PictographRecord(_Record):
+    """
+    A pictograph from the Box/Diamond dataset, shared by every reader.
+
+    Besides the JSON fields it carries what callers keep deriving from them:
+    the letter type, the grid mode and the pictograph key. They are worked
+    out once, when the record is built. The key doesn't depend on
+    orientations, so it still holds for an oriented `to_dict()` copy.
+    """
+
+    _fields = (
+        "letter",
+        "start_pos",
+        "end_pos",
+        "timing",
+        "direction",
+        "blue_attributes",
+        "red_attributes",
+    )
+    __slots__ = _fields + ("letter_type", "grid_mode", "key")
+    _field_set = frozenset(_fields)
+
+    letter: str
+    start_pos: str
+    end_pos: str
+    timing: str
+    direction: str
+    blue_attributes: MotionRecord
+    red_attributes: MotionRecord
+    letter_type: LetterType
+    grid_mode: Optional[str]
+    key: str
+
+    @classmethod
+    def from_dict(cls, pictograph_dict: dict) -> "PictographRecord":
+        return cls(
+            pictograph_dict["letter"],
+            pictograph_dict["start_pos"],
+            pictograph_dict["end_pos"],
+            pictograph_dict["timing"],
+            pictograph_dict["direction"],
+            MotionRecord.from_dict(pictograph_dict["blue_attributes"]),
+            MotionRecord.from_dict(pictograph_dict["red_attributes"]),
+            LETTER_TYPES[Letter(pictograph_dict["letter"])],
+            get_grid_mode_for_positions(
+                pictograph_dict["start_pos"], pictograph_dict["end_pos"]
+            ),
+            build_pictograph_key(pictograph_dict),
+        )
+
+    def to_dict(self) -> dict:
+        """Return a new, fully mutable pictograph dict in the JSON layout."""
+        pictograph_dict = super().to_dict()
+        pictograph_dict["blue_attributes"] = self.blue_attributes.to_dict()
+        pictograph_dict["red_attributes"] = self.red_attributes.to_dict()
+        return pictograph_dict
@@ -54,7 +54,7 @@ class SequencePropertiesManager:
         self.sequence = sequence[1:]
 
     def update_sequence_properties(self):
-        sequence = self.json_manager.loader_saver.load_current_sequence_json()
+        sequence = self.json_manager.loader_saver.get_current_sequence()
         if len(sequence) <= 1:
             return
 
@@ -66,7 +66,7 @@ class SequencePropertiesManager:
 
     def calculate_word(self, sequence):
         if sequence is None or not isinstance(sequence, list):
-            sequence = self.json_manager.loader_saver.load_current_sequence_json()
+            sequence = self.json_manager.loader_saver.get_current_sequence()
 
         if len(sequence) < 2:
             return ""
@@ -108,7 +108,7 @@ class SequencePropertiesManager:
     def _gather_properties(self):
         return {
             "word": self.calculate_word(
-                self.json_manager.loader_saver.load_current_sequence_json()
+                self.json_manager.loader_saver.get_current_sequence()
             ),
             "author": self.main_widget.main_window.settings_manager.users.user_manager.get_current_user(),
             "level": self.main_widget.sequence_level_evaluator.get_sequence_difficulty_level(
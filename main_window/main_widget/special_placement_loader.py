@@ -2,6 +2,9 @@ import json
 import os
 from typing import TYPE_CHECKING
 
+from placement_managers.arrow_placement_manager.components.default_arrow_positioner import (
+    DefaultArrowPositioner,
+)
 from utilities.path_helpers import get_images_and_data_path
 
 if TYPE_CHECKING:
@@ -43,7 +46,8 @@ class SpecialPlacementLoader:
         return self.special_placements
 
     def refresh_placements(self) -> None:
-        """Refreshes the special placements and updates all pictographs."""
+        """Refreshes the special and default placements and updates all pictographs."""
+        DefaultArrowPositioner.clear_placement_cache()
         self.main_widget.special_placements = self.load_special_placements()
 
         for _, pictograph_list in self.main_widget.pictograph_cache.items():
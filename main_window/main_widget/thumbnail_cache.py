@@ -0,0 +1,312 @@
+import hashlib
+import os
+import shutil
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QPainter, QPixmap
+
+from utilities.path_helpers import get_user_editable_resource_path
+
+if TYPE_CHECKING:
+    from main_window.main_widget.main_widget import MainWidget
+
+
+class ThumbnailTierSignals(QObject):
+    finished = pyqtSignal(str, bool)
+
+
+class ThumbnailTierJob(QRunnable):
+    """
+    Decodes one full-size thumbnail and writes a pre-scaled JPEG for every
+    tier, removing the tiers left over from earlier versions of the source.
+    """
+
+    def __init__(self, source_path: str, tier_paths: dict[int, str]) -> None:
+        super().__init__()
+        self.source_path = source_path
+        self.tier_paths = tier_paths
+        self.signals = ThumbnailTierSignals()
+
+    def run(self) -> None:
+        self._remove_stale_tiers()
+        # QImage (unlike QPixmap) is safe to use off the GUI thread.
+        image = QImage(self.source_path)
+        if image.isNull():
+            self.signals.finished.emit(self.source_path, False)
+            return
+        for width, tier_path in self.tier_paths.items():
+            scaled = image.scaledToWidth(
+                min(width, image.width()),
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            # JPEG has no alpha channel, so flatten onto white first.
+            flattened = QImage(scaled.size(), QImage.Format.Format_RGB32)
+            flattened.fill(Qt.GlobalColor.white)
+            painter = QPainter(flattened)
+            painter.drawImage(0, 0, scaled)
+            painter.end()
+            try:
+                if not flattened.save(f"{tier_path}.tmp", "JPG", 90):
+                    raise OSError(f"could not write {tier_path}")
+                os.replace(f"{tier_path}.tmp", tier_path)
+            except OSError:
+                self.signals.finished.emit(self.source_path, False)
+                return
+        self.signals.finished.emit(self.source_path, True)
+
+    def _remove_stale_tiers(self) -> None:
+        tier_dir = os.path.dirname(next(iter(self.tier_paths.values())))
+        current = {os.path.basename(path) for path in self.tier_paths.values()}
+        try:
+            os.makedirs(tier_dir, exist_ok=True)
+            filenames = os.listdir(tier_dir)
+        except OSError:
+            return
+        for filename in filenames:
+            if filename not in current:
+                try:
+                    os.remove(os.path.join(tier_dir, filename))
+                except OSError:
+                    pass
+
+
+class ThumbnailCachePruneJob(QRunnable):
+    """Removes the least recently written sources' tiers until the cache fits in `limit_bytes`."""
+
+    def __init__(self, cache_dir: str, limit_bytes: int) -> None:
+        super().__init__()
+        self.cache_dir = cache_dir
+        self.limit_bytes = limit_bytes
+
+    def run(self) -> None:
+        entries = []
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            try:
+                if entry.is_dir():
+                    paths = [
+                        os.path.join(entry.path, name)
+                        for name in os.listdir(entry.path)
+                    ]
+                else:
+                    paths = [entry.path]
+            except OSError:
+                continue
+            size = 0
+            newest = 0
+            for path in paths:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                size += stat.st_size
+                newest = max(newest, stat.st_mtime_ns)
+            entries.append((newest, size, entry.path, entry.is_dir()))
+            total += size
+        for _, size, path, is_dir in sorted(entries):
+            if total <= self.limit_bytes:
+                break
+            try:
+                if is_dir:
+                    shutil.rmtree(path)
+                else:
+                    os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+class ThumbnailPrefetchSignals(QObject):
+    finished = pyqtSignal(object, QImage)
+
+
+class ThumbnailPrefetchJob(QRunnable):
+    """Decodes one thumbnail and scales it to the width it will be shown at."""
+
+    def __init__(
+        self, key: tuple[str, int, int], image_path: str, target_width: int
+    ) -> None:
+        super().__init__()
+        self.key = key
+        self.image_path = image_path
+        self.target_width = target_width
+        self.signals = ThumbnailPrefetchSignals()
+
+    def run(self) -> None:
+        image = QImage(self.image_path)
+        if not image.isNull() and image.width() != self.target_width:
+            image = image.scaledToWidth(
+                self.target_width, Qt.TransformationMode.SmoothTransformation
+            )
+        self.signals.finished.emit(self.key, image)
+
+
+class ThumbnailCache(QObject):
+    """
+    Two-level cache for dictionary thumbnails.
+
+    Scaled pixmaps live in an in-memory LRU bounded by MEMORY_LIMIT_MB. Below
+    that, each source PNG is rendered once to JPEGs at a few fixed widths,
+    keyed by the source's path, mtime and size, so a later display only
+    decodes a small file. Tiers are generated on a background thread pool;
+    `thumbnail_ready` fires with the source path once they exist. Writing a
+    source's tiers drops the ones from its earlier versions, and the cache
+    directory is trimmed to DISK_LIMIT_MB at startup. Widths beyond the
+    largest tier are scaled from the source itself.
+
+    `prefetch` goes one step further for images that are likely to be shown
+    next: they are decoded and scaled off the GUI thread straight into the
+    in-memory LRU, so showing them is just a lookup.
+    """
+
+    thumbnail_ready = pyqtSignal(str)
+
+    MEMORY_LIMIT_MB = 128
+    DISK_LIMIT_MB = 512
+    TIER_WIDTHS = [320, 640, 1280]
+
+    def __init__(self, main_widget: "MainWidget") -> None:
+        super().__init__(main_widget)
+        self.main_widget = main_widget
+        self.cache_dir = get_user_editable_resource_path("thumbnail_cache")
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self.pixmaps: OrderedDict[tuple[str, int, int], QPixmap] = OrderedDict()
+        self.memory_used = 0
+        self.pending: set[str] = set()
+        self.failed: set[str] = set()
+        self.prefetching: set[tuple[str, int, int]] = set()
+        # Widths to prefetch once a source's tiers have been generated.
+        self.deferred_prefetches: dict[str, set[int]] = {}
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.start(
+            ThumbnailCachePruneJob(self.cache_dir, self.DISK_LIMIT_MB * 1024 * 1024)
+        )
+
+    def get_pixmap(self, source_path: str, target_width: int) -> Optional[QPixmap]:
+        """
+        Return `source_path` scaled to `target_width`, or None if its tiers are
+        still being generated (listen for `thumbnail_ready`).
+        """
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+
+        key = (source_path, stat.st_mtime_ns, target_width)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+            return pixmap
+
+        tier_width = self._pick_tier(target_width)
+        if source_path in self.failed or tier_width is None:
+            pixmap = QPixmap(source_path)
+        else:
+            tier_path = self._get_tier_path(source_path, stat, tier_width)
+            if not os.path.exists(tier_path):
+                self._schedule_tiers(source_path, stat)
+                return None
+            pixmap = QPixmap(tier_path)
+
+        if pixmap.isNull():
+            return None
+        if pixmap.width() != target_width:
+            pixmap = pixmap.scaledToWidth(
+                target_width, Qt.TransformationMode.SmoothTransformation
+            )
+        self._remember(key, pixmap)
+        return pixmap
+
+    def prefetch(self, source_path: str, target_width: int) -> None:
+        """Decode and scale `source_path` in the background so get_pixmap at this width is a memory hit."""
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return
+
+        key = (source_path, stat.st_mtime_ns, target_width)
+        if key in self.pixmaps or key in self.prefetching:
+            return
+        tier_width = self._pick_tier(target_width)
+        if source_path in self.failed or tier_width is None:
+            image_path = source_path
+        else:
+            image_path = self._get_tier_path(source_path, stat, tier_width)
+            if not os.path.exists(image_path):
+                # Decode from the small tier once it exists rather than
+                # decoding the full image twice.
+                self.deferred_prefetches.setdefault(source_path, set()).add(
+                    target_width
+                )
+                self._schedule_tiers(source_path, stat)
+                return
+
+        self.prefetching.add(key)
+        job = ThumbnailPrefetchJob(key, image_path, target_width)
+        job.signals.finished.connect(self._on_prefetch_finished)
+        self.thread_pool.start(job)
+
+    def clear_memory(self) -> None:
+        self.pixmaps.clear()
+        self.memory_used = 0
+
+    def _pick_tier(self, target_width: int) -> Optional[int]:
+        """The smallest tier at least `target_width` wide, or None if even the largest is narrower."""
+        for width in self.TIER_WIDTHS:
+            if width >= target_width:
+                return width
+        return None
+
+    def _get_tier_path(
+        self, source_path: str, stat: os.stat_result, width: int
+    ) -> str:
+        # One folder per source, so its stale tiers are easy to find.
+        path_key = os.path.normcase(os.path.abspath(source_path))
+        path_digest = hashlib.sha1(path_key.encode("utf-8")).hexdigest()
+        version_key = f"{stat.st_mtime_ns}|{stat.st_size}"
+        version_digest = hashlib.sha1(version_key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(
+            self.cache_dir, path_digest, f"{version_digest}_{width}.jpg"
+        )
+
+    def _schedule_tiers(self, source_path: str, stat: os.stat_result) -> None:
+        if source_path in self.pending:
+            return
+        self.pending.add(source_path)
+        tier_paths = {
+            width: self._get_tier_path(source_path, stat, width)
+            for width in self.TIER_WIDTHS
+        }
+        job = ThumbnailTierJob(source_path, tier_paths)
+        job.signals.finished.connect(self._on_tiers_finished)
+        self.thread_pool.start(job)
+
+    def _on_tiers_finished(self, source_path: str, succeeded: bool) -> None:
+        self.pending.discard(source_path)
+        if not succeeded:
+            self.failed.add(source_path)
+        for target_width in self.deferred_prefetches.pop(source_path, ()):
+            self.prefetch(source_path, target_width)
+        self.thumbnail_ready.emit(source_path)
+
+    def _on_prefetch_finished(self, key: tuple[str, int, int], image: QImage) -> None:
+        self.prefetching.discard(key)
+        if image.isNull() or key in self.pixmaps:
+            return
+        self._remember(key, QPixmap.fromImage(image))
+        self.thumbnail_ready.emit(key[0])
+
+    def _remember(self, key: tuple[str, int, int], pixmap: QPixmap) -> None:
+        self.pixmaps[key] = pixmap
+        self.memory_used += self._pixmap_bytes(pixmap)
+        limit = self.MEMORY_LIMIT_MB * 1024 * 1024
+        while self.memory_used > limit and len(self.pixmaps) > 1:
+            _, evicted = self.pixmaps.popitem(last=False)
+            self.memory_used -= self._pixmap_bytes(evicted)
+
+    @staticmethod
+    def _pixmap_bytes(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
@@ -22,10 +22,5 @@ class ThumbnailFinder:
                     thumbnails.append(os.path.join(root, file))
         return thumbnails
 
-    def get_all_thumbnails(self):
-        thumbnails = {}
-        for word in os.listdir(self.dictionary_dir):
-            word_dir = os.path.join(self.dictionary_dir, word)
-            if os.path.isdir(word_dir):
-                thumbnails[word] = self.find_thumbnails(word_dir)
-        return thumbnails
+    def get_all_thumbnails(self) -> dict[str, list[str]]:
+        return self.main_widget.dictionary_scanner.get_word_thumbnails()
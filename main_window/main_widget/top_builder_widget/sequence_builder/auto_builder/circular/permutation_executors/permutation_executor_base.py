@@ -1,5 +1,5 @@
 class PermutationExecutor:
     """Base class to hold the function signature for creating permutations."""
 
-    def create_permutations(self, sequence: list[dict]):
+    def create_permutations(self, sequence: list[dict]) -> list[dict]:
         raise NotImplementedError("This method should be overridden by subclasses.")
@@ -17,24 +17,25 @@ from data.constants import (
     STATIC,
     WEST,
 )
-from typing import TYPE_CHECKING
-from PyQt6.QtWidgets import QApplication
 
 from objects.motion.managers.handpath_calculator import HandpathCalculator
 from .permutation_executor_base import PermutationExecutor
 from data.positions_map import positions_map
 
 if TYPE_CHECKING:
-    from ..circular_auto_builder import CircularAutoBuilder
+    from main_window.main_widget.json_manager.json_ori_calculator import (
+        JsonOriCalculator,
+    )
 
 
 class RotatedPermutationExecuter(PermutationExecutor):
-    def __init__(self, circular_auto_builder: "CircularAutoBuilder"):
-        self.circular_auto_builder = circular_auto_builder
-        self.validation_engine = circular_auto_builder.validation_engine
+    def __init__(self, ori_calculator: "JsonOriCalculator"):
+        self.ori_calculator = ori_calculator
         self.hand_rot_dir_calculator = HandpathCalculator()
 
-    def create_permutations(self, sequence: list[dict]):
+    def create_permutations(self, sequence: list[dict]) -> list[dict]:
+        """Append the rotated beats to `sequence` and return them."""
+        halved_or_quartered = self.get_halved_or_quartered(sequence)
         start_position_entry = (
             sequence.pop(0) if "sequence_start_position" in sequence[0] else None
         )
@@ -43,9 +44,10 @@ class RotatedPermutationExecuter(PermutationExecutor):
 
         new_entries = []
         next_beat_number = last_entry["beat"] + 1
-        halved_or_quartered = self.get_halved_or_quartered()
 
-        entries_to_add = self.determine_how_many_entries_to_add(sequence_length)
+        entries_to_add = self.determine_how_many_entries_to_add(
+            sequence_length, halved_or_quartered
+        )
         for _ in range(entries_to_add):
             next_pictograph = self.create_new_rotated_permutation_entry(
                 sequence,
@@ -57,51 +59,37 @@ class RotatedPermutationExecuter(PermutationExecutor):
             new_entries.append(next_pictograph)
             sequence.append(next_pictograph)
 
-            sequence_widget = (
-                self.circular_auto_builder.main_widget.top_builder_widget.sequence_widget
-            )
-            sequence_widget.create_new_beat_and_add_to_sequence(
-                next_pictograph, override_grow_sequence=True, update_word=False
-            )
-            # self.validation_engine.validate_last_pictograph()
-            QApplication.processEvents()
-
             last_entry = next_pictograph
             next_beat_number += 1
 
-        sequence_widget.update_current_word_from_beats()
-
         if start_position_entry:
             start_position_entry["beat"] = 0
             sequence.insert(0, start_position_entry)
+        return new_entries
 
-    def determine_how_many_entries_to_add(self, sequence_length: int) -> int:
-        if self.is_quartered_permutation():
+    def determine_how_many_entries_to_add(
+        self, sequence_length: int, halved_or_quartered: str
+    ) -> int:
+        if halved_or_quartered == "quartered":
             return sequence_length * 3
-        elif self.is_halved_permutation():
+        elif halved_or_quartered == "halved":
             return sequence_length
         return 0
 
-    def is_quartered_permutation(self) -> bool:
-        sequence = (
-            self.circular_auto_builder.json_manager.loader_saver.load_current_sequence_json()
-        )
+    def is_quartered_permutation(self, sequence: list[dict]) -> bool:
         start_pos = sequence[1]["end_pos"]
         end_pos = sequence[-1]["end_pos"]
         return (start_pos, end_pos) in quartered_permutations
 
-    def is_halved_permutation(self) -> bool:
-        sequence = (
-            self.circular_auto_builder.json_manager.loader_saver.load_current_sequence_json()
-        )
+    def is_halved_permutation(self, sequence: list[dict]) -> bool:
         start_pos = sequence[1]["end_pos"]
         end_pos = sequence[-1]["end_pos"]
         return (start_pos, end_pos) in halved_permutations
 
-    def get_halved_or_quartered(self) -> str:
-        if self.is_halved_permutation():
+    def get_halved_or_quartered(self, sequence: list[dict]) -> str:
+        if self.is_halved_permutation(sequence):
             return "halved"
-        elif self.is_quartered_permutation():
+        elif self.is_quartered_permutation(sequence):
             return "quartered"
         return ""
 
@@ -212,14 +200,10 @@ class RotatedPermutationExecuter(PermutationExecutor):
             )
 
         new_entry["blue_attributes"]["end_ori"] = (
-            self.circular_auto_builder.json_manager.ori_calculator.calculate_end_orientation(
-                new_entry, "blue"
-            )
+            self.ori_calculator.calculate_end_orientation(new_entry, "blue")
         )
         new_entry["red_attributes"]["end_ori"] = (
-            self.circular_auto_builder.json_manager.ori_calculator.calculate_end_orientation(
-                new_entry, "red"
-            )
+            self.ori_calculator.calculate_end_orientation(new_entry, "red")
         )
 
         return new_entry
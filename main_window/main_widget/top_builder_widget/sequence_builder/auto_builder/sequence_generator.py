@@ -0,0 +1,403 @@
+import random
+from typing import TYPE_CHECKING, Optional
+
+from Enums.letters import LetterType
+from data.constants import (
+    ANTI,
+    BLUE,
+    BOX,
+    CLOCKWISE,
+    COUNTER_CLOCKWISE,
+    DASH,
+    DIAMOND,
+    END_ORI,
+    END_POS,
+    FLOAT,
+    IN,
+    MOTION_TYPE,
+    NO_ROT,
+    PRO,
+    PROP_ROT_DIR,
+    RED,
+    START_ORI,
+    STATIC,
+    TURNS,
+)
+from data.halved_permutations import halved_permutations
+from data.position_maps import (
+    half_position_map,
+    quarter_position_map_ccw,
+    quarter_position_map_cw,
+)
+from data.quartered_permutations import quartered_permutations
+from .circular.permutation_executors.mirrored_permutation_executor import (
+    MirroredPermutationExecutor,
+)
+from .circular.permutation_executors.rotated_permutation_executor import (
+    RotatedPermutationExecuter,
+)
+from .turn_intensity_manager import TurnIntensityManager
+
+if TYPE_CHECKING:
+    from main_window.main_widget.json_manager.json_ori_calculator import (
+        JsonOriCalculator,
+    )
+    from main_window.main_widget.pcitograph_dict_loader import PictographDictLoader
+    from main_window.main_widget.pictograph_record import PictographRecord
+
+
+class DeadEndError(ValueError):
+    """No option can continue the sequence with the requested constraints."""
+
+
+class SequenceGenerator:
+    """
+    Generates freeform and circular sequences from pictograph records alone.
+
+    Nothing here touches a widget, so it can run as fast as the dicts allow;
+    the auto-builder tabs only draw the finished sequence, and batch tools
+    can call it without a running QApplication.
+    """
+
+    START_POSITION_KEYS = {
+        DIAMOND: ["alpha1_alpha1", "beta5_beta5", "gamma11_gamma11"],
+        BOX: ["alpha2_alpha2", "beta4_beta4", "gamma12_gamma12"],
+    }
+
+    def __init__(
+        self,
+        dict_loader: "PictographDictLoader",
+        ori_calculator: "JsonOriCalculator",
+    ) -> None:
+        self.dict_loader = dict_loader
+        self.ori_calculator = ori_calculator
+        self.rotated_executor = RotatedPermutationExecuter(ori_calculator)
+        self.mirrored_executor = MirroredPermutationExecutor(ori_calculator, False)
+
+    ### SEQUENCE BUILDING ###
+
+    def build_freeform_sequence(
+        self,
+        sequence: list[dict],
+        length: int,
+        turn_intensity: float,
+        level: int,
+        is_continuous_rot_dir: bool,
+        letter_types: Optional[list[LetterType]] = None,
+    ) -> list[dict]:
+        """Extend `sequence` (metadata, start position, any existing beats) to `length` beats."""
+        blue_rot_dir, red_rot_dir = self._choose_rot_dirs(is_continuous_rot_dir)
+        length_of_sequence_upon_start = len(sequence) - 2
+
+        turn_manager = TurnIntensityManager(length, level, turn_intensity)
+        turns_blue, turns_red = turn_manager.allocate_turns_for_blue_and_red()
+
+        for i in range(length - length_of_sequence_upon_start):
+            options = self.get_next_options(sequence, letter_types)
+            if is_continuous_rot_dir:
+                options = self.filter_options_by_rotation(
+                    options, blue_rot_dir, red_rot_dir
+                )
+            next_beat = self._choose_option(options).to_dict()
+            self._finish_beat(
+                next_beat,
+                sequence,
+                level,
+                turns_blue[i],
+                turns_red[i],
+                is_continuous_rot_dir,
+                blue_rot_dir,
+                red_rot_dir,
+            )
+            sequence.append(next_beat)
+
+        return sequence
+
+    def build_circular_sequence(
+        self,
+        sequence: list[dict],
+        length: int,
+        turn_intensity: float,
+        level: int,
+        rotation_type: str,
+        permutation_type: str,
+        is_continuous_rot_dir: bool,
+        letter_types: Optional[list[LetterType]] = None,
+    ) -> list[dict]:
+        """Build the first word of a circular sequence, then complete it with the chosen permutation."""
+        blue_rot_dir, red_rot_dir = self._choose_rot_dirs(is_continuous_rot_dir)
+        length_of_sequence_upon_start = len(sequence) - 2
+        word_length = self.get_word_length(length, rotation_type, permutation_type)
+
+        turn_manager = TurnIntensityManager(word_length, level, turn_intensity)
+        turns_blue, turns_red = turn_manager.allocate_turns_for_blue_and_red()
+
+        for i in range(word_length - length_of_sequence_upon_start):
+            is_last_in_word = i == word_length - length_of_sequence_upon_start - 1
+            options = self.get_next_options(sequence, letter_types)
+            if is_continuous_rot_dir:
+                options = self.filter_options_by_rotation(
+                    options, blue_rot_dir, red_rot_dir
+                )
+
+            if is_last_in_word:
+                if permutation_type == "rotated":
+                    expected_end_pos = self._determine_rotated_end_pos(
+                        sequence, rotation_type
+                    )
+                else:
+                    expected_end_pos = sequence[1][END_POS]
+                next_beat = self._select_pictograph_with_end_pos(
+                    options, expected_end_pos
+                )
+            else:
+                next_beat = self._choose_option(options)
+
+            next_beat = next_beat.to_dict()
+            self._finish_beat(
+                next_beat,
+                sequence,
+                level,
+                turns_blue[i],
+                turns_red[i],
+                is_continuous_rot_dir,
+                blue_rot_dir,
+                red_rot_dir,
+            )
+            sequence.append(next_beat)
+
+        self.apply_permutations(sequence, permutation_type, rotation_type)
+        return sequence
+
+    def get_word_length(
+        self, length: int, rotation_type: str, permutation_type: str
+    ) -> int:
+        if permutation_type == "rotated" and rotation_type == "quartered":
+            return length // 4
+        return length // 2
+
+    def apply_permutations(
+        self, sequence: list[dict], permutation_type: str, rotation_type: str
+    ) -> list[dict]:
+        """Append the permuted beats to `sequence` and return them."""
+        if permutation_type == "rotated":
+            if self.can_perform_rotated_permutation(sequence, rotation_type):
+                return self.rotated_executor.create_permutations(sequence)
+        elif permutation_type == "mirrored":
+            if self.mirrored_executor.can_perform_mirrored_permutation(sequence):
+                return self.mirrored_executor.create_permutations(
+                    sequence, "vertical"
+                )
+        return []
+
+    def can_perform_rotated_permutation(
+        self, sequence: list[dict], rotation_type: str
+    ) -> bool:
+        start_pos = sequence[1][END_POS]
+        end_pos = sequence[-1][END_POS]
+        if rotation_type == "quartered":
+            return (start_pos, end_pos) in quartered_permutations
+        elif rotation_type == "halved":
+            return (start_pos, end_pos) in halved_permutations
+        return False
+
+    ### START POSITION ###
+
+    def create_start_position_entry(self, position_key: str) -> dict:
+        """Return the sequence entry for a start position key such as 'alpha1_alpha1'."""
+        start_pos, end_pos = position_key.split("_")
+        options = self.dict_loader.get_options_by_start_and_end_pos(start_pos, end_pos)
+        if not options:
+            raise ValueError(f"No start position found for {position_key}.")
+        pictograph_dict = options[0]
+
+        def start_attributes(color: str) -> dict:
+            attributes = pictograph_dict[f"{color}_attributes"]
+            return {
+                "start_loc": attributes["start_loc"],
+                "end_loc": attributes["end_loc"],
+                "start_ori": IN,
+                "end_ori": IN,
+                "prop_rot_dir": NO_ROT,
+                "turns": 0,
+                "motion_type": attributes[MOTION_TYPE],
+            }
+
+        return {
+            "beat": 0,
+            "sequence_start_position": end_pos.rstrip("0123456789"),
+            "letter": pictograph_dict["letter"],
+            "end_pos": end_pos,
+            "blue_attributes": start_attributes(BLUE),
+            "red_attributes": start_attributes(RED),
+        }
+
+    def choose_start_position_key(self, grid_mode: str) -> str:
+        return random.choice(self.START_POSITION_KEYS[grid_mode])
+
+    ### OPTIONS ###
+
+    def get_next_options(
+        self, sequence: list[dict], letter_types: Optional[list[LetterType]] = None
+    ) -> tuple["PictographRecord", ...]:
+        """Return the shared pictograph records that can follow the last beat of `sequence`."""
+        last_pictograph_dict = (
+            sequence[-1]
+            if sequence[-1].get("is_placeholder", "") != True
+            else sequence[-2]
+        )
+        start_pos = last_pictograph_dict[END_POS]
+        if letter_types is not None:
+            return self.dict_loader.get_options_by_letter_types(
+                start_pos, letter_types
+            )
+        return self.dict_loader.get_options_by_start_pos(start_pos)
+
+    def filter_options_by_rotation(
+        self, options: tuple["PictographRecord", ...], blue_rot_dir, red_rot_dir
+    ) -> tuple["PictographRecord", ...]:
+        """Filter options to match the rotation direction for both hands."""
+        filtered_options = tuple(
+            option
+            for option in options
+            if option["blue_attributes"][PROP_ROT_DIR] in [blue_rot_dir, NO_ROT]
+            and option["red_attributes"][PROP_ROT_DIR] in [red_rot_dir, NO_ROT]
+        )
+        return filtered_options if filtered_options else options
+
+    def _determine_rotated_end_pos(
+        self, sequence: list[dict], rotation_type: str
+    ) -> Optional[str]:
+        """Determine the expected end position based on rotation type and current sequence."""
+        start_pos = sequence[1][END_POS]
+
+        if rotation_type == "quartered":
+            if random.choice([True, False]):
+                return quarter_position_map_cw[start_pos]
+            else:
+                return quarter_position_map_ccw[start_pos]
+        elif rotation_type == "halved":
+            return half_position_map[start_pos]
+        return None
+
+    def _select_pictograph_with_end_pos(
+        self, options: tuple["PictographRecord", ...], expected_end_pos: str
+    ) -> "PictographRecord":
+        """Select a pictograph from options that has the desired end position."""
+        valid_options = [
+            option for option in options if option[END_POS] == expected_end_pos
+        ]
+        if not valid_options:
+            raise DeadEndError(
+                f"No valid pictograph found with end position {expected_end_pos}."
+            )
+        return random.choice(valid_options)
+
+    @staticmethod
+    def _choose_option(
+        options: tuple["PictographRecord", ...]
+    ) -> "PictographRecord":
+        if not options:
+            raise DeadEndError("No pictograph can follow the last beat.")
+        return random.choice(options)
+
+    ### BEAT ATTRIBUTES ###
+
+    def _finish_beat(
+        self,
+        next_beat: dict,
+        sequence: list[dict],
+        level: int,
+        turn_blue,
+        turn_red,
+        is_continuous_rot_dir: bool,
+        blue_rot_dir: Optional[str],
+        red_rot_dir: Optional[str],
+    ) -> None:
+        if level == 2 or level == 3:
+            self.set_turns(next_beat, turn_blue, turn_red)
+
+        self._update_start_oris(next_beat, sequence[-1])
+        self._update_dash_static_prop_rot_dirs(
+            next_beat,
+            is_continuous_rot_dir,
+            blue_rot_dir,
+            red_rot_dir,
+        )
+        # End oris depend on the prop rot dirs chosen above, so they go last.
+        self._update_end_oris(next_beat)
+        next_beat["beat"] = len(sequence) - 1
+
+    def _choose_rot_dirs(
+        self, is_continuous_rot_dir: bool
+    ) -> tuple[Optional[str], Optional[str]]:
+        if not is_continuous_rot_dir:
+            return None, None
+        return (
+            random.choice([CLOCKWISE, COUNTER_CLOCKWISE]),
+            random.choice([CLOCKWISE, COUNTER_CLOCKWISE]),
+        )
+
+    def _update_start_oris(self, next_pictograph_dict, last_pictograph_dict):
+        next_pictograph_dict["blue_attributes"][START_ORI] = last_pictograph_dict[
+            "blue_attributes"
+        ][END_ORI]
+        next_pictograph_dict["red_attributes"][START_ORI] = last_pictograph_dict[
+            "red_attributes"
+        ][END_ORI]
+
+    def _update_end_oris(self, next_pictograph_dict):
+        next_pictograph_dict["blue_attributes"][END_ORI] = (
+            self.ori_calculator.calculate_end_orientation(next_pictograph_dict, BLUE)
+        )
+        next_pictograph_dict["red_attributes"][END_ORI] = (
+            self.ori_calculator.calculate_end_orientation(next_pictograph_dict, RED)
+        )
+
+    def _update_dash_static_prop_rot_dirs(
+        self,
+        next_beat: dict,
+        is_continuous_rot_dir: bool,
+        blue_rot_dir: str,
+        red_rot_dir: str,
+    ):
+        def update_prop_rot_dir(color, rot_dir):
+            attributes = next_beat[f"{color}_attributes"]
+            if attributes[MOTION_TYPE] in [DASH, STATIC]:
+                if is_continuous_rot_dir:
+                    if attributes[TURNS] > 0:
+                        attributes[PROP_ROT_DIR] = rot_dir
+                    else:
+                        attributes[PROP_ROT_DIR] = NO_ROT
+                else:
+                    if attributes[TURNS] > 0:
+                        self._set_random_prop_rot_dir(next_beat, color)
+                    else:
+                        attributes[PROP_ROT_DIR] = NO_ROT
+
+        update_prop_rot_dir(BLUE, blue_rot_dir)
+        update_prop_rot_dir(RED, red_rot_dir)
+
+    def _set_random_prop_rot_dir(self, next_pictograph_dict: dict, color: str) -> None:
+        """Set a random prop rotation direction for the given color."""
+        next_pictograph_dict[f"{color}_attributes"][PROP_ROT_DIR] = random.choice(
+            [CLOCKWISE, COUNTER_CLOCKWISE]
+        )
+
+    def set_turns(self, next_beat: dict, turn_blue: float, turn_red: float) -> dict:
+        """Set the turns for blue and red attributes, adjusting motion types if necessary."""
+        for color, turns in [(BLUE, turn_blue), (RED, turn_red)]:
+            attributes = next_beat[f"{color}_attributes"]
+            if turns == "fl":
+                if attributes[MOTION_TYPE] in [PRO, ANTI]:
+                    attributes[TURNS] = "fl"
+                    attributes["prefloat_motion_type"] = attributes[MOTION_TYPE]
+                    attributes["prefloat_prop_rot_dir"] = attributes[PROP_ROT_DIR]
+                    attributes[MOTION_TYPE] = FLOAT
+                    attributes[PROP_ROT_DIR] = NO_ROT
+                else:
+                    attributes[TURNS] = 0
+            else:
+                attributes[TURNS] = turns
+
+        return next_beat
@@ -69,7 +69,9 @@ class StartPosManager(QObject):
                     self.start_pos_frame._add_start_pos_to_layout(
                         start_position_pictograph
                     )
-                    start_position_pictograph.updater.update_pictograph(pictograph_dict)
+                    start_position_pictograph.updater.update_pictograph(
+                        pictograph_dict.to_dict()
+                    )
 
                     start_position_pictograph.view.mousePressEvent = partial(
                         self.add_start_pos_to_sequence,
@@ -144,9 +146,9 @@ class StartPosManager(QObject):
         letter_str = self.start_pos_key_to_letter(start_pos_key)
         letter = Letter(letter_str)
         matching_letter_pictographs = self.main_widget.pictograph_dicts.get(letter, [])
-        for pictograph_dict in matching_letter_pictographs:
-            if pictograph_dict["start_pos"] == start_pos_key:
-
+        for record in matching_letter_pictographs:
+            if record["start_pos"] == start_pos_key:
+                pictograph_dict = record.to_dict()
                 pictograph_dict["blue_attributes"]["start_ori"] = start_pos_data[
                     "blue_attributes"
                 ]["end_ori"]
@@ -156,13 +158,8 @@ class StartPosManager(QObject):
                 pictograph_factory = (
                     self.main_widget.top_builder_widget.sequence_widget.pictograph_factory
                 )
-                pictograph_key = (
-                    self.main_widget.pictograph_key_generator.generate_pictograph_key(
-                        pictograph_dict
-                    )
-                )
                 start_pos_pictograph = pictograph_factory.get_or_create_pictograph(
-                    pictograph_key, pictograph_dict
+                    record.key, pictograph_dict
                 )
                 return start_pos_pictograph
 
@@ -210,7 +207,9 @@ class StartPosManager(QObject):
                     "gamma15",
                 ]:
                     continue
-                pictograph = self.create_pictograph_from_dict(pictograph_dict)
+                pictograph = self.create_pictograph_from_dict(
+                    pictograph_dict.to_dict()
+                )
             elif (
                 self.main_widget.settings_manager.global_settings.get_grid_mode() == BOX
             ):
@@ -233,7 +232,9 @@ class StartPosManager(QObject):
                     "gamma16",
                 ]:
                     continue
-                pictograph = self.create_pictograph_from_dict(pictograph_dict)
+                pictograph = self.create_pictograph_from_dict(
+                    pictograph_dict.to_dict()
+                )
             variations.append(pictograph)
         return variations
 
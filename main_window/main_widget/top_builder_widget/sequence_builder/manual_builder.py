@@ -76,18 +76,13 @@ class ManualBuilder(QFrame):
         self.option_picker.resize_option_picker()
 
     def render_and_store_pictograph(
-        self, pictograph_dict: dict, sequence
+        self, pictograph_key: str, pictograph_dict: dict, sequence
     ) -> BasePictograph:
         """Render and store a new pictograph based on the provided dictionary and sequence."""
         pictograph_dict = self._add_turns_and_start_ori(pictograph_dict, sequence)
         letter_str = pictograph_dict["letter"]
         letter = Letter.get_letter(letter_str)
         letter_type = LetterType.get_letter_type(letter)
-        pictograph_key = (
-            self.main_widget.pictograph_key_generator.generate_pictograph_key(
-                pictograph_dict
-            )
-        )
 
         scroll_area = self.option_picker.scroll_area
         if pictograph_key in scroll_area.pictograph_cache:
@@ -1,11 +1,13 @@
 from PyQt6.QtCore import QObject, pyqtSignal
-from data.constants import END_POS, START_POS
-from typing import TYPE_CHECKING
+from data.constants import END_POS
+from typing import TYPE_CHECKING, Optional
 
+from Enums.letters import LetterType
 from base_widgets.base_pictograph.base_pictograph import BasePictograph
 
 
 if TYPE_CHECKING:
+    from main_window.main_widget.pictograph_record import PictographRecord
     from main_window.main_widget.top_builder_widget.sequence_builder.option_picker.option_picker import (
         OptionPicker,
     )
@@ -20,20 +22,25 @@ class OptionGetter(QObject):
         self.main_widget = option_picker.main_widget
         self.start_options: dict[str, BasePictograph] = {}
 
-    def get_next_options(self, sequence) -> list[dict]:
-        next_options = []
+    def get_next_options(
+        self, sequence, letter_types: Optional[list[LetterType]] = None
+    ) -> tuple["PictographRecord", ...]:
+        """
+        Return the options that can follow the last beat of `sequence`.
 
+        The returned records are shared with the pictograph index and can't
+        be changed; use `to_dict()` for a copy to orient.
+        """
         last_pictograph_dict = (
             sequence[-1]
             if sequence[-1].get("is_placeholder", "") != True
             else sequence[-2]
         )
         start_pos = last_pictograph_dict[END_POS]
+        if not start_pos:
+            return ()
 
-        if start_pos:
-            for dict_list in self.main_widget.pictograph_dicts.values():
-                for dict in dict_list:
-                    if dict[START_POS] == start_pos:
-                        next_options.append(dict)
-
-        return next_options
+        dict_loader = self.main_widget.pictograph_dict_loader
+        if letter_types is not None:
+            return dict_loader.get_options_by_letter_types(start_pos, letter_types)
+        return dict_loader.get_options_by_start_pos(start_pos)
@@ -1,11 +1,12 @@
 from typing import TYPE_CHECKING
-from Enums.Enums import LetterType, Letter
+from Enums.Enums import LetterType
 from PyQt6.QtWidgets import QApplication
 from main_window.main_widget.top_builder_widget.sequence_widget.beat_frame.beat import (
     Beat,
 )
 from base_widgets.base_pictograph.base_pictograph import BasePictograph
 from Enums.Enums import LetterType
+from main_window.main_widget.pictograph_record import LETTER_RANKS
 from .option_picker_section_widget import OptionPickerSectionWidget
 
 if TYPE_CHECKING:
@@ -66,7 +67,7 @@ class OptionPickerDisplayManager:
             for k, v in sorted(
                 relevant_pictographs.items(),
                 key=lambda item: (
-                    list(Letter).index(Letter(item[1].letter)),
+                    LETTER_RANKS[item[1].letter],
                     item[1].start_pos,
                 ),
             )
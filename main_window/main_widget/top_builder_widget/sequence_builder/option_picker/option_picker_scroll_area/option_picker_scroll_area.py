@@ -25,6 +25,7 @@ if TYPE_CHECKING:
     from main_window.main_widget.top_builder_widget.sequence_builder.option_picker.option_picker_scroll_area.option_picker_section_widget import (
         OptionPickerSectionWidget,
     )
+    from main_window.main_widget.pictograph_record import PictographRecord
     from ..option_picker import OptionPicker
 
 
@@ -65,20 +66,26 @@ class OptionPickerScrollArea(BasePickerScrollArea):
         for pictograph in self.pictograph_cache.values():
             pictograph.view.hide()
 
-    def add_and_display_relevant_pictographs(self, next_options: list[dict]) -> None:
+    def add_and_display_relevant_pictographs(
+        self, next_options: tuple["PictographRecord", ...]
+    ) -> None:
         if self.disabled:
             return
         if QApplication.overrideCursor() is None:
             QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
         valid_next_options = []
 
-        sequence = self.json_manager.loader_saver.load_current_sequence_json()
-        for pictograph_dict in next_options:
-            valid_next_options.append(pictograph_dict)
+        sequence = self.json_manager.loader_saver.get_current_sequence()
+        for record in next_options:
+            # The options are shared with the pictograph index; orient a copy.
+            # Orienting doesn't change the key, so the record's key still holds.
+            valid_next_options.append((record.key, record.to_dict()))
 
-        for pictograph_dict in valid_next_options:
+        for pictograph_key, pictograph_dict in valid_next_options:
             self.set_pictograph_orientations(pictograph_dict, sequence)
-            pictograph = self._get_or_create_pictograph(pictograph_dict, sequence)
+            pictograph = self._get_or_create_pictograph(
+                pictograph_key, pictograph_dict, sequence
+            )
             pictograph.updater.update_pictograph(pictograph_dict)
 
         self.display_manager.order_and_display_pictographs()
@@ -105,20 +112,17 @@ class OptionPickerScrollArea(BasePickerScrollArea):
         )
 
     def _get_or_create_pictograph(
-        self, pictograph_dict: dict, sequence
+        self, pictograph_key: str, pictograph_dict: dict, sequence
     ) -> BasePictograph:
-        modified_key = self.manual_builder.main_widget.pictograph_key_generator.generate_pictograph_key(
-            pictograph_dict
-        )
-        if modified_key in self.pictograph_cache:
-            return self.pictograph_cache[modified_key]
+        if pictograph_key in self.pictograph_cache:
+            return self.pictograph_cache[pictograph_key]
         else:
             pictograph = self.manual_builder.render_and_store_pictograph(
-                pictograph_dict, sequence
+                pictograph_key, pictograph_dict, sequence
             )
-            self.pictograph_cache[modified_key] = pictograph
+            self.pictograph_cache[pictograph_key] = pictograph
             self.main_widget.pictograph_cache[pictograph.letter][
-                modified_key
+                pictograph_key
             ] = pictograph
         return pictograph
 
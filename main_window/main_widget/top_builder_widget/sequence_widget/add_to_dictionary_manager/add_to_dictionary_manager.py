@@ -72,6 +72,7 @@ class AddToDictionaryManager:
         self.thumbnail_generator.generate_and_save_thumbnail(
             sequence, variation_number, base_path
         )
+        self.sequence_widget.main_widget.dictionary_scanner.mark_dirty(base_path)
 
         self.display_message(
             f"Saved new variation for '{base_word}' as version {variation_number}."
@@ -6,6 +6,8 @@ from PIL import Image, PngImagePlugin, ImageEnhance
 import numpy as np
 from datetime import datetime
 
+from .structural_variation_checker import StructuralVariationChecker
+
 if TYPE_CHECKING:
     from .add_to_dictionary_manager import AddToDictionaryManager
 
@@ -32,7 +34,11 @@ class ThumbnailGenerator:
         # Apply sharpening to improve clarity after resizing
         pil_image = self._sharpen_image(pil_image)
 
-        metadata = {"sequence": sequence, "date_added": datetime.now().isoformat()}
+        metadata = {
+            "sequence": sequence,
+            "date_added": datetime.now().isoformat(),
+            "structural_hash": StructuralVariationChecker.get_structural_hash(sequence),
+        }
         metadata_str = json.dumps(metadata)
         info = self._create_png_info(metadata_str)
 
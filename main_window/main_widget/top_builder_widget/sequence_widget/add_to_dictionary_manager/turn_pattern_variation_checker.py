@@ -1,7 +1,7 @@
 import json
 import os
 from typing import TYPE_CHECKING
-from PIL import Image
+from utilities.png_text_chunks import read_text_chunk
 if TYPE_CHECKING:
     from .add_to_dictionary_manager import AddToDictionaryManager
 
@@ -23,12 +23,11 @@ class TurnPatternVariationChecker:
 
     def are_turns_patterns_identical(self, seq1, image_path):
         try:
-            with Image.open(image_path) as img:
-                metadata = img.info.get("metadata")
-                if metadata:
-                    seq2 = json.loads(metadata)
-                    return self.compare_turns_patterns(seq1, seq2)
-        except IOError as e:
+            metadata = read_text_chunk(image_path, "metadata")
+            if metadata:
+                seq2 = json.loads(metadata)
+                return self.compare_turns_patterns(seq1, seq2)
+        except (IOError, ValueError) as e:
             print(f"Error opening image: {e}")
         return False
 
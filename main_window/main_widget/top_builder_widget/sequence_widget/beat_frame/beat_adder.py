@@ -22,6 +22,7 @@ class BeatAdder:
         override_grow_sequence=False,
         update_word=True,
         update_level=True,
+        save_sequence=True,
     ) -> None:
         next_beat_number = self.calculate_next_beat_number()
 
@@ -41,7 +42,7 @@ class BeatAdder:
 
             self.beat_frame.selection_overlay.select_beat(self.beats[next_beat_index])
             self.json_manager.updater.update_current_sequence_file_with_beat(
-                self.beats[next_beat_index]
+                self.beats[next_beat_index], save_sequence
             )
             if update_word:
                 self.sequence_widget.update_current_word_from_beats()
@@ -1,3 +1,4 @@
+from copy import deepcopy
 from typing import TYPE_CHECKING
 from PyQt6.QtWidgets import QApplication
 
@@ -11,14 +12,16 @@ class BeatFrameUpdater:
 
     def update_beats_from_json(self) -> None:
         current_sequence_json = (
-            self.beat_frame.json_manager.loader_saver.load_current_sequence_json()
+            self.beat_frame.json_manager.loader_saver.get_current_sequence()
         )
         # Skip the metadata entry
         sequence_entries = current_sequence_json[1:]
 
         # Update the start position if necessary
         if sequence_entries and 'sequence_start_position' in sequence_entries[0]:
-            self.update_start_pos_from_current_sequence_json(sequence_entries[0])
+            self.update_start_pos_from_current_sequence_json(
+                deepcopy(sequence_entries[0])
+            )
             beat_entries = sequence_entries[1:]
         else:
             beat_entries = sequence_entries
@@ -32,7 +35,7 @@ class BeatFrameUpdater:
 
             if beat_view and beat_view.beat:
                 if beat_view.beat.pictograph_dict != entry:
-                    beat_view.beat.updater.update_pictograph(entry)
+                    beat_view.beat.updater.update_pictograph(deepcopy(entry))
                     QApplication.processEvents()
             else:
                 print(
@@ -82,7 +82,7 @@ class SequenceWidget(QWidget):
         self.current_word_label.set_current_word(current_word)
 
     def update_difficulty_label(self):
-        sequence = self.json_manager.loader_saver.load_current_sequence_json()
+        sequence = self.json_manager.loader_saver.get_current_sequence()
         difficulty_level = (
             self.main_widget.sequence_level_evaluator.get_sequence_difficulty_level(
                 sequence
@@ -154,18 +154,20 @@ class SequenceWidget(QWidget):
         override_grow_sequence=False,
         update_word=True,
         update_level=True,
+        save_sequence=True,
     ) -> None:
         new_beat = Beat(self.beat_frame)
         new_beat.updater.update_pictograph(pictograph_dict)
         self.beat_frame.beat_adder.add_beat_to_sequence(
-            new_beat, override_grow_sequence, update_word, update_level
+            new_beat, override_grow_sequence, update_word, update_level, save_sequence
         )
         for motion in new_beat.motions.values():
             if motion.motion_type == FLOAT:
                 letter = self.main_widget.letter_determiner.determine_letter(motion)
                 new_beat.letter = letter
                 new_beat.tka_glyph.update_tka_glyph()
-        self.main_widget.sequence_properties_manager.update_sequence_properties()
+        if save_sequence:
+            self.main_widget.sequence_properties_manager.update_sequence_properties()
 
     def resize_sequence_widget(self) -> None:
         self.current_word_label.resize_current_word_label()
@@ -37,6 +37,7 @@ class MainWindow(QMainWindow):
         return result
 
     def closeEvent(self, event):
+        self.main_widget.json_manager.loader_saver.flush()
         self.settings_manager.save_settings()
         super().closeEvent(event)
         QApplication.instance().installEventFilter(self)
@@ -137,6 +137,7 @@ class FontColorUpdater:
             self._apply_font_color(thumbnail_box.word_label, font_color)
             thumbnail_box.word_label.reload_favorite_icon()
             self._apply_font_color(thumbnail_box.variation_number_label, font_color)
+            thumbnail_box.font_color = font_color
 
     def _update_learn_widget(self, main_widget: "MainWidget", font_color: str) -> None:
         learn_widget = main_widget.learn_widget
@@ -1,6 +1,5 @@
 from typing import TYPE_CHECKING, Union
 from utilities.path_helpers import get_images_and_data_path
-from PyQt6.QtSvg import QSvgRenderer
 from objects.arrow.arrow import Arrow
 from data.constants import CLOCK, COUNTER, IN, NO_ROT, OUT, FLOAT  # Add FLOAT here
 
@@ -16,11 +15,8 @@ class ArrowSvgManager:
 
     def update_arrow_svg(self, arrow: "Arrow") -> None:
         svg_file = self._get_arrow_svg_file(arrow)
-        svg_data = self.manager.load_svg_file(svg_file)
-        colored_svg_data = self.manager.color_manager.apply_color_transformations(
-            svg_data, arrow.color
-        )
-        self._setup_arrow_svg_renderer(arrow, colored_svg_data)
+        renderer = self.manager.cache_manager.get_renderer(svg_file, arrow.color)
+        arrow.setSharedRenderer(renderer)
 
     def _get_arrow_svg_file(self, arrow: "Arrow") -> str:
         start_ori = arrow.motion.start_ori
@@ -50,9 +46,3 @@ class ArrowSvgManager:
                 )
         # if turns == "fl":
         #     return get_images_and_data_path("images/arrows/float.svg")
-
-    def _setup_arrow_svg_renderer(self, arrow: "Arrow", svg_data: str) -> None:
-        renderer = QSvgRenderer()
-        renderer.load(svg_data.encode("utf-8"))
-        arrow.setSharedRenderer(renderer)
-        # arrow.update()
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 from utilities.path_helpers import get_images_and_data_path
 from .arrow_svg_manager import ArrowSvgManager
 from .prop_svg_manager import PropSvgManager
+from .svg_cache_manager import SvgCacheManager
 from .svg_color_manager import SvgColorManager
 if TYPE_CHECKING:
     from main_window.main_widget.main_widget import MainWidget
@@ -11,6 +12,7 @@ class SvgManager:
         self.main_widget = main_widget
         
         self.color_manager = SvgColorManager(self)
+        self.cache_manager = SvgCacheManager(self)
         self.arrow_manager = ArrowSvgManager(self)
         self.prop_manager = PropSvgManager(self)
 
@@ -10,7 +10,6 @@ if TYPE_CHECKING:
 from utilities.path_helpers import get_images_and_data_path
 
 from typing import TYPE_CHECKING
-from PyQt6.QtSvg import QSvgRenderer
 from objects.prop.prop import Prop
 from Enums.PropTypes import PropType
 from data.constants import BLUE, PROP_DIR
@@ -27,14 +26,9 @@ class PropSvgManager:
 
     def update_prop_svg(self, prop: "Prop") -> None:
         svg_file = self._get_prop_svg_file(prop)
-        svg_data = self.manager.load_svg_file(svg_file)
-        if prop.prop_type != PropType.Hand:
-            colored_svg_data = self.manager.color_manager.apply_color_transformations(
-                svg_data, prop.color
-            )
-        else:
-            colored_svg_data = svg_data
-        self._setup_prop_svg_renderer(prop, colored_svg_data)
+        color = prop.color if prop.prop_type != PropType.Hand else None
+        prop.renderer = self.manager.cache_manager.get_renderer(svg_file, color)
+        prop.setSharedRenderer(prop.renderer)
 
     def _get_prop_svg_file(self, object: "Prop") -> str:
         prop_type_str = object.prop_type.name.lower()
@@ -46,8 +40,3 @@ class PropSvgManager:
     def _get_hand_svg_file(self, object: "Prop") -> str:
         hand_color = "left" if object.color == BLUE else "right"
         return get_images_and_data_path(f"images/hands/{hand_color}_hand.svg")
-
-    def _setup_prop_svg_renderer(self, prop: "Prop", svg_data: str) -> None:
-        prop.renderer = QSvgRenderer()
-        prop.renderer.load(svg_data.encode("utf-8"))
-        prop.setSharedRenderer(prop.renderer)
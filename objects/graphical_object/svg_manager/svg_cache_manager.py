@@ -1,4 +1,12 @@
-from typing import TYPE_CHECKING
+import glob
+import os
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+from PyQt6.QtSvg import QSvgRenderer
+
+from data.constants import BLUE, RED
+from utilities.path_helpers import get_images_and_data_path
 
 if TYPE_CHECKING:
     from objects.graphical_object.svg_manager.graphical_object_svg_manager import (
@@ -7,10 +15,53 @@ if TYPE_CHECKING:
 
 
 class SvgCacheManager:
+    """
+    LRU pool of pre-colored renderers, keyed by (svg path, color).
+
+    Items keep a reference to the renderer they were given, so evicting an
+    entry only stops it from being handed out again.
+    """
+
+    MAX_RENDERERS = 256
+
     def __init__(self, manager: "SvgManager"):
         self.manager = manager
-        self.file_path_cache = {}
-        self.svg_content_cache = {}
+        self.renderer_cache: OrderedDict[tuple[str, Optional[str]], QSvgRenderer] = (
+            OrderedDict()
+        )
+
+    def get_renderer(self, svg_path: str, color: Optional[str] = None) -> QSvgRenderer:
+        """Return the shared renderer for `svg_path`, recolored to `color` if one is given."""
+        key = (os.path.normpath(svg_path), color)
+        renderer = self.renderer_cache.get(key)
+        if renderer is not None:
+            self.renderer_cache.move_to_end(key)
+            return renderer
+
+        svg_data = self.manager.load_svg_file(svg_path)
+        if color:
+            svg_data = self.manager.color_manager.apply_color_transformations(
+                svg_data, color
+            )
+        renderer = QSvgRenderer()
+        renderer.load(svg_data.encode("utf-8"))
+
+        self.renderer_cache[key] = renderer
+        if len(self.renderer_cache) > self.MAX_RENDERERS:
+            self.renderer_cache.popitem(last=False)
+        return renderer
+
+    def warm_up_arrow_renderers(self) -> None:
+        """Build red and blue renderers for every turn-specific arrow SVG ahead of time."""
+        arrows_dir = get_images_and_data_path("images/arrows")
+        svg_files = [get_images_and_data_path("images/arrows/float.svg")]
+        for subfolder in ["from_radial", "from_nonradial"]:
+            svg_files.extend(
+                sorted(glob.glob(os.path.join(arrows_dir, "*", subfolder, "*.svg")))
+            )
+        for svg_file in svg_files[: self.MAX_RENDERERS // 2]:
+            for color in [RED, BLUE]:
+                self.get_renderer(svg_file, color)
 
-    def store_svg_data_in_cache(self, file_path: str, svg_data: str):
-        self.svg_content_cache[file_path] = svg_data
+    def clear(self) -> None:
+        self.renderer_cache.clear()
@@ -1,5 +1,7 @@
 import json
-from typing import TYPE_CHECKING, NamedTuple, Union, Literal
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple, Optional, Union, Literal
 from PyQt6.QtCore import QPointF
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
 from PyQt6.QtWidgets import QGraphicsSceneWheelEvent, QGraphicsSceneMouseEvent
@@ -41,16 +43,41 @@ class GridPoint(NamedTuple):
 
 class GridLayer:
     def __init__(self, points_data: dict[str, str]) -> None:
-        self.points: dict[str, GridPoint] = {}
+        points: dict[str, GridPoint] = {}
         for name, coords in points_data.items():
             if coords != "None":
                 x, y = map(float, coords.strip("()").split(", "))
-                self.points[name] = GridPoint(name, QPointF(x, y))
+                points[name] = GridPoint(name, QPointF(x, y))
             else:
-                self.points[name] = GridPoint(name, None)
+                points[name] = GridPoint(name, None)
+        self.points = MappingProxyType(points)
+        # Plain floats for the nearest-point search, so a drag doesn't
+        # allocate a QPointF per point per mouse move.
+        self.snap_points: tuple[tuple[float, float, GridPoint], ...] = tuple(
+            (point.coordinates.x(), point.coordinates.y(), point)
+            for point in points.values()
+            if point.coordinates is not None
+        )
+
+    def get_closest_point(self, pos: QPointF) -> Optional[GridPoint]:
+        """The point nearest to `pos` by Manhattan distance; the first one wins a tie."""
+        pos_x, pos_y = pos.x(), pos.y()
+        min_distance = float("inf")
+        closest_point = None
+        for x, y, point in self.snap_points:
+            distance = abs(pos_x - x) + abs(pos_y - y)
+            if distance < min_distance:
+                min_distance = distance
+                closest_point = point
+        return closest_point
 
 
 class GridData:
+    """
+    Grid geometry for one grid mode. Every pictograph shares the instance
+    from `get_grid_data`, so treat it as read-only.
+    """
+
     def __init__(
         self, data: dict[str, Union[str, dict[str, dict[str, str]]]], grid_mode: str
     ) -> None:
@@ -67,17 +94,20 @@ class GridData:
         self.center_point = GridPoint("center_point", QPointF(x, y))
 
     def get_point(self, layer: GridLayer, pos: QPointF) -> GridPoint:
-        min_distance = float("inf")
-        closest_point = None
+        return layer.get_closest_point(pos)
 
-        for point in layer.points.values():
-            if point.coordinates is not None:
-                distance = (pos - point.coordinates).manhattanLength()
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_point = point
 
-        return closest_point
+@lru_cache(maxsize=None)
+def _load_circle_coords() -> dict:
+    json_path = get_images_and_data_path("data/circle_coords.json")
+    with open(json_path, "r") as file:
+        return json.load(file)
+
+
+@lru_cache(maxsize=None)
+def get_grid_data(grid_mode: str) -> GridData:
+    """Grid geometry for `grid_mode`, parsed on first use and shared from then on."""
+    return GridData(_load_circle_coords(), grid_mode)
 
 
 class Grid:
@@ -98,10 +128,7 @@ class Grid:
         self.nonradial_layer.setVisible(visible)
 
     def _load_grid_data(self) -> GridData:
-        json_path = get_images_and_data_path("data/circle_coords.json")
-        with open(json_path, "r") as file:
-            data = json.load(file)
-        return GridData(data, self.grid_mode)
+        return get_grid_data(self.grid_mode)
 
     def get_closest_hand_point(self, pos: QPointF) -> tuple[str, QPointF]:
         strict = self.scene.main_widget.prop_type in strictly_placed_props
@@ -110,12 +137,12 @@ class Grid:
             if strict
             else self.grid_data.hand_points_normal
         )
-        closest_point = self.grid_data.get_point(layer, pos)
+        closest_point = layer.get_closest_point(pos)
         return closest_point.name, closest_point.coordinates
 
     def get_closest_layer2_point(self, pos: QPointF) -> tuple[str, QPointF]:
         layer = self.grid_data.layer2_points_normal
-        closest_point = self.grid_data.get_point(layer, pos)
+        closest_point = layer.get_closest_point(pos)
         return closest_point.name, closest_point.coordinates
 
     def _create_grid_items(self, pictograph: "BasePictograph"):
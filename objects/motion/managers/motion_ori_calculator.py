@@ -16,6 +16,10 @@ from data.constants import (
     CLOCKWISE,
     COUNTER_CLOCKWISE,
 )
+from main_window.main_widget.json_manager.json_ori_calculator import (
+    FLOAT_END_ORIS,
+    TURN_END_ORIS,
+)
 from objects.motion.managers.handpath_calculator import (
     HandpathCalculator,
 )
@@ -33,6 +37,20 @@ class MotionOriCalculator:
         self.hand_rot_dir_calculator = HandpathCalculator()
 
     def get_end_ori(self) -> str:
+        motion = self.motion
+        if motion.motion_type == FLOAT:
+            end_ori = FLOAT_END_ORIS.get(
+                (motion.start_ori, motion.start_loc, motion.end_loc)
+            )
+        else:
+            end_ori = TURN_END_ORIS.get(
+                (motion.motion_type, motion.turns, motion.start_ori, motion.prop_rot_dir)
+            )
+        if end_ori is not None:
+            return end_ori
+        return self.calculate_end_ori()
+
+    def calculate_end_ori(self) -> str:
         if self.motion.motion_type == FLOAT:  # Handle float case
             handpath_direction = self.hand_rot_dir_calculator.get_hand_rot_dir(
                 self.motion.start_loc, self.motion.end_loc
@@ -10,6 +10,110 @@ from Enums.MotionAttributes import Location, MotionType, PropRotDir
 if TYPE_CHECKING:
     from objects.prop.prop import Prop
 
+SHIFT_LOCATION_MAP: dict[
+    tuple[Location, PropRotDir, MotionType],
+    dict[Location, Location],
+] = {
+    ### ISO ###
+    (NORTHEAST, CLOCKWISE, PRO): {
+        NORTH: NORTHWEST,
+        SOUTH: SOUTHEAST,
+    },
+    (NORTHWEST, CLOCKWISE, PRO): {
+        EAST: NORTHEAST,
+        WEST: SOUTHWEST,
+    },
+    (SOUTHWEST, CLOCKWISE, PRO): {
+        NORTH: NORTHWEST,
+        SOUTH: SOUTHEAST,
+    },
+    (SOUTHEAST, CLOCKWISE, PRO): {
+        WEST: SOUTHWEST,
+        EAST: NORTHEAST,
+    },
+    (
+        NORTHEAST,
+        COUNTER_CLOCKWISE,
+        PRO,
+    ): {
+        WEST: NORTHWEST,
+        EAST: SOUTHEAST,
+    },
+    (
+        NORTHWEST,
+        COUNTER_CLOCKWISE,
+        PRO,
+    ): {
+        SOUTH: SOUTHWEST,
+        NORTH: NORTHEAST,
+    },
+    (
+        SOUTHWEST,
+        COUNTER_CLOCKWISE,
+        PRO,
+    ): {
+        EAST: SOUTHEAST,
+        WEST: NORTHWEST,
+    },
+    (
+        SOUTHEAST,
+        COUNTER_CLOCKWISE,
+        PRO,
+    ): {
+        NORTH: NORTHEAST,
+        SOUTH: SOUTHWEST,
+    },
+    ### ANTI ###
+    (NORTHEAST, CLOCKWISE, ANTI): {
+        EAST: SOUTHEAST,
+        WEST: NORTHWEST,
+    },
+    (NORTHWEST, CLOCKWISE, ANTI): {
+        NORTH: NORTHEAST,
+        SOUTH: SOUTHWEST,
+    },
+    (SOUTHWEST, CLOCKWISE, ANTI): {
+        EAST: SOUTHEAST,
+        WEST: NORTHWEST,
+    },
+    (SOUTHEAST, CLOCKWISE, ANTI): {
+        NORTH: NORTHEAST,
+        SOUTH: SOUTHWEST,
+    },
+    (
+        NORTHEAST,
+        COUNTER_CLOCKWISE,
+        ANTI,
+    ): {
+        NORTH: NORTHWEST,
+        SOUTH: SOUTHEAST,
+    },
+    (
+        NORTHWEST,
+        COUNTER_CLOCKWISE,
+        ANTI,
+    ): {
+        WEST: SOUTHWEST,
+        EAST: NORTHEAST,
+    },
+    (
+        SOUTHWEST,
+        COUNTER_CLOCKWISE,
+        ANTI,
+    ): {
+        SOUTH: SOUTHEAST,
+        NORTH: NORTHWEST,
+    },
+    (
+        SOUTHEAST,
+        COUNTER_CLOCKWISE,
+        ANTI,
+    ): {
+        EAST: NORTHEAST,
+        WEST: SOUTHWEST,
+    },
+}
+
 
 class PropMouseEventHandler:
     def __init__(self, prop: "Prop") -> None:
@@ -23,114 +127,10 @@ class PropMouseEventHandler:
         self, new_arrow_location: Location
     ) -> None:
         if self.p.motion.motion_type in [PRO, ANTI]:
-            shift_location_map: dict[
-                tuple[Location, PropRotDir, MotionType],
-                dict[Location, Location],
-            ] = {
-                ### ISO ###
-                (NORTHEAST, CLOCKWISE, PRO): {
-                    NORTH: NORTHWEST,
-                    SOUTH: SOUTHEAST,
-                },
-                (NORTHWEST, CLOCKWISE, PRO): {
-                    EAST: NORTHEAST,
-                    WEST: SOUTHWEST,
-                },
-                (SOUTHWEST, CLOCKWISE, PRO): {
-                    NORTH: NORTHWEST,
-                    SOUTH: SOUTHEAST,
-                },
-                (SOUTHEAST, CLOCKWISE, PRO): {
-                    WEST: SOUTHWEST,
-                    EAST: NORTHEAST,
-                },
-                (
-                    NORTHEAST,
-                    COUNTER_CLOCKWISE,
-                    PRO,
-                ): {
-                    WEST: NORTHWEST,
-                    EAST: SOUTHEAST,
-                },
-                (
-                    NORTHWEST,
-                    COUNTER_CLOCKWISE,
-                    PRO,
-                ): {
-                    SOUTH: SOUTHWEST,
-                    NORTH: NORTHEAST,
-                },
-                (
-                    SOUTHWEST,
-                    COUNTER_CLOCKWISE,
-                    PRO,
-                ): {
-                    EAST: SOUTHEAST,
-                    WEST: NORTHWEST,
-                },
-                (
-                    SOUTHEAST,
-                    COUNTER_CLOCKWISE,
-                    PRO,
-                ): {
-                    NORTH: NORTHEAST,
-                    SOUTH: SOUTHWEST,
-                },
-                ### ANTI ###
-                (NORTHEAST, CLOCKWISE, ANTI): {
-                    EAST: SOUTHEAST,
-                    WEST: NORTHWEST,
-                },
-                (NORTHWEST, CLOCKWISE, ANTI): {
-                    NORTH: NORTHEAST,
-                    SOUTH: SOUTHWEST,
-                },
-                (SOUTHWEST, CLOCKWISE, ANTI): {
-                    EAST: SOUTHEAST,
-                    WEST: NORTHWEST,
-                },
-                (SOUTHEAST, CLOCKWISE, ANTI): {
-                    NORTH: NORTHEAST,
-                    SOUTH: SOUTHWEST,
-                },
-                (
-                    NORTHEAST,
-                    COUNTER_CLOCKWISE,
-                    ANTI,
-                ): {
-                    NORTH: NORTHWEST,
-                    SOUTH: SOUTHEAST,
-                },
-                (
-                    NORTHWEST,
-                    COUNTER_CLOCKWISE,
-                    ANTI,
-                ): {
-                    WEST: SOUTHWEST,
-                    EAST: NORTHEAST,
-                },
-                (
-                    SOUTHWEST,
-                    COUNTER_CLOCKWISE,
-                    ANTI,
-                ): {
-                    SOUTH: SOUTHEAST,
-                    NORTH: NORTHWEST,
-                },
-                (
-                    SOUTHEAST,
-                    COUNTER_CLOCKWISE,
-                    ANTI,
-                ): {
-                    EAST: NORTHEAST,
-                    WEST: SOUTHWEST,
-                },
-            }
-
             current_arrow_location = self.p.motion.arrow.loc
             rot_dir = self.p.motion.prop_rot_dir
             motion_type = self.p.motion.motion_type
-            new_arrow_location = shift_location_map.get(
+            new_arrow_location = SHIFT_LOCATION_MAP.get(
                 (current_arrow_location, rot_dir, motion_type), {}
             ).get(new_arrow_location)
 
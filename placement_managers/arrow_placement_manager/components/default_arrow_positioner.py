@@ -28,39 +28,58 @@ import codecs
 
 
 class DefaultArrowPositioner:
+    # Parsed default placement files, shared by every pictograph and keyed by grid mode.
+    _placements_by_grid_mode: dict[str, dict[str, dict[str, dict[str, list[int]]]]] = {}
+
+    diamond_placements_files = {
+        PRO: "default_diamond_pro_placements.json",
+        ANTI: "default_diamond_anti_placements.json",
+        FLOAT: "default_diamond_float_placements.json",
+        DASH: "default_diamond_dash_placements.json",
+        STATIC: "default_diamond_static_placements.json",
+    }
+    box_placement_files = {
+        PRO: "default_box_pro_placements.json",
+        ANTI: "default_box_anti_placements.json",
+        FLOAT: "default_box_float_placements.json",
+        DASH: "default_box_dash_placements.json",
+        STATIC: "default_box_static_placements.json",
+    }
+
     def __init__(self, placement_manager: "ArrowPlacementManager") -> None:
         self.placement_manager = placement_manager
         self.pictograph = placement_manager.pictograph
-        self.diamond_placements_files = {
-            PRO: "default_diamond_pro_placements.json",
-            ANTI: "default_diamond_anti_placements.json",
-            FLOAT: "default_diamond_float_placements.json",
-            DASH: "default_diamond_dash_placements.json",
-            STATIC: "default_diamond_static_placements.json",
-        }
-        self.box_placement_files = {
-            PRO: "default_box_pro_placements.json",
-            ANTI: "default_box_anti_placements.json",
-            FLOAT: "default_box_float_placements.json",
-            DASH: "default_box_dash_placements.json",
-            STATIC: "default_box_static_placements.json",
-        }
-        self._load_all_default_placements()
-
-    def _load_all_default_placements(self):
-        self.default_placements = {}
+
+    @classmethod
+    def clear_placement_cache(cls) -> None:
+        """Forget the parsed files so the next lookup re-reads them from disk."""
+        cls._placements_by_grid_mode.clear()
+
+    @property
+    def default_placements(self) -> dict[str, dict[str, dict[str, list[int]]]]:
+        grid_mode = (
+            self.placement_manager.pictograph.main_widget.settings_manager.global_settings.get_grid_mode()
+        )
+        placements = self._placements_by_grid_mode.get(grid_mode)
+        if placements is None:
+            placements = self._load_all_default_placements(grid_mode)
+            self._placements_by_grid_mode[grid_mode] = placements
+        return placements
+
+    def _load_all_default_placements(
+        self, grid_mode: str
+    ) -> dict[str, dict[str, dict[str, list[int]]]]:
+        default_placements = {}
         motion_types = [PRO, ANTI, FLOAT, DASH, STATIC]
         for motion_type in motion_types:
-            self.default_placements[motion_type] = (
-                self._load_default_placements_for_motion_type(motion_type)
+            default_placements[motion_type] = (
+                self._load_default_placements_for_motion_type(motion_type, grid_mode)
             )
+        return default_placements
 
     def _load_default_placements_for_motion_type(
-        self, motion_type: str
+        self, motion_type: str, grid_mode: str
     ) -> dict[str, dict[str, list[int]]]:
-        grid_mode = (
-            self.placement_manager.pictograph.main_widget.settings_manager.global_settings.get_grid_mode()
-        )
         if grid_mode == DIAMOND:
             json_filename = self.diamond_placements_files.get(motion_type)
             json_path = get_images_and_data_path(
@@ -75,8 +94,6 @@ class DefaultArrowPositioner:
             return json.load(file)
 
     def _get_adjustment_key(self, arrow: Arrow, default_placements: dict) -> str:
-        self._load_all_default_placements()
-
         has_beta_props = arrow.pictograph.check.ends_with_beta()
         has_alpha_props = arrow.pictograph.check.ends_with_alpha()
         has_gamma_props = arrow.pictograph.check.ends_with_gamma()
@@ -140,10 +157,7 @@ class DefaultArrowPositioner:
             return arrow.motion.motion_type
 
     def get_default_adjustment(self, arrow: Arrow) -> tuple[int, int]:
-        if arrow.motion.motion_type in self.default_placements:
-            default_placements = self.default_placements[arrow.motion.motion_type]
-        else:
-            default_placements = {}
+        default_placements = self.default_placements.get(arrow.motion.motion_type, {})
 
         adjustment_key = self._get_adjustment_key(arrow, default_placements)
 
@@ -0,0 +1,340 @@
+"""
+Find dictionary sequences that are the same sequence under rotation,
+mirroring or color swap, and optionally merge them.
+
+Every thumbnail gets a canonical hash: the sequence is rewritten under each of
+the 16 symmetries (4 rotations x mirror x color swap) and the smallest digest
+wins, so equivalent sequences land on the same hash. Hashes are computed on a
+process pool and saved to a progress file as they come in; an interrupted run
+picks up where it stopped, and files that haven't changed since are skipped.
+
+Example:
+    python symmetry_dedup.py --report duplicates.json
+    python symmetry_dedup.py --structural --merge
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional
+
+from data.constants import CLOCK, CLOCKWISE, COUNTER, COUNTER_CLOCKWISE
+from data.position_maps import quarter_position_map_cw, vertical_mirror_position_map
+from data.positions_map import positions_map
+from main_window.main_widget.dictionary_widget.variation_number_fixer import (
+    VariationNumberFixer,
+)
+from main_window.main_widget.top_builder_widget.sequence_widget.add_to_dictionary_manager.structural_variation_checker import (
+    StructuralVariationChecker,
+)
+from utilities.path_helpers import get_images_and_data_path
+from utilities.png_text_chunks import read_text_chunk
+
+CHUNK_SIZE = 100
+PROGRESS_VERSION = 1
+
+LOCATION_KEYS = ("start_loc", "end_loc")
+ROT_DIR_KEYS = ("prop_rot_dir", "prefloat_prop_rot_dir")
+ORI_KEYS = ("start_ori", "end_ori")
+FLIPPED_ROT_DIRS = {CLOCKWISE: COUNTER_CLOCKWISE, COUNTER_CLOCKWISE: CLOCKWISE}
+FLIPPED_ORIS = {CLOCK: COUNTER, COUNTER: CLOCK}
+
+
+def _location_map(position_map: dict[str, str]) -> dict[str, str]:
+    """
+    Turn a position map into a hand location map. Beta positions put both
+    hands on the same spot, so they spell out where each location goes.
+    """
+    locations = {position: blue_loc for (blue_loc, _), position in positions_map.items()}
+    return {
+        locations[position]: locations[mapped]
+        for position, mapped in position_map.items()
+        if position.startswith("beta")
+    }
+
+
+QUARTER_ROTATION_LOCATIONS = _location_map(quarter_position_map_cw)
+MIRROR_LOCATIONS = _location_map(vertical_mirror_position_map)
+
+
+### CANONICAL FORM ###
+
+
+def _transform_attributes(
+    attributes: dict, rotations: int, mirrored: bool, ignored_keys: tuple
+) -> dict:
+    transformed = {}
+    for key, value in attributes.items():
+        if key in ignored_keys:
+            continue
+        if key in LOCATION_KEYS:
+            for _ in range(rotations):
+                value = QUARTER_ROTATION_LOCATIONS.get(value, value)
+            if mirrored:
+                value = MIRROR_LOCATIONS.get(value, value)
+        elif mirrored and key in ROT_DIR_KEYS:
+            value = FLIPPED_ROT_DIRS.get(value, value)
+        elif mirrored and key in ORI_KEYS:
+            value = FLIPPED_ORIS.get(value, value)
+        transformed[key] = value
+    return transformed
+
+
+def _transform_sequence(
+    beats: list[dict],
+    rotations: int,
+    mirrored: bool,
+    color_swapped: bool,
+    ignored_keys: tuple,
+) -> list:
+    colors = ["blue_attributes", "red_attributes"]
+    if color_swapped:
+        colors.reverse()
+    return [
+        [
+            _transform_attributes(beat[color], rotations, mirrored, ignored_keys)
+            if color in beat
+            else None
+            for color in colors
+        ]
+        for beat in beats
+    ]
+
+
+def get_canonical_hash(sequence: list[dict], structural: bool = False) -> str:
+    """
+    Digest shared by every rotation, mirror image and color swap of `sequence`.
+
+    Positions and letters follow from the hand attributes, so only those are
+    compared. With `structural`, turns and orientations are left out too, the
+    same way StructuralVariationChecker does.
+    """
+    ignored_keys = tuple(StructuralVariationChecker.IGNORED_KEYS) if structural else ()
+    beats = [beat for beat in sequence[1:] if "is_placeholder" not in beat]
+    digests = []
+    for rotations in range(4):
+        for mirrored in (False, True):
+            for color_swapped in (False, True):
+                canonical = _transform_sequence(
+                    beats, rotations, mirrored, color_swapped, ignored_keys
+                )
+                digests.append(
+                    hashlib.sha1(
+                        json.dumps(canonical, sort_keys=True).encode("utf-8")
+                    ).hexdigest()
+                )
+    return min(digests)
+
+
+def _hash_chunk(file_paths: list[str], structural: bool) -> list[tuple[str, Optional[str]]]:
+    """Worker entry point: canonical hash per file, None when it has no sequence."""
+    results = []
+    for file_path in file_paths:
+        canonical_hash = None
+        try:
+            metadata = read_text_chunk(file_path, "metadata")
+            sequence = json.loads(metadata).get("sequence") if metadata else None
+            if sequence:
+                canonical_hash = get_canonical_hash(sequence, structural)
+        except (OSError, ValueError):
+            pass
+        results.append((file_path, canonical_hash))
+    return results
+
+
+### PROGRESS ###
+
+
+def load_progress(progress_path: str, structural: bool) -> dict[str, list]:
+    """Return path -> [mtime_ns, size, canonical_hash] saved by an earlier run."""
+    try:
+        with open(progress_path, "r", encoding="utf-8") as f:
+            progress = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if (
+        progress.get("version") != PROGRESS_VERSION
+        or progress.get("structural") != structural
+    ):
+        return {}
+    return progress.get("entries", {})
+
+
+def save_progress(progress_path: str, structural: bool, entries: dict) -> None:
+    tmp_path = f"{progress_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"version": PROGRESS_VERSION, "structural": structural, "entries": entries},
+            f,
+        )
+    os.replace(tmp_path, progress_path)
+
+
+### SCANNING ###
+
+
+def list_thumbnails(dictionary_dir: str) -> dict[str, tuple[int, int]]:
+    stats = {}
+    for root, dirs, files in os.walk(dictionary_dir):
+        dirs[:] = [d for d in dirs if "__pycache__" not in d]
+        for filename in files:
+            if filename.lower().endswith(".png"):
+                file_path = os.path.join(root, filename)
+                stat = os.stat(file_path)
+                stats[file_path] = (stat.st_mtime_ns, stat.st_size)
+    return stats
+
+
+def hash_dictionary(
+    dictionary_dir: str, progress_path: str, structural: bool, workers: int
+) -> dict[str, list]:
+    """Bring the progress file up to date with the dictionary and return its entries."""
+    stats = list_thumbnails(dictionary_dir)
+    saved = load_progress(progress_path, structural)
+    entries = {
+        path: entry
+        for path, entry in saved.items()
+        if path in stats and tuple(entry[:2]) == stats[path]
+    }
+    pending = sorted(path for path in stats if path not in entries)
+    print(f"{len(entries)} thumbnails already hashed, {len(pending)} to go")
+    if not pending:
+        save_progress(progress_path, structural, entries)
+        return entries
+
+    chunks = [
+        pending[start : start + CHUNK_SIZE] for start in range(0, len(pending), CHUNK_SIZE)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_hash_chunk, chunk, structural) for chunk in chunks]
+        for done, future in enumerate(as_completed(futures), start=1):
+            for file_path, canonical_hash in future.result():
+                entries[file_path] = [*stats[file_path], canonical_hash]
+            save_progress(progress_path, structural, entries)
+            print(f"Hashed {done}/{len(chunks)} chunks", end="\r")
+    print()
+    return entries
+
+
+def find_equivalent_groups(entries: dict[str, list]) -> list[list[str]]:
+    """Groups of two or more thumbnails with the same canonical hash, oldest first."""
+    by_hash: dict[str, list[str]] = {}
+    for file_path, (_, _, canonical_hash) in entries.items():
+        if canonical_hash:
+            by_hash.setdefault(canonical_hash, []).append(file_path)
+    return sorted(
+        (
+            sorted(paths, key=lambda path: (entries[path][0], path))
+            for paths in by_hash.values()
+            if len(paths) > 1
+        ),
+        key=lambda paths: paths[0],
+    )
+
+
+### MERGING ###
+
+
+def merge_groups(
+    groups: list[list[str]], dictionary_dir: str, duplicates_dir: str
+) -> int:
+    """
+    Keep the oldest thumbnail of each group and move the rest into
+    `duplicates_dir`, keeping their paths relative to the dictionary so
+    nothing is lost. Version numbers are closed up afterwards in the words
+    that lost a variation.
+    """
+    moved = 0
+    touched_words = set()
+    for group in groups:
+        for file_path in group[1:]:
+            relative_path = os.path.relpath(file_path, dictionary_dir)
+            target_path = os.path.join(duplicates_dir, relative_path)
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            shutil.move(file_path, target_path)
+            moved += 1
+            touched_words.add(_get_word(file_path, dictionary_dir))
+            _remove_empty_dirs(os.path.dirname(file_path), dictionary_dir)
+    variation_number_fixer = VariationNumberFixer()
+    for word in sorted(touched_words):
+        word_folder = os.path.join(dictionary_dir, word)
+        if os.path.isdir(word_folder):
+            variation_number_fixer.ensure_sequential_versions(word_folder)
+    return moved
+
+
+def _remove_empty_dirs(path: str, stop_dir: str) -> None:
+    stop_dir = os.path.normpath(stop_dir)
+    path = os.path.normpath(path)
+    while path != stop_dir and os.path.isdir(path) and not os.listdir(path):
+        os.rmdir(path)
+        path = os.path.dirname(path)
+
+
+def _get_word(file_path: str, dictionary_dir: str) -> str:
+    return os.path.relpath(file_path, dictionary_dir).split(os.sep, 1)[0]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Find dictionary sequences that are equivalent under "
+        "rotation, mirroring and color swap."
+    )
+    parser.add_argument(
+        "--dictionary", default=get_images_and_data_path("dictionary")
+    )
+    parser.add_argument(
+        "--structural",
+        action="store_true",
+        help="Ignore turns and orientations when comparing sequences.",
+    )
+    parser.add_argument("--progress", default="symmetry_dedup_progress.json")
+    parser.add_argument(
+        "--report", default=None, help="Write the equivalent groups to this JSON file."
+    )
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="Keep the oldest sequence of each group and move the rest out.",
+    )
+    parser.add_argument("--duplicates-dir", default="dictionary_duplicates")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    entries = hash_dictionary(
+        args.dictionary, args.progress, args.structural, args.workers
+    )
+    groups = find_equivalent_groups(entries)
+
+    for group in groups:
+        words = [_get_word(path, args.dictionary) for path in group]
+        print(f"{words[0]} <- {', '.join(words[1:])}")
+        for file_path in group:
+            print(f"    {os.path.relpath(file_path, args.dictionary)}")
+    print(
+        f"Found {len(groups)} groups covering "
+        f"{sum(len(group) for group in groups)} equivalent sequences"
+    )
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as report:
+            json.dump(groups, report, indent=2, ensure_ascii=False)
+
+    if args.merge and groups:
+        moved = merge_groups(groups, args.dictionary, args.duplicates_dir)
+        print(f"Moved {moved} duplicates to {args.duplicates_dir}")
+        # Moved files are gone and renumbered ones get rehashed on the next run.
+        for group in groups:
+            for file_path in group[1:]:
+                entries.pop(file_path, None)
+        save_progress(args.progress, args.structural, entries)
+
+
+if __name__ == "__main__":
+    main()
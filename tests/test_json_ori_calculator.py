@@ -0,0 +1,133 @@
+import random
+from itertools import product
+from types import SimpleNamespace
+
+import pytest
+
+from data.constants import (
+    ANTI,
+    BLUE,
+    CLOCK,
+    CLOCKWISE,
+    COUNTER,
+    COUNTER_CLOCKWISE,
+    DASH,
+    EAST,
+    FLOAT,
+    IN,
+    NO_ROT,
+    NORTH,
+    NORTHEAST,
+    NORTHWEST,
+    OUT,
+    PRO,
+    RED,
+    SOUTH,
+    SOUTHEAST,
+    SOUTHWEST,
+    STATIC,
+    WEST,
+)
+from main_window.main_widget.json_manager.json_ori_calculator import (
+    FLOAT_END_ORIS,
+    TURN_END_ORIS,
+    JsonOriCalculator,
+)
+from objects.motion.managers.motion_ori_calculator import MotionOriCalculator
+
+MOTION_TYPES = (PRO, ANTI, STATIC, DASH, FLOAT)
+TURNS = (0, 0.5, 1, 1.5, 2, 2.5, 3, "fl")
+ORIENTATIONS = (IN, OUT, CLOCK, COUNTER)
+PROP_ROT_DIRS = (CLOCKWISE, COUNTER_CLOCKWISE, NO_ROT)
+LOCATIONS = (NORTH, EAST, SOUTH, WEST, NORTHEAST, SOUTHEAST, SOUTHWEST, NORTHWEST)
+
+DOMAIN = list(
+    product(MOTION_TYPES, TURNS, ORIENTATIONS, PROP_ROT_DIRS, LOCATIONS, LOCATIONS)
+)
+
+
+def _attributes(motion_type, turns, start_ori, prop_rot_dir, start_loc, end_loc):
+    return {
+        "motion_type": motion_type,
+        "turns": turns,
+        "start_ori": start_ori,
+        "prop_rot_dir": prop_rot_dir,
+        "start_loc": start_loc,
+        "end_loc": end_loc,
+    }
+
+
+@pytest.fixture(scope="module")
+def calculator() -> JsonOriCalculator:
+    return JsonOriCalculator()
+
+
+def test_tables_are_populated():
+    assert TURN_END_ORIS
+    assert FLOAT_END_ORIS
+
+
+def test_json_table_matches_rules_over_full_domain(calculator):
+    for values in DOMAIN:
+        pictograph_dict = {f"{BLUE}_attributes": _attributes(*values)}
+        assert calculator.calculate_end_orientation(
+            pictograph_dict, BLUE
+        ) == calculator.calculate_end_orientation_uncached(pictograph_dict, BLUE), values
+
+
+def test_motion_table_matches_rules_over_full_domain(calculator):
+    for values in DOMAIN:
+        motion = SimpleNamespace(**_attributes(*values))
+        motion_calculator = MotionOriCalculator(motion)
+        end_ori = motion_calculator.get_end_ori()
+        assert end_ori == motion_calculator.calculate_end_ori(), values
+        # The motion calculator leaves some inputs undefined (e.g. "fl" turns
+        # on a non-float); wherever it answers, it agrees with the JSON one.
+        if end_ori is not None:
+            pictograph_dict = {f"{BLUE}_attributes": _attributes(*values)}
+            assert end_ori == calculator.calculate_end_orientation_uncached(
+                pictograph_dict, BLUE
+            ), values
+
+
+def test_orient_sequence_matches_per_beat_orientation(calculator):
+    rng = random.Random(0)
+    for _ in range(200):
+        sequence = [
+            {"word": ""},
+            {
+                f"{color}_attributes": {"end_ori": rng.choice(ORIENTATIONS)}
+                for color in (RED, BLUE)
+            },
+        ]
+        for _ in range(rng.randint(1, 16)):
+            sequence.append(
+                {
+                    f"{color}_attributes": _attributes(*rng.choice(DOMAIN))
+                    for color in (RED, BLUE)
+                }
+            )
+            if rng.random() < 0.2:
+                sequence.append({"is_placeholder": True})
+
+        expected = [
+            {
+                key: dict(value) if isinstance(value, dict) else value
+                for key, value in entry.items()
+            }
+            for entry in sequence
+        ]
+        previous = expected[1]
+        for entry in expected[2:]:
+            if entry.get("is_placeholder", False):
+                continue
+            for color in (RED, BLUE):
+                attributes = entry[f"{color}_attributes"]
+                attributes["start_ori"] = previous[f"{color}_attributes"]["end_ori"]
+                attributes["end_ori"] = calculator.calculate_end_orientation_uncached(
+                    entry, color
+                )
+            previous = entry
+
+        calculator.orient_sequence(sequence)
+        assert sequence == expected
@@ -0,0 +1,143 @@
+"""
+Read and rewrite PNG text chunks without decoding any pixel data.
+
+Dictionary thumbnails keep their sequence as JSON in a `metadata` text chunk.
+Reading it only walks the chunk headers up to the first IDAT, and rewriting it
+copies the image data byte for byte, so a large image is never decompressed or
+re-encoded.
+"""
+
+import os
+import shutil
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+TEXT_CHUNK_TYPES = (b"tEXt", b"zTXt", b"iTXt")
+
+
+def read_text_chunks(file_path: str) -> dict[str, str]:
+    """Return every text chunk that precedes the image data, keyed by keyword."""
+    texts = {}
+    with open(file_path, "rb") as f:
+        _check_signature(f)
+        for chunk_type, length in _iter_chunk_headers(f):
+            if chunk_type == b"IDAT" or chunk_type == b"IEND":
+                break
+            if chunk_type in TEXT_CHUNK_TYPES:
+                data = f.read(length)
+                f.seek(4, os.SEEK_CUR)  # CRC
+                keyword, text = _decode_text_chunk(chunk_type, data)
+                texts[keyword] = text
+            else:
+                f.seek(length + 4, os.SEEK_CUR)
+    return texts
+
+
+def read_text_chunk(file_path: str, keyword: str) -> Optional[str]:
+    return read_text_chunks(file_path).get(keyword)
+
+
+def read_text_chunk_bulk(
+    file_paths: Iterable[str], keyword: str, max_workers: Optional[int] = None
+) -> dict[str, Optional[str]]:
+    """
+    Read one text chunk from many files concurrently.
+
+    Files that can't be read map to None instead of raising.
+    """
+
+    def read(file_path: str) -> Optional[str]:
+        try:
+            return read_text_chunk(file_path, keyword)
+        except (OSError, ValueError):
+            return None
+
+    file_paths = list(file_paths)
+    if not file_paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(file_paths, executor.map(read, file_paths)))
+
+
+def write_text_chunk(file_path: str, keyword: str, text: str) -> None:
+    """
+    Replace (or add) the text chunk for `keyword`, leaving every other chunk
+    untouched. The file is rewritten through a temporary copy and swapped in
+    atomically.
+    """
+    new_chunk = _build_text_chunk(keyword, text)
+    tmp_path = f"{file_path}.tmp"
+    try:
+        with open(file_path, "rb") as src, open(tmp_path, "wb") as dst:
+            _check_signature(src)
+            dst.write(PNG_SIGNATURE)
+            for chunk_type, length in _iter_chunk_headers(src):
+                if chunk_type == b"IDAT" or chunk_type == b"IEND":
+                    dst.write(new_chunk)
+                    dst.write(struct.pack(">I4s", length, chunk_type))
+                    shutil.copyfileobj(src, dst)
+                    break
+                body = src.read(length + 4)  # data + CRC
+                if chunk_type in TEXT_CHUNK_TYPES and _read_keyword(body) == keyword:
+                    continue
+                dst.write(struct.pack(">I4s", length, chunk_type))
+                dst.write(body)
+            else:
+                raise ValueError(f"{file_path} has no image data")
+        os.replace(tmp_path, file_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+### HELPERS ###
+
+
+def _check_signature(f: BinaryIO) -> None:
+    if f.read(len(PNG_SIGNATURE)) != PNG_SIGNATURE:
+        raise ValueError(f"{getattr(f, 'name', 'file')} is not a PNG")
+
+
+def _iter_chunk_headers(f: BinaryIO) -> Iterator[tuple[bytes, int]]:
+    """Yield (type, length) with `f` positioned at the start of each chunk's data."""
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            return
+        length, chunk_type = struct.unpack(">I4s", header)
+        yield chunk_type, length
+
+
+def _read_keyword(data: bytes) -> str:
+    return data.split(b"\x00", 1)[0].decode("latin-1")
+
+
+def _decode_text_chunk(chunk_type: bytes, data: bytes) -> tuple[str, str]:
+    keyword, _, rest = data.partition(b"\x00")
+    if chunk_type == b"tEXt":
+        value = rest
+    elif chunk_type == b"zTXt":
+        value = zlib.decompress(rest[1:])  # skip the compression method byte
+    else:
+        is_compressed = rest[0]
+        # compression flag, method, language tag, translated keyword
+        rest = rest[2:].split(b"\x00", 2)[2]
+        value = zlib.decompress(rest) if is_compressed else rest
+    return keyword.decode("latin-1"), _decode_text(value)
+
+
+def _decode_text(value: bytes) -> str:
+    try:
+        return value.decode("utf-8")
+    except UnicodeDecodeError:
+        return value.decode("latin-1")
+
+
+def _build_text_chunk(keyword: str, text: str) -> bytes:
+    data = keyword.encode("latin-1") + b"\x00" + text.encode("utf-8")
+    chunk_type = b"tEXt"
+    crc = zlib.crc32(chunk_type + data) & 0xFFFFFFFF
+    return struct.pack(">I4s", len(data), chunk_type) + data + struct.pack(">I", crc)